@@ -1,15 +1,24 @@
 """Command-line interface for dev-start."""
 import click
+import importlib
 import os
+import random
 import stat
 import time
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, List, Optional
 
 from .constants import (
     get_base_dir,
+    DEFAULT_MAX_WORKERS,
+    MAX_CLONES_PER_HOST,
     MAX_RMTREE_RETRIES,
-    RETRY_DELAY_SECONDS,
+    RETRY_BASE_DELAY_SECONDS,
+    RETRY_MAX_DELAY_SECONDS,
+    RMTREE_WORKERS,
 )
 from .exceptions import (
     DevStartError,
@@ -18,16 +27,15 @@ from .exceptions import (
     UnknownTechnologyError,
     InstallationError,
     ConfigurationError,
+    OperationCancelledError,
     RollbackError,
 )
 from .logger import get_logger
-from .proxy_manager import ProxyManager
+from .proxy_manager import ProxyManager, create_session
 from .repo_manager import RepositoryManager
 from .detector import TechnologyDetector, Technology
-from .installers.git_installer import GitInstaller
-from .installers.java_installer import JavaInstaller
-from .installers.python_installer import PythonInstaller
-from .installers.nodejs_installer import NodeJSInstaller
+from .detect_cache import DetectionCache
+from .git_check_cache import GitCheckCache
 
 logger = get_logger(__name__)
 
@@ -35,14 +43,37 @@ logger = get_logger(__name__)
 class DevStartCLI:
     """Main CLI application."""
 
-    def __init__(self):
-        self.proxy_manager = ProxyManager()
-        self.repo_manager = RepositoryManager(self.proxy_manager)
+    # Installers are imported on demand so only the one needed is loaded
+    INSTALLERS = {
+        Technology.JAVA_SPRINGBOOT: ('.installers.java_installer', 'JavaInstaller'),
+        Technology.JAVA_MAVEN: ('.installers.java_installer', 'JavaInstaller'),
+        Technology.JAVA_GRADLE: ('.installers.java_installer', 'JavaInstaller'),
+        Technology.PYTHON: ('.installers.python_installer', 'PythonInstaller'),
+        Technology.NODEJS: ('.installers.nodejs_installer', 'NodeJSInstaller'),
+    }
+
+    def __init__(self, full_history: bool = False, per_host_workers: int = MAX_CLONES_PER_HOST,
+                 cancel_event: Optional[threading.Event] = None):
+        # One pooled session for every download, so repeat hosts skip the TLS handshake
+        self.session = create_session()
+        self.proxy_manager = ProxyManager(session=self.session)
+        self.repo_manager = RepositoryManager(self.proxy_manager, per_host_limit=per_host_workers)
         self.detector = TechnologyDetector()
+        self.detect_cache = DetectionCache()
+        self.detect_cache.load()
+        self.git_check_cache = GitCheckCache()
         self.base_dir = get_base_dir()
         self.base_dir.mkdir(exist_ok=True)
         self.git_installer = None
+        self.full_history = full_history
         self._rollback_path = None  # Track path for rollback
+        # Repositories may be processed concurrently: serialize user prompts,
+        # and installs per installer so different technologies download in parallel
+        self._prompt_lock = threading.Lock()
+        self._install_locks = {ref: threading.Lock() for ref in set(self.INSTALLERS.values())}
+        self._installed_cache: Dict[Technology, bool] = {}
+        # Set by main on Ctrl-C; workers stop at the next step boundary
+        self.cancel_event = cancel_event or threading.Event()
 
     def setup_proxy(self, http_proxy: str = None, https_proxy: str = None) -> None:
         """Configure proxy settings."""
@@ -64,17 +95,28 @@ class DevStartCLI:
         """Safely remove directory tree with retry logic for locked files."""
         for attempt in range(max_retries):
             try:
-                if os.path.exists(path):
-                    shutil.rmtree(path, onerror=self.remove_readonly)
-                    logger.success("Removed existing directory")
-                    return True
-                return True  # Directory doesn't exist, that's fine
+                # One directory listing both checks existence and sizes the work
+                try:
+                    with os.scandir(path) as it:
+                        entries = list(it)
+                except FileNotFoundError:
+                    return True  # Directory doesn't exist, that's fine
+
+                if entries:
+                    self._parallel_rmtree(path, entries)
+                else:
+                    os.rmdir(path)
+                logger.success("Removed existing directory")
+                return True
             except PermissionError as e:
                 if attempt < max_retries - 1:
                     logger.warning(
                         f"Attempt {attempt + 1}/{max_retries}: Directory is locked, retrying..."
                     )
-                    time.sleep(RETRY_DELAY_SECONDS)
+                    # Exponential backoff with jitter: locks from scanners
+                    # usually clear quickly, persistent ones get more time
+                    delay = RETRY_BASE_DELAY_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5)
+                    time.sleep(min(delay, RETRY_MAX_DELAY_SECONDS))
                 else:
                     logger.error(f"Failed to remove directory after {max_retries} attempts")
                     logger.info(f"Please close any programs using files in: {path}")
@@ -85,6 +127,22 @@ class DevStartCLI:
                 return False
         return False
 
+    def _parallel_rmtree(self, path: str, entries: List[os.DirEntry]) -> None:
+        """Remove a directory tree, deleting top-level subdirectories in parallel."""
+        subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+
+        # Large trees (node_modules, .git/objects) are split across threads
+        if len(subdirs) > 1:
+            workers = min(RMTREE_WORKERS, len(subdirs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(
+                    lambda subdir: shutil.rmtree(subdir, onerror=self.remove_readonly),
+                    subdirs
+                ))
+
+        # Remove remaining files and the directory itself
+        shutil.rmtree(path, onerror=self.remove_readonly)
+
     def _rollback(self, repo_path: Path) -> None:
         """Rollback a partial installation by removing the cloned repository."""
         if repo_path and repo_path.exists():
@@ -96,10 +154,24 @@ class DevStartCLI:
                 logger.error(f"Rollback failed", details=str(e))
                 raise RollbackError(str(e))
 
-    def ensure_git_installed(self) -> bool:
-        """Ensure Git is installed before processing repositories."""
+    def ensure_git_installed(self, force_check: bool = False) -> bool:
+        """
+        Ensure Git is installed before processing repositories.
+
+        Args:
+            force_check: Ignore a cached successful check and query Git again
+
+        Returns:
+            True if Git is installed and ready to use
+        """
         logger.section("Git Installation Check")
 
+        if not force_check and self.git_check_cache.is_valid():
+            logger.success("Git is installed (cached check)")
+            return True
+
+        from .installers.git_installer import GitInstaller
+
         # Create Git installer instance
         self.git_installer = GitInstaller(self.base_dir, self.proxy_manager)
 
@@ -108,7 +180,9 @@ class DevStartCLI:
             logger.success(f"Git is installed (version {version})")
 
             # Check if Git needs configuration
-            if not self.git_installer._is_git_configured():
+            if self.git_installer._is_git_configured():
+                self.git_check_cache.save(version)
+            else:
                 logger.warning("Git is not configured")
                 self._configure_git()
 
@@ -158,6 +232,11 @@ class DevStartCLI:
         else:
             logger.warning("Git configuration had issues, but continuing...")
 
+    def _check_cancelled(self) -> None:
+        """Raise OperationCancelledError once the run has been cancelled."""
+        if self.cancel_event.is_set():
+            raise OperationCancelledError()
+
     def process_repository(self, repo_url: str) -> bool:
         """
         Process a single repository with rollback support.
@@ -171,37 +250,58 @@ class DevStartCLI:
         logger.section(f"Processing: {repo_url}")
 
         repo_path = None
+        # Only a directory this run cloned into may be rolled back; an existing
+        # clone (reused, or not yet confirmed for overwrite) belongs to the user
+        created = False
         try:
             # Clone repository
             repo_name = self.repo_manager.get_repo_name(repo_url)
             repo_path = self.base_dir / repo_name
 
-            if repo_path.exists():
-                logger.warning(f"Repository already exists at: {repo_path}")
-                if not click.confirm("Do you want to overwrite it?"):
-                    return False
-                if not self.safe_rmtree(str(repo_path)):
-                    logger.error("Failed to remove existing repository (directory may be locked)")
-                    return False
-
-            # Validate and clone
+            # Validate URL
             try:
                 self.repo_manager.validate_repo_url(repo_url)
             except InvalidURLError as e:
                 logger.error(str(e))
                 return False
 
-            if not self.repo_manager.clone_repository(repo_url, repo_path):
-                logger.error("Failed to clone repository")
-                return False
+            clone_depth = None if self.full_history else 1
+            reused = False
+
+            if repo_path.exists():
+                # Reuse a previous clone of the same repository when possible
+                if self.repo_manager.is_same_remote(repo_path, repo_url):
+                    reused = self.repo_manager.update_repository(repo_path, depth=clone_depth)
+
+                if not reused:
+                    with self._prompt_lock:
+                        self._check_cancelled()
+                        logger.warning(f"Repository already exists at: {repo_path}")
+                        overwrite = click.confirm("Do you want to overwrite it?")
+                    if not overwrite:
+                        return False
+                    if not self.safe_rmtree(str(repo_path)):
+                        logger.error("Failed to remove existing repository (directory may be locked)")
+                        return False
+
+            if not reused:
+                self._check_cancelled()
+                created = True
+                if not self.repo_manager.clone_repository(
+                        repo_url, repo_path, depth=clone_depth, single_branch=not self.full_history):
+                    logger.error("Failed to clone repository")
+                    return False
+
+            self._check_cancelled()
 
             # Detect technology
             logger.progress("Detecting technology...")
-            technology = self.detector.detect(repo_path)
+            technology = self._detect_technology(repo_url, repo_path)
 
             if technology == Technology.UNKNOWN:
                 logger.error("Could not detect project technology")
-                self._rollback(repo_path)
+                if created:
+                    self._rollback(repo_path)
                 return False
 
             logger.success(f"Detected: {technology.value}")
@@ -210,25 +310,33 @@ class DevStartCLI:
             installer = self._get_installer(technology, repo_path)
             if not installer:
                 logger.error(f"No installer available for {technology.value}")
-                self._rollback(repo_path)
+                if created:
+                    self._rollback(repo_path)
                 return False
 
             # Check if already installed
-            if not installer.is_installed():
-                logger.progress(f"Installing {technology.value}...")
-                if not installer.install():
-                    logger.error("Installation failed")
-                    self._rollback(repo_path)
-                    return False
-                logger.success("Installation completed")
-            else:
-                logger.success(f"{technology.value} is already installed")
+            with self._install_locks[self.INSTALLERS[technology]]:
+                self._check_cancelled()
+                if not self._is_installed(technology, installer):
+                    logger.progress(f"Installing {technology.value}...")
+                    if not installer.install():
+                        logger.error("Installation failed")
+                        if created:
+                            self._rollback(repo_path)
+                        return False
+                    self._mark_installed(technology)
+                    logger.success("Installation completed")
+                else:
+                    logger.success(f"{technology.value} is already installed")
 
-            # Configure project
+            # Configure project. Runs concurrently across repositories; installers
+            # serialize any shared-tool setup they do here (e.g. Maven bootstrap)
+            self._check_cancelled()
             logger.progress("Configuring project...")
             if not installer.configure():
                 logger.error("Configuration failed")
-                self._rollback(repo_path)
+                if created:
+                    self._rollback(repo_path)
                 return False
 
             logger.success("Configuration completed")
@@ -236,29 +344,62 @@ class DevStartCLI:
 
             return True
 
-        except DevStartError as e:
-            logger.error(str(e))
-            if repo_path:
+        except OperationCancelledError:
+            logger.warning(f"Cancelled: {repo_url}")
+            if created:
                 self._rollback(repo_path)
             return False
-        except KeyboardInterrupt:
-            logger.warning("Operation cancelled by user")
-            if repo_path and repo_path.exists():
+        except DevStartError as e:
+            logger.error(str(e))
+            if created:
                 self._rollback(repo_path)
             return False
 
+    def _is_installed(self, technology: Technology, installer) -> bool:
+        """
+        Check if a technology is installed, reusing earlier results.
+
+        Checked on first need only, so a batch never imports or probes
+        installers it does not use. The result is shared by every technology
+        handled by the same installer.
+        """
+        installed = self._installed_cache.get(technology)
+        if installed is None:
+            installed = installer.is_installed()
+            installer_ref = self.INSTALLERS.get(technology)
+            for other, other_ref in self.INSTALLERS.items():
+                if other == technology or other_ref == installer_ref:
+                    self._installed_cache[other] = installed
+        return installed
+
+    def _mark_installed(self, technology: Technology) -> None:
+        """Record every technology sharing this installer as installed."""
+        installer_ref = self.INSTALLERS.get(technology)
+        for other, other_ref in self.INSTALLERS.items():
+            if other == technology or other_ref == installer_ref:
+                self._installed_cache[other] = True
+
+    def _detect_technology(self, repo_url: str, repo_path: Path) -> Technology:
+        """Detect technology, reusing the cached result for an unchanged HEAD."""
+        sha = self.repo_manager.get_head_sha(repo_path)
+        if sha:
+            cached = self.detect_cache.get(repo_url, sha)
+            if cached:
+                logger.debug(f"Using cached detection for {sha[:12]}")
+                return cached
+
+        technology = self.detector.detect(repo_path)
+        if sha and technology != Technology.UNKNOWN:
+            self.detect_cache.set(repo_url, sha, technology)
+        return technology
+
     def _get_installer(self, technology: Technology, repo_path: Path):
         """Get appropriate installer for technology."""
-        installers = {
-            Technology.JAVA_SPRINGBOOT: JavaInstaller,
-            Technology.JAVA_MAVEN: JavaInstaller,
-            Technology.JAVA_GRADLE: JavaInstaller,
-            Technology.PYTHON: PythonInstaller,
-            Technology.NODEJS: NodeJSInstaller
-        }
-
-        installer_class = installers.get(technology)
-        if installer_class:
+        installer_ref = self.INSTALLERS.get(technology)
+        if installer_ref:
+            module_name, class_name = installer_ref
+            module = importlib.import_module(module_name, __package__)
+            installer_class = getattr(module, class_name)
             return installer_class(repo_path, self.proxy_manager)
         return None
 
@@ -266,8 +407,19 @@ class DevStartCLI:
 @click.command()
 @click.option('--http-proxy', help='HTTP proxy URL (e.g., http://proxy.company.com:8080)')
 @click.option('--https-proxy', help='HTTPS proxy URL (e.g., http://proxy.company.com:8080)')
+@click.option('--max-workers', default=DEFAULT_MAX_WORKERS, show_default=True,
+              type=click.IntRange(min=1),
+              help='Maximum number of repositories processed in parallel')
+@click.option('--per-host-workers', default=MAX_CLONES_PER_HOST, show_default=True,
+              type=click.IntRange(min=1),
+              help='Maximum number of concurrent clones against the same host')
+@click.option('--full-history/--shallow', default=False,
+              help='Clone the full git history instead of a shallow single-branch clone')
+@click.option('--force-check', is_flag=True, default=False,
+              help='Re-check the Git installation instead of using the cached result')
 @click.argument('repositories', nargs=-1, required=True)
-def main(http_proxy, https_proxy, repositories):
+def main(http_proxy, https_proxy, max_workers, per_host_workers, full_history, force_check,
+         repositories):
     """
     dev-start - Technology configurator for developers.
 
@@ -281,7 +433,9 @@ def main(http_proxy, https_proxy, repositories):
     """
     logger.banner("DEV-START", "Technology Configurator for Developers")
 
-    cli = DevStartCLI()
+    cancel_event = threading.Event()
+    cli = DevStartCLI(full_history=full_history, per_host_workers=per_host_workers,
+                      cancel_event=cancel_event)
 
     # Setup proxy if provided
     try:
@@ -290,26 +444,68 @@ def main(http_proxy, https_proxy, repositories):
         exit(1)
 
     # Ensure Git is installed
-    if not cli.ensure_git_installed():
+    if not cli.ensure_git_installed(force_check=force_check):
         logger.error("Cannot proceed without Git. Exiting...")
         exit(1)
 
-    # Process each repository
+    # Skip repositories that were passed more than once
+    unique_repositories = {}
+    for repo_url in repositories:
+        canonical_url = cli.repo_manager.canonicalize_url(repo_url)
+        if canonical_url in unique_repositories:
+            logger.warning(f"Skipping duplicate repository: {repo_url}")
+        else:
+            unique_repositories[canonical_url] = repo_url
+    repositories = list(unique_repositories.values())
+
+    # Repositories that map to the same checkout directory (same name, different
+    # owners) are processed one after another in one task, never concurrently
+    groups: Dict[str, List[str]] = {}
+    for repo_url in repositories:
+        repo_path = cli.base_dir / cli.repo_manager.get_repo_name(repo_url)
+        groups.setdefault(os.path.normcase(str(repo_path)), []).append(repo_url)
+
+    def process_group(repo_urls: List[str]) -> List[bool]:
+        results = []
+        for repo_url in repo_urls:
+            if cancel_event.is_set():
+                break
+            try:
+                results.append(cli.process_repository(repo_url))
+            except DevStartError as e:
+                logger.error(f"Error processing {repo_url}", details=str(e))
+                results.append(False)
+            except Exception as e:
+                logger.error(f"Unexpected error processing {repo_url}", details=str(e))
+                results.append(False)
+        return results
+
+    # Process repositories in parallel (clones are network-bound and independent)
     successful = 0
     failed = 0
 
-    for repo_url in repositories:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(process_group, repo_urls) for repo_urls in groups.values()]
         try:
-            if cli.process_repository(repo_url):
-                successful += 1
-            else:
-                failed += 1
-        except DevStartError as e:
-            logger.error(f"Error processing {repo_url}", details=str(e))
-            failed += 1
-        except Exception as e:
-            logger.error(f"Unexpected error processing {repo_url}", details=str(e))
-            failed += 1
+            for future in as_completed(futures):
+                for success in future.result():
+                    if success:
+                        successful += 1
+                    else:
+                        failed += 1
+        except KeyboardInterrupt:
+            # Queued repositories never start; running ones stop at their next
+            # step and roll back what they cloned. Leaving the pool waits for them.
+            logger.warning("Cancelling: waiting for repositories in progress to stop...")
+            cancel_event.set()
+            for future in futures:
+                future.cancel()
+
+    cli.detect_cache.save()
+
+    if cancel_event.is_set():
+        logger.warning("Operation cancelled by user")
+        exit(130)
 
     # Summary
     logger.section("Summary")
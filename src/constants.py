@@ -1,6 +1,8 @@
 """Centralized constants and configuration values for dev-start."""
+import re
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Mapping
 
 # =============================================================================
 # DIRECTORY CONFIGURATION
@@ -24,22 +26,31 @@ DOWNLOAD_TIMEOUT = 300  # 5 minutes for downloads
 BUILD_TIMEOUT = 600  # 10 minutes for builds (Maven, Gradle, npm)
 COMMAND_TIMEOUT = 120  # 2 minutes for general commands
 GIT_TIMEOUT = 10  # 10 seconds for git version checks
+MIRROR_PROBE_TIMEOUT = 3  # 3 seconds to answer a mirror HEAD probe
+
+def _freeze(value: Any) -> Any:
+    """Recursively make a configuration table read-only (dicts and lists)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 # =============================================================================
 # DEFAULT VERSIONS
 # =============================================================================
-DEFAULT_VERSIONS: Dict[str, str] = {
+DEFAULT_VERSIONS: Mapping[str, str] = _freeze({
     'java': '17',
     'python': '3.11',
     'nodejs': '20.11.0',
     'git': '2.43.0',
     'maven': '3.9.9',
-}
+})
 
 # =============================================================================
 # DOWNLOAD URLS
 # =============================================================================
-DOWNLOAD_URLS: Dict[str, Dict[str, str]] = {
+DOWNLOAD_URLS: Mapping[str, Mapping[str, Any]] = _freeze({
     'git': {
         '2.43.0': 'https://github.com/git-for-windows/git/releases/download/v2.43.0.windows.1/MinGit-2.43.0-64-bit.zip'
     },
@@ -60,12 +71,12 @@ DOWNLOAD_URLS: Dict[str, Dict[str, str]] = {
     'python': {
         '3.11': 'https://www.python.org/ftp/python/3.11.7/python-3.11.7-amd64.exe'
     }
-}
+})
 
 # =============================================================================
 # SHA256 CHECKSUMS FOR DOWNLOAD VERIFICATION
 # =============================================================================
-DOWNLOAD_CHECKSUMS: Dict[str, Dict[str, str]] = {
+DOWNLOAD_CHECKSUMS: Mapping[str, Mapping[str, str]] = _freeze({
     'git': {
         '2.43.0': 'e94ef7ecce4aea9a075f5e1cd80371abaf69db5e713e78fa5aa7fd8fc56a14a5'
     },
@@ -74,19 +85,19 @@ DOWNLOAD_CHECKSUMS: Dict[str, Dict[str, str]] = {
     },
     # Note: Oracle Java and Maven don't provide stable checksums for "latest" URLs
     # Checksums should be updated when version-specific URLs are used
-}
+})
 
 # =============================================================================
 # URL VALIDATION
 # =============================================================================
-ALLOWED_URL_SCHEMES = ['http', 'https', 'git']
-ALLOWED_GIT_HOSTS = [
+ALLOWED_URL_SCHEMES = frozenset({'http', 'https', 'git'})
+ALLOWED_GIT_HOSTS = frozenset({
     'github.com',
     'gitlab.com',
     'bitbucket.org',
     'dev.azure.com',
     'ssh.dev.azure.com',
-]
+})
 
 # =============================================================================
 # ENVIRONMENT VARIABLE PATTERNS
@@ -97,18 +108,33 @@ ENV_VAR_NAME_PATTERN = r'^[A-Za-z_][A-Za-z0-9_]*$'
 # PROXY URL PATTERN
 # =============================================================================
 PROXY_URL_PATTERN = r'^https?://[^\s/$.?#].[^\s]*$'
+PROXY_URL_RE = re.compile(PROXY_URL_PATTERN)
 
 # =============================================================================
 # RETRY CONFIGURATION
 # =============================================================================
 MAX_DOWNLOAD_RETRIES = 3
-MAX_RMTREE_RETRIES = 3
+MAX_RMTREE_RETRIES = 5
 RETRY_DELAY_SECONDS = 1
+RETRY_STATUS_CODES = (502, 503, 504)  # Transient gateway errors retried by the HTTP session
+RETRY_BASE_DELAY_SECONDS = 0.1  # First backoff delay, doubled on each retry
+RETRY_MAX_DELAY_SECONDS = 5
+
+# =============================================================================
+# CONCURRENCY CONFIGURATION
+# =============================================================================
+DEFAULT_MAX_WORKERS = 4  # Repositories processed in parallel
+MAX_CLONES_PER_HOST = 4  # Concurrent git network operations per remote host
+RMTREE_WORKERS = 8  # Threads used to delete large directory trees
+EXTRACT_WORKERS = 8  # Threads used to extract archive members
+HTTP_POOL_SIZE = 16  # Keep-alive connections kept per host by the shared HTTP session
 
 # =============================================================================
 # CHUNK SIZE FOR DOWNLOADS
 # =============================================================================
-DOWNLOAD_CHUNK_SIZE = 8192  # 8 KB
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+PARALLEL_DOWNLOAD_MIN_SIZE = 16 * 1024 * 1024  # Files this large are fetched as byte ranges
+PARALLEL_DOWNLOAD_PARTS = 4  # Concurrent range requests per download
 
 # =============================================================================
 # GUI CONFIGURATION
@@ -124,3 +150,11 @@ GUI_MIN_HEIGHT = 600
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 LOG_FILE_NAME = 'dev-start.log'
+BUILD_OUTPUT_TAIL_LINES = 200  # Build output lines kept for error reporting
+
+# =============================================================================
+# CACHE CONFIGURATION
+# =============================================================================
+DETECT_CACHE_FILE_NAME = 'detect-cache.json'
+GIT_CHECK_CACHE_FILE_NAME = 'git-check.json'
+GIT_CHECK_CACHE_TTL_SECONDS = 24 * 60 * 60  # Re-run the Git check at least daily
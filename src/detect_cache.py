@@ -0,0 +1,86 @@
+"""Persistent cache of technology detection results."""
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .constants import DETECT_CACHE_FILE_NAME, get_tools_dir
+from .detector import Technology
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DetectionCache:
+    """Caches detected technologies keyed by repository URL and commit SHA."""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or get_tools_dir().parent / DETECT_CACHE_FILE_NAME
+        self._entries: Dict[str, str] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load cached entries from disk, ignoring a missing or corrupt file."""
+        try:
+            data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return
+        except (IOError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable detection cache: {e}")
+            return
+
+        if isinstance(data, dict):
+            with self._lock:
+                self._entries = {k: v for k, v in data.items() if isinstance(v, str)}
+
+    def get(self, repo_url: str, sha: str) -> Optional[Technology]:
+        """
+        Get the cached technology for a repository commit.
+
+        Args:
+            repo_url: Repository URL
+            sha: Commit SHA of the checked out HEAD
+
+        Returns:
+            Cached Technology, or None if not cached
+        """
+        with self._lock:
+            value = self._entries.get(self._key(repo_url, sha))
+        if value is None:
+            return None
+        try:
+            return Technology(value)
+        except ValueError:
+            return None
+
+    def set(self, repo_url: str, sha: str, technology: Technology) -> None:
+        """
+        Cache the technology detected for a repository commit.
+
+        Args:
+            repo_url: Repository URL
+            sha: Commit SHA of the checked out HEAD
+            technology: Detected technology
+        """
+        with self._lock:
+            self._entries[self._key(repo_url, sha)] = technology.value
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write cached entries to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            content = json.dumps(self._entries, indent=2, sort_keys=True)
+            self._dirty = False
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(content, encoding='utf-8')
+        except IOError as e:
+            logger.warning("Could not save detection cache", details=str(e))
+
+    def _key(self, repo_url: str, sha: str) -> str:
+        """Build the cache key for a repository commit."""
+        return f"{repo_url.strip().rstrip('/')}@{sha}"
@@ -1,6 +1,12 @@
 """Technology detector for repository analysis."""
+import functools
+import mmap
+import os
+import re
+import threading
+import time
 from pathlib import Path
-from typing import Optional, List, Set
+from typing import Optional, FrozenSet, Dict, Tuple
 from enum import Enum
 
 from .logger import get_logger
@@ -26,33 +32,126 @@ class BuildTool(Enum):
     UNKNOWN = "unknown"
 
 
+# Timestamps this recent may not have ticked yet for a further change
+# (coarse filesystem clocks), so results for them are not reused
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _is_racy(mtime_ns: int) -> bool:
+    """Check if a modification time is too recent to key a cache on."""
+    return time.time_ns() - mtime_ns < _RACY_WINDOW_NS
+
+
+class _DirCache:
+    """Caches root listings by directory mtime so repeat lookups cost one stat."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> FrozenSet[str]:
+        """
+        Get the names of the files directly inside a directory.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            Frozenset of file names
+
+        Raises:
+            FileNotFoundError: If the directory does not exist
+            OSError: If the directory cannot be read
+        """
+        key = os.fspath(path)
+        mtime = os.stat(key).st_mtime_ns
+
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # DirEntry.is_file() uses the type from the directory listing, no stat per file
+        with os.scandir(key) as entries:
+            files = frozenset(entry.name for entry in entries if entry.is_file())
+
+        if not _is_racy(mtime):
+            with self._lock:
+                self._entries[key] = (mtime, files)
+        return files
+
+
+_dir_cache = _DirCache()
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_indicators(path: str, mtime_ns: int, size: int, pattern: re.Pattern) -> bool:
+    """
+    Search a file for an indicator pattern.
+
+    The mtime and size are part of the cache key only, so an edited file
+    is scanned again instead of answered from the cache.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    # mmap cannot map an empty file
+    if size == 0:
+        return False
+
+    with open(path, 'rb') as f:
+        # Scan the mapped pages in place; the search stops at the first hit
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return pattern.search(mapped) is not None
+
+
 class TechnologyDetector:
     """Detects technology used in a repository."""
 
     # Detection patterns for each technology
     DETECTION_PATTERNS = {
         Technology.JAVA_SPRINGBOOT: {
-            'files': ['pom.xml', 'build.gradle', 'build.gradle.kts', 'gradlew'],
-            'indicators': ['spring-boot', 'springframework', 'org.springframework']
+            # Spring indicators live in build files; wrapper scripts are never scanned
+            'files': ('pom.xml', 'build.gradle', 'build.gradle.kts'),
+            'indicators': ('spring-boot', 'springframework', 'org.springframework')
         },
         Technology.JAVA_MAVEN: {
-            'files': ['pom.xml'],
-            'indicators': []  # Any Maven project without Spring
+            'files': ('pom.xml',),
+            'indicators': ()  # Any Maven project without Spring
         },
         Technology.JAVA_GRADLE: {
-            'files': ['build.gradle', 'build.gradle.kts', 'gradlew', 'gradlew.bat'],
-            'indicators': []  # Any Gradle project without Spring
+            'files': ('build.gradle', 'build.gradle.kts', 'gradlew', 'gradlew.bat'),
+            'indicators': ()  # Any Gradle project without Spring
         },
         Technology.PYTHON: {
-            'files': ['requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile', 'setup.cfg'],
-            'indicators': []
+            'files': ('requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile', 'setup.cfg'),
+            'indicators': ()
         },
         Technology.NODEJS: {
-            'files': ['package.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml'],
-            'indicators': []
+            'files': ('package.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml'),
+            'indicators': ()
         }
     }
 
+    # Marker files per technology, without the per-call pattern dict lookup
+    _PATTERN_FILES = {tech: pattern['files'] for tech, pattern in DETECTION_PATTERNS.items()}
+
+    # One case-insensitive alternation per technology, so a file is scanned in a single pass
+    _INDICATOR_PATTERNS = {
+        tech: re.compile(
+            b'|'.join(re.escape(indicator.encode('utf-8')) for indicator in pattern['indicators']),
+            re.IGNORECASE
+        )
+        for tech, pattern in DETECTION_PATTERNS.items()
+        if pattern['indicators']
+    }
+
+    # Files that mark a Gradle build (gradlew alone also selects Gradle as build tool)
+    _GRADLE_FILES = frozenset({'build.gradle', 'build.gradle.kts', 'settings.gradle', 'settings.gradle.kts'})
+    _GRADLE_BUILD_TOOL_FILES = _GRADLE_FILES | {'gradlew', 'gradlew.bat'}
+    # Any of these means the repository may be a Java project
+    _JAVA_FILES = frozenset(DETECTION_PATTERNS[Technology.JAVA_SPRINGBOOT]['files']) | _GRADLE_FILES | {'gradlew'}
+
     def detect(self, repo_path: Path) -> Technology:
         """
         Detect technology from repository files.
@@ -63,27 +162,33 @@ class TechnologyDetector:
         Returns:
             Technology enum value
         """
-        if not repo_path.exists():
+        files_in_repo = self._get_root_files(repo_path)
+        if files_in_repo is None:
             logger.warning(f"Repository path does not exist: {repo_path}")
             return Technology.UNKNOWN
 
-        files_in_repo = self._get_root_files(repo_path)
         logger.debug(f"Files in repository root: {files_in_repo}")
 
-        # Check for Java/SpringBoot (highest priority for Spring projects)
-        if self._is_spring_boot_project(repo_path, files_in_repo):
-            logger.info(f"Detected: Spring Boot project")
-            return Technology.JAVA_SPRINGBOOT
+        # Java checks share one look at the file set; build files are only read
+        # for Spring indicators when a Java build file is present
+        if not self._JAVA_FILES.isdisjoint(files_in_repo):
+            has_pom = self._is_maven_project(repo_path, files_in_repo)
+            has_gradle = self._is_gradle_project(repo_path, files_in_repo)
+
+            # Check for Java/SpringBoot (highest priority for Spring projects)
+            if self._is_spring_boot_project(repo_path, files_in_repo):
+                logger.info(f"Detected: Spring Boot project")
+                return Technology.JAVA_SPRINGBOOT
 
-        # Check for Java Maven (non-Spring)
-        if self._is_maven_project(repo_path, files_in_repo):
-            logger.info(f"Detected: Java Maven project")
-            return Technology.JAVA_SPRINGBOOT  # Use same installer
+            # Check for Java Maven (non-Spring)
+            if has_pom:
+                logger.info(f"Detected: Java Maven project")
+                return Technology.JAVA_SPRINGBOOT  # Use same installer
 
-        # Check for Java Gradle (non-Spring)
-        if self._is_gradle_project(repo_path, files_in_repo):
-            logger.info(f"Detected: Java Gradle project")
-            return Technology.JAVA_SPRINGBOOT  # Use same installer
+            # Check for Java Gradle (non-Spring)
+            if has_gradle:
+                logger.info(f"Detected: Java Gradle project")
+                return Technology.JAVA_SPRINGBOOT  # Use same installer
 
         # Check for Python
         if self._matches_technology(repo_path, files_in_repo, Technology.PYTHON):
@@ -108,11 +213,10 @@ class TechnologyDetector:
         Returns:
             BuildTool enum value
         """
-        files_in_repo = self._get_root_files(repo_path)
+        files_in_repo = self._get_root_files(repo_path) or frozenset()
 
         # Check for Gradle first (higher priority if both exist)
-        gradle_files = {'build.gradle', 'build.gradle.kts', 'gradlew', 'gradlew.bat', 'settings.gradle', 'settings.gradle.kts'}
-        if gradle_files & set(files_in_repo):
+        if not self._GRADLE_BUILD_TOOL_FILES.isdisjoint(files_in_repo):
             logger.debug("Build tool detected: Gradle")
             return BuildTool.GRADLE
 
@@ -123,63 +227,58 @@ class TechnologyDetector:
 
         return BuildTool.UNKNOWN
 
-    def _get_root_files(self, repo_path: Path) -> List[str]:
-        """Get list of files in repository root."""
+    def _get_root_files(self, repo_path: Path) -> Optional[FrozenSet[str]]:
+        """Get the set of file names in repository root, or None if it does not exist."""
         try:
-            return [f.name for f in repo_path.iterdir() if f.is_file()]
+            return _dir_cache.get(repo_path)
+        except FileNotFoundError:
+            return None
         except PermissionError as e:
             logger.error(f"Permission denied accessing: {repo_path}", details=str(e))
-            return []
+            return frozenset()
         except OSError as e:
             logger.error(f"Error reading directory: {repo_path}", details=str(e))
-            return []
+            return frozenset()
 
-    def _is_spring_boot_project(self, repo_path: Path, files: List[str]) -> bool:
+    def _is_spring_boot_project(self, repo_path: Path, files: FrozenSet[str]) -> bool:
         """Check if repository is a Spring Boot project."""
-        pattern = self.DETECTION_PATTERNS[Technology.JAVA_SPRINGBOOT]
+        return self._matches_technology(repo_path, files, Technology.JAVA_SPRINGBOOT)
 
-        for file in pattern['files']:
-            if file in files:
-                file_path = repo_path / file
-                if self._check_indicators(file_path, pattern['indicators']):
-                    return True
-
-        return False
-
-    def _is_maven_project(self, repo_path: Path, files: List[str]) -> bool:
+    def _is_maven_project(self, repo_path: Path, files: FrozenSet[str]) -> bool:
         """Check if repository is a Maven project (non-Spring)."""
         return 'pom.xml' in files
 
-    def _is_gradle_project(self, repo_path: Path, files: List[str]) -> bool:
+    def _is_gradle_project(self, repo_path: Path, files: FrozenSet[str]) -> bool:
         """Check if repository is a Gradle project."""
-        gradle_files = {'build.gradle', 'build.gradle.kts', 'settings.gradle', 'settings.gradle.kts'}
-        return bool(gradle_files & set(files))
+        return not self._GRADLE_FILES.isdisjoint(files)
 
-    def _matches_technology(self, repo_path: Path, files: List[str], tech: Technology) -> bool:
+    def _matches_technology(self, repo_path: Path, files: FrozenSet[str], tech: Technology) -> bool:
         """Check if repository matches a specific technology."""
-        pattern = self.DETECTION_PATTERNS.get(tech)
-        if not pattern:
+        pattern_files = self._PATTERN_FILES.get(tech)
+        if not pattern_files:
             return False
 
-        # Check for presence of key files
-        for file in pattern['files']:
-            if file in files:
-                # If there are indicators, check file content
-                if pattern['indicators']:
-                    file_path = repo_path / file
-                    if self._check_indicators(file_path, pattern['indicators']):
-                        return True
-                else:
-                    return True
+        # Without indicators, any key file is enough
+        if tech not in self._INDICATOR_PATTERNS:
+            return any(file in files for file in pattern_files)
+
+        # Otherwise check file content, in pattern order
+        for file in pattern_files:
+            if file in files and self._check_indicators(repo_path / file, tech):
+                return True
 
         return False
 
-    def _check_indicators(self, file_path: Path, indicators: List[str]) -> bool:
-        """Check if file contains specific indicators."""
+    def _check_indicators(self, file_path: Path, tech: Technology) -> bool:
+        """Check if file contains any of the technology's indicators (case-insensitive)."""
+        indicator_pattern = self._INDICATOR_PATTERNS.get(tech)
+        if indicator_pattern is None:
+            return False
+
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            content_lower = content.lower()
-            return any(indicator.lower() in content_lower for indicator in indicators)
+            st = os.stat(file_path)
+            scan = _scan_indicators.__wrapped__ if _is_racy(st.st_mtime_ns) else _scan_indicators
+            return scan(os.fspath(file_path), st.st_mtime_ns, st.st_size, indicator_pattern)
         except PermissionError as e:
             logger.warning(f"Permission denied reading: {file_path}")
             return False
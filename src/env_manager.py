@@ -1,21 +1,49 @@
 """Environment and configuration manager."""
 import os
-import re
+import stat
 import sys
-import subprocess
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from .constants import ENV_VAR_NAME_PATTERN
 from .exceptions import InvalidEnvironmentVariableError, PathUpdateError, EnvironmentVariableError
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 16  # POSIX minimum
+
+
+def _write_all(fd: int, chunks: List[bytes]) -> None:
+    """Write byte chunks to a file descriptor, gathered into one syscall where supported."""
+    total = sum(len(chunk) for chunk in chunks)
+    written = 0
+    if hasattr(os, 'writev') and 0 < len(chunks) <= _IOV_MAX:
+        written = os.writev(fd, chunks)
+
+    # Windows, too many chunks, or a short write: finish with plain writes
+    if written < total:
+        remaining = memoryview(b''.join(chunks))[written:]
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+
+
+def _normalize_path_entry(entry: str) -> str:
+    """Normalize a PATH entry for comparison (case on Windows, trailing separators)."""
+    return os.path.normcase(entry.strip().rstrip('\\/'))
+
 
 class EnvironmentManager:
     """Manages environment variables and configuration files."""
 
+    # Shared by every instance: PATH updates are read-modify-write and
+    # installers for different technologies may run concurrently
+    path_lock = threading.Lock()
+
     def __init__(self, project_path: Path):
         self.project_path = project_path
         self.env_file = project_path / '.env'
@@ -36,7 +64,8 @@ class EnvironmentManager:
         if not name or not isinstance(name, str):
             raise InvalidEnvironmentVariableError(name or '')
 
-        if not re.match(ENV_VAR_NAME_PATTERN, name):
+        # ASCII identifiers are exactly ENV_VAR_NAME_PATTERN, checked without a regex
+        if not (name.isascii() and name.isidentifier()):
             raise InvalidEnvironmentVariableError(name)
 
         return True
@@ -52,13 +81,32 @@ class EnvironmentManager:
             InvalidEnvironmentVariableError: If any variable name is invalid
         """
         # Validate all variable names
-        for key in variables.keys():
+        for key in variables:
             self.validate_env_var_name(key)
 
+        chunks = []
+        for key, value in variables.items():
+            chunks += [key.encode('utf-8'), b'=', value.encode('utf-8'), b'\n']
+
+        # Write a sibling temp file and rename it over .env, so a failed write
+        # never leaves a truncated .env behind
         try:
-            with open(self.env_file, 'w', encoding='utf-8') as f:
-                for key, value in variables.items():
-                    f.write(f"{key}={value}\n")
+            try:
+                mode = stat.S_IMODE(os.stat(self.env_file).st_mode)
+            except FileNotFoundError:
+                mode = 0o644
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.env_file.parent, prefix='.env.')
+            try:
+                try:
+                    _write_all(fd, chunks)
+                finally:
+                    os.close(fd)
+                os.chmod(tmp_path, mode)
+                os.replace(tmp_path, self.env_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             logger.success(f"Created .env file: {self.env_file}")
         except IOError as e:
             logger.error(f"Failed to create .env file", details=str(e))
@@ -77,35 +125,112 @@ class EnvironmentManager:
         """
         self.validate_env_var_name(key)
 
-        # Update .env file for project
-        mode = 'a' if self.env_file.exists() else 'w'
+        self._append_env_file({key: value})
+
+        # Set permanent Windows user environment variable
+        self.set_persistent_env_batch({key: value})
+
+    def _append_env_file(self, variables: Dict[str, str]) -> None:
+        """Append variables to the project .env file with a single unbuffered append."""
         try:
-            with open(self.env_file, mode, encoding='utf-8') as f:
-                f.write(f"{key}={value}\n")
+            fd = os.open(self.env_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                _write_all(fd, [f"{key}={value}\n".encode('utf-8') for key, value in variables.items()])
+            finally:
+                os.close(fd)
         except IOError as e:
             logger.warning(f"Could not update .env file", details=str(e))
 
-        # Set permanent Windows user environment variable
-        if sys.platform == 'win32':
-            try:
-                # Use setx command to set permanent user environment variable
-                result = subprocess.run(
-                    ['setx', key, value],
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-                logger.success(f"Set permanent environment variable: {key}")
-            except subprocess.CalledProcessError as e:
-                logger.warning(
-                    f"Could not set permanent environment variable: {key}",
-                    details=f"Please manually add {key}={value} to your system environment variables"
-                )
-            except FileNotFoundError:
-                logger.warning(
-                    f"setx command not found",
-                    details="Unable to set permanent environment variable"
-                )
+    def set_persistent_env_batch(self, variables: Dict[str, str],
+                                 path_entries: Optional[List[str]] = None) -> None:
+        """
+        Set permanent user environment variables in one registry session (Windows).
+
+        Opens HKCU\\Environment once for all variables and PATH entries and
+        notifies running applications once. Does nothing on other platforms.
+
+        Args:
+            variables: Dictionary of environment variables
+            path_entries: Directories to prepend to the user PATH if missing
+
+        Raises:
+            InvalidEnvironmentVariableError: If any variable name is invalid
+        """
+        for key in variables:
+            self.validate_env_var_name(key)
+
+        if sys.platform != 'win32' or not (variables or path_entries):
+            return
+
+        added = []
+        try:
+            import winreg
+
+            access = winreg.KEY_READ | winreg.KEY_WRITE if path_entries else winreg.KEY_WRITE
+            with self.path_lock, \
+                    winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0, access) as key:
+                for name, value in variables.items():
+                    # Same value types setx uses: expandable only when it references %VARS%
+                    value_type = winreg.REG_EXPAND_SZ if '%' in value else winreg.REG_SZ
+                    winreg.SetValueEx(key, name, 0, value_type, value)
+                if path_entries:
+                    added = self._prepend_user_path(key, path_entries)
+        except OSError as e:
+            names = ', '.join(list(variables) + (['PATH'] if path_entries else []))
+            logger.warning(
+                f"Could not set permanent environment variables: {names}",
+                details="Please manually add them to your system environment variables"
+            )
+            return
+
+        if not variables and not added:
+            return
+
+        self._broadcast_environment_change()
+        for name in variables:
+            logger.success(f"Set permanent environment variable: {name}")
+        for entry in added:
+            logger.success(f"Added to permanent PATH: {entry}")
+
+    def persist_tool_environment(self, variables: Dict[str, str], path_entries: List[str]) -> None:
+        """
+        Persist a tool's variables and PATH entries together.
+
+        Variables are appended to the project .env file in one write; on Windows
+        the variables and PATH entries then share one registry session and one
+        change broadcast.
+
+        Args:
+            variables: Dictionary of environment variables
+            path_entries: Directories to prepend to the user PATH if missing
+
+        Raises:
+            InvalidEnvironmentVariableError: If any variable name is invalid
+        """
+        for key in variables:
+            self.validate_env_var_name(key)
+
+        self._append_env_file(variables)
+        self.set_persistent_env_batch(variables, path_entries)
+
+    @staticmethod
+    def path_contains(path_value: str, entry: str, separator: str = os.pathsep) -> bool:
+        """
+        Check whether a PATH-style value lists an entry.
+
+        Entries are compared whole, so tools/jdk/bin does not match
+        tools/jdk/bin2 the way a substring test would.
+
+        Args:
+            path_value: PATH-style string
+            entry: Directory to look for
+            separator: Separator between entries
+
+        Returns:
+            True if the entry is present
+        """
+        target = _normalize_path_entry(entry)
+        return any(_normalize_path_entry(part) == target for part in path_value.split(separator))
 
     def set_system_path(self, path: str) -> None:
         """
@@ -114,58 +239,74 @@ class EnvironmentManager:
         Args:
             path: Path to add to system PATH
         """
-        # Update current process PATH
-        current_path = os.environ.get('PATH', '')
-        if path not in current_path:
-            os.environ['PATH'] = f"{path};{current_path}"
-            logger.debug(f"Added to current process PATH: {path}")
-
-        # Add to permanent Windows user PATH
-        if sys.platform == 'win32':
-            try:
-                # Get current user PATH from registry
-                result = subprocess.run(
-                    ['powershell', '-Command',
-                     '[Environment]::GetEnvironmentVariable("Path", "User")'],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                current_user_path = result.stdout.strip()
-
-                # Check if path is already in user PATH
-                if path not in current_user_path:
-                    # Add to user PATH (preserving existing paths)
-                    new_path = f"{path};{current_user_path}" if current_user_path else path
-
-                    # Set new user PATH using PowerShell with proper argument passing
-                    powershell_script = f'''
-$newPath = @"
-{new_path}
-"@
-[Environment]::SetEnvironmentVariable("Path", $newPath, "User")
-'''
-                    subprocess.run(
-                        ['powershell', '-NoProfile', '-NonInteractive', '-Command', powershell_script],
-                        check=True,
-                        capture_output=True,
-                        text=True
-                    )
+        with self.path_lock:
+            # Update current process PATH
+            current_path = os.environ.get('PATH', '')
+            if not self.path_contains(current_path, path):
+                os.environ['PATH'] = f"{path}{os.pathsep}{current_path}" if current_path else path
+                logger.debug(f"Added to current process PATH: {path}")
+
+            # Add to permanent Windows user PATH (HKCU\Environment), without spawning PowerShell
+            if sys.platform == 'win32':
+                try:
+                    import winreg
+
+                    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0,
+                                        winreg.KEY_READ | winreg.KEY_WRITE) as key:
+                        if not self._prepend_user_path(key, [path]):
+                            logger.info(f"Path already in permanent PATH: {path}")
+                            return
+
+                    self._broadcast_environment_change()
                     logger.success(f"Added to permanent PATH: {path}")
                     logger.info("Restart your terminal/IDE to use the new PATH")
-                else:
-                    logger.info(f"Path already in permanent PATH: {path}")
-
-            except subprocess.CalledProcessError as e:
-                logger.warning(
-                    f"Could not add to permanent PATH",
-                    details=f"Please manually add {path} to your system PATH variable"
-                )
-            except FileNotFoundError:
-                logger.warning(
-                    "PowerShell not found",
-                    details="Unable to modify permanent PATH"
-                )
+
+                except OSError as e:
+                    logger.warning(
+                        f"Could not add to permanent PATH",
+                        details=f"Please manually add {path} to your system PATH variable"
+                    )
+
+    def _prepend_user_path(self, key, entries: List[str]) -> List[str]:
+        """
+        Prepend entries missing from the user Path value of an open registry key.
+
+        Args:
+            key: Open HKCU\\Environment key with read and write access
+            entries: Directories to add, in order
+
+        Returns:
+            The entries that were added (empty if nothing was written)
+        """
+        import winreg
+
+        try:
+            current_user_path, _ = winreg.QueryValueEx(key, 'Path')
+        except FileNotFoundError:
+            current_user_path = ''
+
+        added = [entry for entry in entries if not self.path_contains(current_user_path, entry, ';')]
+        if added:
+            # Add to user PATH (preserving existing paths)
+            new_path = ';'.join(added + [current_user_path] if current_user_path else added)
+            winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path)
+        return added
+
+    def _broadcast_environment_change(self) -> None:
+        """Notify running Windows applications that user environment variables changed."""
+        try:
+            import ctypes
+
+            HWND_BROADCAST = 0xFFFF
+            WM_SETTINGCHANGE = 0x001A
+            SMTO_ABORTIFHUNG = 0x0002
+            result = ctypes.c_size_t()
+            ctypes.windll.user32.SendMessageTimeoutW(
+                HWND_BROADCAST, WM_SETTINGCHANGE, 0, 'Environment',
+                SMTO_ABORTIFHUNG, 5000, ctypes.byref(result)
+            )
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Could not broadcast environment change: {e}")
 
     def create_config_dir(self, dir_name: str) -> Path:
         """
@@ -8,12 +8,12 @@ class DevStartError(Exception):
     def __init__(self, message: str, details: Optional[str] = None):
         self.message = message
         self.details = details
-        super().__init__(self.message)
+        # Formatted once: errors are often stringified several times (logs, reports)
+        self._str = f"{message}\nDetails: {details}" if details else message
+        super().__init__(self._str)
 
     def __str__(self) -> str:
-        if self.details:
-            return f"{self.message}\nDetails: {self.details}"
-        return self.message
+        return self._str
 
 
 # =============================================================================
@@ -285,3 +285,13 @@ class RollbackError(DevStartError):
             "Failed to rollback partial installation",
             details=reason
         )
+
+
+# =============================================================================
+# CANCELLATION
+# =============================================================================
+class OperationCancelledError(DevStartError):
+    """Raised in a worker when the user cancels the run (Ctrl-C)."""
+
+    def __init__(self):
+        super().__init__("Operation cancelled by user")
@@ -0,0 +1,87 @@
+"""Persistent cache of the Git installation check."""
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from .constants import GIT_CHECK_CACHE_FILE_NAME, GIT_CHECK_CACHE_TTL_SECONDS, get_tools_dir
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GitCheckCache:
+    """Remembers a successful Git check until the Git binary or ~/.gitconfig changes."""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or get_tools_dir().parent / GIT_CHECK_CACHE_FILE_NAME
+
+    def is_valid(self) -> bool:
+        """
+        Check whether a previous successful Git check can be reused.
+
+        Returns:
+            True if the cache is fresh and Git and its config are unchanged
+        """
+        try:
+            data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return False
+        except (IOError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable Git check cache: {e}")
+            return False
+
+        if not isinstance(data, dict):
+            return False
+
+        checked_at = data.get('checked_at')
+        if not isinstance(checked_at, (int, float)):
+            return False
+        if time.time() - checked_at > GIT_CHECK_CACHE_TTL_SECONDS:
+            return False
+
+        fingerprint = self._fingerprint()
+        return fingerprint is not None and data.get('fingerprint') == fingerprint
+
+    def save(self, version: Optional[str]) -> None:
+        """
+        Record a successful Git check.
+
+        Args:
+            version: Detected Git version
+        """
+        fingerprint = self._fingerprint()
+        if fingerprint is None:
+            return
+
+        content = json.dumps({
+            'fingerprint': fingerprint,
+            'version': version,
+            'checked_at': time.time(),
+        }, indent=2)
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(content, encoding='utf-8')
+        except IOError as e:
+            logger.warning("Could not save Git check cache", details=str(e))
+
+    def _fingerprint(self) -> Optional[List]:
+        """Identify the Git binary on PATH and the global config by path and mtime."""
+        git_path = shutil.which('git')
+        if not git_path:
+            return None
+
+        try:
+            git_mtime = os.stat(git_path).st_mtime
+        except OSError:
+            return None
+
+        try:
+            gitconfig_mtime = os.stat(Path.home() / '.gitconfig').st_mtime
+        except OSError:
+            gitconfig_mtime = None
+
+        return [git_path, git_mtime, gitconfig_mtime]
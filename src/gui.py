@@ -1,21 +1,91 @@
 """Graphical User Interface for dev-start using tkinter."""
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, font
+from tkinter import ttk, scrolledtext, messagebox
+import errno
+import io
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
 import os
 import stat
 import time
-import shutil
 from pathlib import Path
 from datetime import datetime
+from .constants import DEFAULT_MAX_WORKERS
 from .proxy_manager import ProxyManager
 from .repo_manager import RepositoryManager
 from .detector import TechnologyDetector, Technology
 from .installers.git_installer import GitInstaller
-from .installers.java_installer import JavaInstaller
-from .installers.python_installer import PythonInstaller
-from .installers.nodejs_installer import NodeJSInstaller
+
+
+# Log and report separators
+_SEP60 = "=" * 60
+_SEP70 = "=" * 70
+_DASH70 = "-" * 70
+
+
+def _force_remove(func, path):
+    """Call func(path), clearing the read-only attribute and retrying once if denied."""
+    try:
+        func(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+
+
+def _is_junction(entry):
+    """
+    Tell whether a directory entry is a Windows junction (or other reparse point).
+
+    Python 3.12 added DirEntry.is_junction(); older versions report junctions
+    as plain directories, so fall back to the reparse-point attribute. On
+    Windows scandir caches that stat result, so no extra system call is made.
+
+    Args:
+        entry: os.DirEntry to check
+
+    Returns:
+        bool: True if the entry must be removed without descending into it
+    """
+    if hasattr(entry, 'is_junction'):
+        return entry.is_junction()
+    attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _fast_rmtree(path):
+    """
+    Remove a directory tree using os.scandir.
+
+    The directory entries already know whether they are directories, so no
+    extra stat call is made per file. Symlinks and junctions are removed
+    themselves, never followed.
+
+    Args:
+        path: Directory to remove
+    """
+    if os.path.islink(path):
+        raise OSError(f"Cannot remove a symbolic link as a directory tree: {path}")
+
+    dirs = []
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if _is_junction(entry):
+                        _force_remove(os.rmdir, entry.path)
+                    else:
+                        stack.append(entry.path)
+                else:
+                    _force_remove(os.unlink, entry.path)
+
+    # Parents were collected before their children: remove bottom-up
+    for directory in reversed(dirs):
+        _force_remove(os.rmdir, directory)
 
 
 # Application Theme Colors
@@ -33,24 +103,77 @@ class AppTheme:
     ERROR = "#DC3545"
     WARNING = "#FFC107"
 
+    # Fonts
+    FONT_BODY = ('Segoe UI', 9)
+    FONT_BUTTON = ('Segoe UI', 10, 'bold')
+    FONT_SUBTITLE = ('Segoe UI', 11, 'bold')
+    FONT_TITLE = ('Segoe UI', 18, 'bold')
+    FONT_LOG = ('Consolas', 9)
+    FONT_LOG_BOLD = ('Consolas', 9, 'bold')
+
 
 class LogRedirector:
-    """Redirect stdout/stderr to GUI text widget."""
+    """Redirect stdout/stderr to GUI text widget.
+
+    Writes may come from any thread and only queue the text. Each thread's
+    text is held until its newline arrives, so lines printed by repositories
+    processed in parallel never splice together. The Tk thread drains the queue
+    about 30 times per second, so a burst of prints costs one widget update and
+    no Tcl call is made from a worker thread.
+    """
+
+    FLUSH_INTERVAL_MS = 33
+    # Older lines are dropped so long runs don't slow the widget down
+    MAX_LINES = 5000
 
     def __init__(self, text_widget, tag="stdout"):
         self.text_widget = text_widget
         self.tag = tag
+        self._queue = queue.SimpleQueue()
+        # Unterminated text per writing thread
+        self._partial = threading.local()
+        # Created on the Tk thread: only that thread touches the widget
+        self._tk_thread = threading.get_ident()
+        self.text_widget.after(self.FLUSH_INTERVAL_MS, self._poll)
 
     def write(self, message):
-        """Write message to text widget."""
-        if message.strip():
-            self.text_widget.insert(tk.END, message, self.tag)
-            self.text_widget.see(tk.END)
-            self.text_widget.update()
+        """Queue the complete lines of message for the text widget."""
+        if not message:
+            return
+        pending = getattr(self._partial, 'text', '') + message
+        lines, newline, self._partial.text = pending.rpartition('\n')
+        if newline:
+            self._queue.put(lines + newline)
 
     def flush(self):
-        """Flush method for compatibility."""
-        pass
+        """Queue this thread's unterminated text; on the Tk thread, also insert queued output."""
+        pending = getattr(self._partial, 'text', '')
+        if pending.strip():
+            self._queue.put(pending)
+        self._partial.text = ''
+        if threading.get_ident() == self._tk_thread:
+            self._drain()
+
+    def _poll(self):
+        """Drain the queue and schedule the next drain."""
+        self._drain()
+        self.text_widget.after(self.FLUSH_INTERVAL_MS, self._poll)
+
+    def _drain(self):
+        """Insert all queued output into the text widget with one insert."""
+        parts = []
+        while True:
+            try:
+                parts.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if parts:
+            self.text_widget.insert(tk.END, "".join(parts), self.tag)
+            line_count = int(self.text_widget.index('end-1c').split('.')[0])
+            if line_count > self.MAX_LINES:
+                self.text_widget.delete('1.0', f"{line_count - self.MAX_LINES + 1}.0")
+            self.text_widget.see(tk.END)
 
 
 class InstallationReport:
@@ -64,14 +187,18 @@ class InstallationReport:
         self.failed = []
         self.git_installed = False
         self.technologies_detected = {}
+        # (started, completed, duration) strings, fixed once the run ends
+        self._time_strings = None
 
     def start(self):
         """Mark start of installation."""
         self.start_time = datetime.now()
+        self._time_strings = None
 
     def end(self):
         """Mark end of installation."""
         self.end_time = datetime.now()
+        self._time_strings = self._format_times()
 
     def add_repository(self, url, success, technology=None, error=None):
         """Add repository result."""
@@ -84,7 +211,10 @@ class InstallationReport:
         if success:
             self.successful.append(url)
             if technology:
-                self.technologies_detected[url] = technology
+                # Stored as display text, ready for the report
+                self.technologies_detected[url] = (
+                    technology.value if isinstance(technology, Technology) else str(technology)
+                )
         else:
             self.failed.append(url)
 
@@ -95,50 +225,146 @@ class InstallationReport:
             return f"{delta.total_seconds():.2f}s"
         return "N/A"
 
+    def _format_times(self):
+        """Format the start time, end time and duration for the report."""
+        started = self.start_time.strftime('%Y-%m-%d %H:%M:%S') if self.start_time else 'N/A'
+        completed = self.end_time.strftime('%Y-%m-%d %H:%M:%S') if self.end_time else 'N/A'
+        return started, completed, self.get_duration()
+
     def generate_report(self):
         """Generate formatted report."""
-        lines = []
-        lines.append("=" * 70)
-        lines.append("INSTALLATION REPORT")
-        lines.append("=" * 70)
-        lines.append(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S') if self.start_time else 'N/A'}")
-        lines.append(f"Completed: {self.end_time.strftime('%Y-%m-%d %H:%M:%S') if self.end_time else 'N/A'}")
-        lines.append(f"Duration: {self.get_duration()}")
-        lines.append("")
-        lines.append(f"Git Installed: {'Yes' if self.git_installed else 'No'}")
-        lines.append("")
-        lines.append(f"Total Repositories: {len(self.repositories)}")
-        lines.append(f"Successful: {len(self.successful)}")
-        lines.append(f"Failed: {len(self.failed)}")
-        lines.append("")
+        sep = _SEP70 + "\n"
+        dash = _DASH70 + "\n"
+        buf = io.StringIO()
+        buf.write(sep)
+        buf.write("INSTALLATION REPORT\n")
+        buf.write(sep)
+        started, completed, duration = self._time_strings or self._format_times()
+        buf.write(f"Started: {started}\n")
+        buf.write(f"Completed: {completed}\n")
+        buf.write(f"Duration: {duration}\n")
+        buf.write("\n")
+        buf.write(f"Git Installed: {'Yes' if self.git_installed else 'No'}\n")
+        buf.write("\n")
+        buf.write(f"Total Repositories: {len(self.repositories)}\n")
+        buf.write(f"Successful: {len(self.successful)}\n")
+        buf.write(f"Failed: {len(self.failed)}\n")
+        buf.write("\n")
 
         if self.successful:
-            lines.append("SUCCESSFUL INSTALLATIONS:")
-            lines.append("-" * 70)
-            for url in self.successful:
-                tech = self.technologies_detected.get(url, 'Unknown')
-                tech_str = tech.value if hasattr(tech, 'value') else str(tech)
-                lines.append(f"  [OK] {url}")
-                lines.append(f"    Technology: {tech_str}")
-            lines.append("")
+            buf.write("SUCCESSFUL INSTALLATIONS:\n")
+            buf.write(dash)
+            buf.write("".join([
+                f"  [OK] {url}\n    Technology: {self.technologies_detected.get(url, 'Unknown')}\n"
+                for url in self.successful
+            ]))
+            buf.write("\n")
 
         if self.failed:
-            lines.append("FAILED INSTALLATIONS:")
-            lines.append("-" * 70)
-            for repo in self.repositories:
-                if not repo['success']:
-                    lines.append(f"  [ERROR] {repo['url']}")
-                    if repo['error']:
-                        lines.append(f"    Error: {repo['error']}")
-            lines.append("")
+            buf.write("FAILED INSTALLATIONS:\n")
+            buf.write(dash)
+            buf.write("".join([
+                f"  [ERROR] {repo['url']}\n" + (f"    Error: {repo['error']}\n" if repo['error'] else "")
+                for repo in self.repositories
+                if not repo['success']
+            ]))
+            buf.write("\n")
+
+        # No trailing newline after the closing separator
+        buf.write(_SEP70)
+        return buf.getvalue()
+
+
+class _GitConfigDialog(tk.Toplevel):
+    """Single modal form asking for the Git user name, email and SSL setting."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.title("Configurar Git")
+        self.configure(bg=AppTheme.WHITE)
+        self.resizable(False, False)
+        self.transient(parent)
+
+        self.result = None
+        self.name_var = tk.StringVar()
+        self.email_var = tk.StringVar()
+        self.ssl_verify_var = tk.BooleanVar(value=True)
+
+        form = ttk.Frame(self, style='Card.TFrame', padding=20)
+        form.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(
+            form,
+            text="Git precisa ser configurado com suas informações.\n"
+                 "(Nome e email são necessários para commits)",
+            background=AppTheme.WHITE
+        ).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 15))
+
+        ttk.Label(form, text="Nome completo:", background=AppTheme.WHITE).grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.name_entry = ttk.Entry(form, textvariable=self.name_var, width=40)
+        self.name_entry.grid(row=1, column=1, pady=5)
+
+        ttk.Label(form, text="Email:", background=AppTheme.WHITE).grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.email_entry = ttk.Entry(form, textvariable=self.email_var, width=40)
+        self.email_entry.grid(row=2, column=1, pady=5)
+
+        ttk.Checkbutton(
+            form,
+            text="Ativar verificação SSL (desmarque em redes corporativas com certificados próprios)",
+            variable=self.ssl_verify_var
+        ).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 15))
+
+        buttons = ttk.Frame(form, style='Card.TFrame')
+        buttons.grid(row=4, column=0, columnspan=2, sticky=tk.E)
+        ttk.Button(buttons, text="Cancelar", style='Secondary.TButton', command=self._on_cancel).pack(side=tk.RIGHT)
+        ttk.Button(buttons, text="OK", style='Primary.TButton', command=self._on_ok).pack(side=tk.RIGHT, padx=(0, 10))
+
+        self.bind("<Return>", lambda event: self._on_ok())
+        self.bind("<Escape>", lambda event: self._on_cancel())
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        self.name_entry.focus_set()
+
+    def show(self):
+        """
+        Show the form and wait until it is closed.
+
+        Returns:
+            Dict with name, email and ssl_verify, or None if cancelled
+        """
+        self.grab_set()
+        self.wait_window()
+        return self.result
+
+    def _on_ok(self):
+        """Accept the form once name and email are filled in."""
+        name = self.name_var.get().strip()
+        email = self.email_var.get().strip()
+        if not name:
+            self.name_entry.focus_set()
+            return
+        if not email:
+            self.email_entry.focus_set()
+            return
+
+        self.result = {
+            'name': name,
+            'email': email,
+            'ssl_verify': self.ssl_verify_var.get()
+        }
+        self.destroy()
 
-        lines.append("=" * 70)
-        return "\n".join(lines)
+    def _on_cancel(self):
+        """Close the form without a result."""
+        self.result = None
+        self.destroy()
 
 
 class DevStartGUI:
     """Main GUI application for dev-start."""
 
+    # How often the Tk thread checks whether a report save has finished
+    SAVE_POLL_MS = 50
+
     def __init__(self, root):
         self.root = root
         self.root.title("dev-start Technology Configurator")
@@ -157,6 +383,14 @@ class DevStartGUI:
         self.base_dir = Path.home() / 'dev-start-projects'
         self.base_dir.mkdir(exist_ok=True)
 
+        # Directory removals (with their retry sleeps) run here, off the install thread
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="devstart-io")
+        # Repositories are processed concurrently; each installer runs one install
+        # at a time, while different technologies download in parallel
+        self._install_locks = {}
+        # Technologies known to be installed during the current run
+        self._installed_technologies = set()
+
         # Installation report
         self.report = InstallationReport()
 
@@ -167,88 +401,99 @@ class DevStartGUI:
         self.stdout_redirector = LogRedirector(self.log_text, "stdout")
         self.stderr_redirector = LogRedirector(self.log_text, "stderr")
 
+    # ttk style options, applied in order by setup_styles
+    _STYLE_SPEC = (
+        ('.', {
+            'background': AppTheme.BACKGROUND,
+            'foreground': AppTheme.TEXT_DARK,
+            'fieldbackground': AppTheme.WHITE,
+        }),
+        # Buttons
+        ('Primary.TButton', {
+            'background': AppTheme.PRIMARY,
+            'foreground': AppTheme.WHITE,
+            'borderwidth': 0,
+            'focuscolor': 'none',
+            'padding': (20, 10),
+            'font': AppTheme.FONT_BUTTON,
+        }),
+        ('Secondary.TButton', {
+            'background': AppTheme.LIGHT_GRAY,
+            'foreground': AppTheme.TEXT_DARK,
+            'borderwidth': 1,
+            'padding': (15, 8),
+            'font': AppTheme.FONT_BODY,
+        }),
+        # Frames
+        ('TFrame', {
+            'background': AppTheme.BACKGROUND,
+        }),
+        ('Card.TFrame', {
+            'background': AppTheme.WHITE,
+            'relief': 'flat',
+            'borderwidth': 1,
+        }),
+        # Labels
+        ('TLabel', {
+            'background': AppTheme.BACKGROUND,
+            'foreground': AppTheme.TEXT_DARK,
+            'font': AppTheme.FONT_BODY,
+        }),
+        ('Title.TLabel', {
+            'background': AppTheme.PRIMARY,
+            'foreground': AppTheme.WHITE,
+            'font': AppTheme.FONT_TITLE,
+        }),
+        ('Subtitle.TLabel', {
+            'background': AppTheme.WHITE,
+            'foreground': AppTheme.TEXT_DARK,
+            'font': AppTheme.FONT_SUBTITLE,
+        }),
+        # LabelFrame
+        ('TLabelframe', {
+            'background': AppTheme.WHITE,
+            'foreground': AppTheme.TEXT_DARK,
+            'borderwidth': 0,
+            'relief': 'flat',
+        }),
+        ('TLabelframe.Label', {
+            'background': AppTheme.WHITE,
+            'foreground': AppTheme.PRIMARY,
+            'font': AppTheme.FONT_SUBTITLE,
+        }),
+        # Entry
+        ('TEntry', {
+            'fieldbackground': AppTheme.WHITE,
+            'foreground': AppTheme.TEXT_DARK,
+            'borderwidth': 1,
+        }),
+        # Progressbar
+        ('Primary.Horizontal.TProgressbar', {
+            'background': AppTheme.PRIMARY,
+            'troughcolor': AppTheme.LIGHT_GRAY,
+            'bordercolor': AppTheme.LIGHT_GRAY,
+            'lightcolor': AppTheme.PRIMARY,
+            'darkcolor': AppTheme.PRIMARY,
+        }),
+    )
+
+    # ttk state-dependent style options
+    _STYLE_MAP = (
+        ('Primary.TButton', {
+            'background': [('active', AppTheme.PRIMARY_DARK),
+                           ('pressed', AppTheme.PRIMARY_DARK)],
+        }),
+    )
+
     def setup_styles(self):
         """Setup custom application themed styles."""
         style = ttk.Style()
         style.theme_use('clam')
 
-        # Configure colors
-        style.configure('.',
-                       background=AppTheme.BACKGROUND,
-                       foreground=AppTheme.TEXT_DARK,
-                       fieldbackground=AppTheme.WHITE)
-
-        # Primary Button
-        style.configure('Primary.TButton',
-                       background=AppTheme.PRIMARY,
-                       foreground=AppTheme.WHITE,
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(20, 10),
-                       font=('Segoe UI', 10, 'bold'))
-
-        style.map('Primary.TButton',
-                 background=[('active', AppTheme.PRIMARY_DARK),
-                           ('pressed', AppTheme.PRIMARY_DARK)])
-
-        # Secondary Button
-        style.configure('Secondary.TButton',
-                       background=AppTheme.LIGHT_GRAY,
-                       foreground=AppTheme.TEXT_DARK,
-                       borderwidth=1,
-                       padding=(15, 8),
-                       font=('Segoe UI', 9))
-
-        # Frame styles
-        style.configure('TFrame',
-                       background=AppTheme.BACKGROUND)
-
-        style.configure('Card.TFrame',
-                       background=AppTheme.WHITE,
-                       relief='flat',
-                       borderwidth=1)
-
-        # Label styles
-        style.configure('TLabel',
-                       background=AppTheme.BACKGROUND,
-                       foreground=AppTheme.TEXT_DARK,
-                       font=('Segoe UI', 9))
-
-        style.configure('Title.TLabel',
-                       background=AppTheme.PRIMARY,
-                       foreground=AppTheme.WHITE,
-                       font=('Segoe UI', 18, 'bold'))
-
-        style.configure('Subtitle.TLabel',
-                       background=AppTheme.WHITE,
-                       foreground=AppTheme.TEXT_DARK,
-                       font=('Segoe UI', 11, 'bold'))
-
-        # LabelFrame
-        style.configure('TLabelframe',
-                       background=AppTheme.WHITE,
-                       foreground=AppTheme.TEXT_DARK,
-                       borderwidth=0,
-                       relief='flat')
-
-        style.configure('TLabelframe.Label',
-                       background=AppTheme.WHITE,
-                       foreground=AppTheme.PRIMARY,
-                       font=('Segoe UI', 11, 'bold'))
-
-        # Entry
-        style.configure('TEntry',
-                       fieldbackground=AppTheme.WHITE,
-                       foreground=AppTheme.TEXT_DARK,
-                       borderwidth=1)
-
-        # Progressbar
-        style.configure('Primary.Horizontal.TProgressbar',
-                       background=AppTheme.PRIMARY,
-                       troughcolor=AppTheme.LIGHT_GRAY,
-                       bordercolor=AppTheme.LIGHT_GRAY,
-                       lightcolor=AppTheme.PRIMARY,
-                       darkcolor=AppTheme.PRIMARY)
+        for name, options in self._STYLE_SPEC:
+            style.configure(name, **options)
+        for name, options in self._STYLE_MAP:
+            style.map(name, **options)
 
     def create_widgets(self):
         """Create UI widgets with application theme."""
@@ -353,7 +598,7 @@ class DevStartGUI:
             state=tk.NORMAL,
             bg=AppTheme.WHITE,
             fg=AppTheme.TEXT_DARK,
-            font=('Consolas', 9),
+            font=AppTheme.FONT_LOG,
             borderwidth=1,
             relief='solid'
         )
@@ -362,8 +607,8 @@ class DevStartGUI:
         # Configure tags for colored output
         self.log_text.tag_config("stdout", foreground=AppTheme.TEXT_DARK)
         self.log_text.tag_config("stderr", foreground=AppTheme.ERROR)
-        self.log_text.tag_config("success", foreground=AppTheme.SUCCESS, font=('Consolas', 9, 'bold'))
-        self.log_text.tag_config("error", foreground=AppTheme.ERROR, font=('Consolas', 9, 'bold'))
+        self.log_text.tag_config("success", foreground=AppTheme.SUCCESS, font=AppTheme.FONT_LOG_BOLD)
+        self.log_text.tag_config("error", foreground=AppTheme.ERROR, font=AppTheme.FONT_LOG_BOLD)
 
         # Progress bar with application styling
         self.progress = ttk.Progressbar(
@@ -382,7 +627,7 @@ class DevStartGUI:
             text="Pronto",
             bg=AppTheme.DARK_GRAY,
             fg=AppTheme.WHITE,
-            font=('Segoe UI', 9),
+            font=AppTheme.FONT_BODY,
             anchor=tk.W,
             padx=20
         )
@@ -433,26 +678,46 @@ class DevStartGUI:
         """Safely remove directory tree with retry logic for locked files."""
         for attempt in range(max_retries):
             try:
-                if os.path.exists(path):
-                    # First attempt: standard removal with error handler
-                    shutil.rmtree(path, onerror=self.remove_readonly)
-                    print(f"[OK] Removed existing directory: {path}")
+                # An empty directory needs no walk; a missing one is already gone
+                try:
+                    os.rmdir(path)
+                except FileNotFoundError:
                     return True
+                except OSError as e:
+                    if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                        raise
+                    _fast_rmtree(path)
+                print(f"[OK] Removed existing directory: {path}")
+                return True
             except PermissionError as e:
                 if attempt < max_retries - 1:
                     print(f"[WARN] Attempt {attempt + 1}/{max_retries}: Directory is locked, retrying in 1s...")
                     time.sleep(1)
                 else:
-                    print(f"[ERROR] Failed to remove directory after {max_retries} attempts")
-                    print(f"  Error: {e}")
-                    print(f"  Please close any programs using files in: {path}")
-                    print(f"  Then manually delete the directory and try again")
+                    print(
+                        f"[ERROR] Failed to remove directory after {max_retries} attempts\n"
+                        f"  Error: {e}\n"
+                        f"  Please close any programs using files in: {path}\n"
+                        "  Then manually delete the directory and try again"
+                    )
                     return False
             except Exception as e:
                 print(f"[ERROR] Error removing directory: {e}")
                 return False
         return False
 
+    def remove_async(self, path):
+        """
+        Remove a directory tree on the IO pool.
+
+        Args:
+            path: Directory to remove
+
+        Returns:
+            Future resolving to the safe_rmtree result
+        """
+        return self._io_pool.submit(self.safe_rmtree, str(path))
+
     def start_installation(self):
         """Start installation process in separate thread."""
         # Validate input
@@ -499,9 +764,7 @@ class DevStartGUI:
                 print(f"[OK] Proxy configured: {http_proxy}")
 
             # Check Git
-            print("\n" + "=" * 60)
-            print("Checking Git installation...")
-            print("=" * 60)
+            print(f"\n{_SEP60}\nChecking Git installation...\n{_SEP60}")
 
             git_installer = GitInstaller(self.base_dir, self.proxy_manager)
             if not git_installer.is_installed():
@@ -539,86 +802,55 @@ class DevStartGUI:
                             ssl_verify=git_config['ssl_verify']
                         )
 
-            # Process repositories
-            for repo_url in repo_urls:
-                try:
-                    print(f"\n{'=' * 60}")
-                    print(f"Processing: {repo_url}")
-                    print("=" * 60)
-
-                    # Clone repository
-                    repo_name = self.repo_manager.get_repo_name(repo_url)
-                    repo_path = self.base_dir / repo_name
-
-                    if repo_path.exists():
-                        print(f"[WARN] Repository already exists: {repo_path}")
-                        if not self.safe_rmtree(str(repo_path)):
-                            error = "Failed to remove existing repository (directory may be locked)"
-                            print(f"[ERROR] {error}")
-                            self.report.add_repository(repo_url, False, error=error)
-                            continue
-
-                    if not self.repo_manager.clone_repository(repo_url, repo_path):
-                        error = "Failed to clone repository"
-                        print(f"[ERROR] {error}")
-                        self.report.add_repository(repo_url, False, error=error)
-                        continue
-
-                    # Detect technology
-                    print("\nDetecting technology...")
-                    technology = self.detector.detect(repo_path)
-
-                    if technology == Technology.UNKNOWN:
-                        error = "Could not detect project technology"
-                        print(f"[ERROR] {error}")
-                        self.report.add_repository(repo_url, False, error=error)
-                        continue
-
-                    print(f"[OK] Detected: {technology.value}")
-
-                    # Install and configure
-                    installer = self._get_installer(technology, repo_path)
-                    if not installer:
-                        error = f"No installer available for {technology.value}"
-                        print(f"[ERROR] {error}")
-                        self.report.add_repository(repo_url, False, error=error)
-                        continue
-
-                    if not installer.is_installed():
-                        print(f"\nInstalling {technology.value}...")
-                        if not installer.install():
-                            error = "Installation failed"
-                            print(f"[ERROR] {error}")
-                            self.report.add_repository(repo_url, False, technology=technology, error=error)
-                            continue
-                        print(f"[OK] Installation completed")
-                    else:
-                        print(f"[OK] {technology.value} is already installed")
-
-                    print("\nConfiguring project...")
-                    if not installer.configure():
-                        error = "Configuration failed"
-                        print(f"[ERROR] {error}")
-                        self.report.add_repository(repo_url, False, technology=technology, error=error)
-                        continue
-
-                    print("[OK] Configuration completed")
-                    print(f"\n[OK] Project ready at: {repo_path}")
-                    self.report.add_repository(repo_url, True, technology=technology)
+            # Tools may have changed since the last run: check each technology again
+            self._installed_technologies = set()
 
-                except Exception as e:
-                    error = str(e)
-                    print(f"[ERROR] Error processing {repo_url}: {error}")
-                    self.report.add_repository(repo_url, False, error=error)
+            # Start removing existing checkouts now, so later repositories'
+            # directories are gone by the time their turn comes. URLs that share
+            # a checkout directory are grouped and handled in order by one task.
+            removals = {}
+            groups = {}
+            for index, repo_url in enumerate(repo_urls):
+                try:
+                    repo_path = self.base_dir / self.repo_manager.get_repo_name(repo_url)
+                except Exception:
+                    groups.setdefault(repo_url, []).append(index)  # Reported when processed
+                    continue
+                groups.setdefault(repo_path, []).append(index)
+                if repo_path not in removals and repo_path.exists():
+                    print(f"[WARN] Repository already exists: {repo_path}")
+                    removals[repo_path] = self.remove_async(repo_path)
+
+            # Process repositories in parallel (clones are network-bound and independent)
+            results = [None] * len(repo_urls)
+            with ThreadPoolExecutor(max_workers=max(1, min(DEFAULT_MAX_WORKERS, len(groups)))) as executor:
+                futures = {
+                    executor.submit(self._process_repo_group, [repo_urls[i] for i in group], removals): group
+                    for group in groups.values()
+                }
+                for future in as_completed(futures):
+                    group = futures[future]
+                    try:
+                        group_results = future.result()
+                    except Exception as e:
+                        group_results = [
+                            {'url': repo_urls[i], 'success': False, 'error': str(e)} for i in group
+                        ]
+                    for index, result in zip(group, group_results):
+                        results[index] = result
+
+            # Report in input order, however the tasks finished
+            for result in results:
+                self.report.add_repository(**result)
 
             # Finish
             self.report.end()
-            print("\n" + "=" * 60)
-            print("INSTALLATION COMPLETE")
-            print("=" * 60)
-            print(f"Successful: {len(self.report.successful)}")
-            print(f"Failed: {len(self.report.failed)}")
-            print(f"Duration: {self.report.get_duration()}")
+            print(
+                f"\n{_SEP60}\nINSTALLATION COMPLETE\n{_SEP60}\n"
+                f"Successful: {len(self.report.successful)}\n"
+                f"Failed: {len(self.report.failed)}\n"
+                f"Duration: {self.report.get_duration()}"
+            )
 
         finally:
             # Restore output
@@ -675,72 +907,145 @@ class DevStartGUI:
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
         )
         if filename:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(content)
-            messagebox.showinfo("Saved", f"Report saved to {filename}")
-
-    def _prompt_git_config(self):
-        """Prompt user for Git configuration."""
-        # Create a simple dialog using simpledialog
-        from tkinter import simpledialog
-
-        result = messagebox.askyesno(
-            "Configurar Git",
-            "Git precisa ser configurado com suas informações.\n\n"
-            "Deseja configurar agora?\n\n"
-            "(Nome e email são necessários para commits)"
-        )
-
-        if not result:
-            return None
-
-        # Get user name
-        name = simpledialog.askstring(
-            "Configuração Git - Nome",
-            "Digite seu nome completo:",
-            parent=self.root
-        )
-
-        if not name:
-            return None
-
-        # Get user email
-        email = simpledialog.askstring(
-            "Configuração Git - Email",
-            "Digite seu email:",
-            parent=self.root
-        )
-
-        if not email:
-            return None
+            # Write on the IO pool so a slow disk doesn't freeze the window
+            future = self._io_pool.submit(self._write_report, filename, content)
+            self.root.after(self.SAVE_POLL_MS, self._check_report_saved, future, filename)
+
+    @staticmethod
+    def _write_report(filename, content):
+        """Write report content to filename in one call."""
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def _check_report_saved(self, future, filename):
+        """Tell the user how the report save went once it finishes (Tk thread)."""
+        if not future.done():
+            self.root.after(self.SAVE_POLL_MS, self._check_report_saved, future, filename)
+            return
 
-        # Ask about SSL verification
-        ssl_verify = messagebox.askyesno(
-            "Configuração Git - SSL",
-            "Ativar verificação SSL?\n\n"
-            "Selecione 'Não' se estiver em uma rede corporativa\n"
-            "com certificados próprios.",
-            default=messagebox.YES
-        )
+        try:
+            future.result()
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save report: {e}")
+            return
+        messagebox.showinfo("Saved", f"Report saved to {filename}")
 
-        return {
-            'name': name,
-            'email': email,
-            'ssl_verify': ssl_verify
-        }
+    def _prompt_git_config(self):
+        """
+        Prompt user for Git configuration in a single form.
+
+        Returns:
+            Dict with name, email and ssl_verify, or None if the user cancelled
+        """
+        return _GitConfigDialog(self.root).show()
+
+    def _process_repo_group(self, repo_urls, removals):
+        """
+        Process repositories that share a checkout directory, in order.
+
+        Args:
+            repo_urls: Repository URLs mapping to the same directory
+            removals: Pending removal futures keyed by checkout directory
+
+        Returns:
+            List of keyword arguments for InstallationReport.add_repository
+        """
+        return [self._process_one_repo(repo_url, removals) for repo_url in repo_urls]
+
+    def _process_one_repo(self, repo_url, removals):
+        """
+        Clone, detect, install and configure a single repository.
+
+        Args:
+            repo_url: Repository URL
+            removals: Pending removal futures keyed by checkout directory
+
+        Returns:
+            Keyword arguments for InstallationReport.add_repository
+        """
+        try:
+            print(f"\n{_SEP60}\nProcessing: {repo_url}\n{_SEP60}")
+
+            # Clone repository
+            repo_name = self.repo_manager.get_repo_name(repo_url)
+            repo_path = self.base_dir / repo_name
+
+            removal = removals.pop(repo_path, None)
+            if removal is None and repo_path.exists():
+                print(f"[WARN] Repository already exists: {repo_path}")
+                removal = self.remove_async(repo_path)
+            if removal is not None and not removal.result():
+                error = "Failed to remove existing repository (directory may be locked)"
+                print(f"[ERROR] {error}")
+                return {'url': repo_url, 'success': False, 'error': error}
+
+            if not self.repo_manager.clone_repository(repo_url, repo_path):
+                error = "Failed to clone repository"
+                print(f"[ERROR] {error}")
+                return {'url': repo_url, 'success': False, 'error': error}
+
+            # Detect technology
+            print("\nDetecting technology...")
+            technology = self.detector.detect(repo_path)
+
+            if technology == Technology.UNKNOWN:
+                error = "Could not detect project technology"
+                print(f"[ERROR] {error}")
+                return {'url': repo_url, 'success': False, 'error': error}
+
+            print(f"[OK] Detected: {technology.value}")
+
+            # Install and configure
+            installer = self._get_installer(technology, repo_path)
+            if not installer:
+                error = f"No installer available for {technology.value}"
+                print(f"[ERROR] {error}")
+                return {'url': repo_url, 'success': False, 'error': error}
+
+            # One install per installer at a time. Once a technology is known to be
+            # installed, later repositories skip the check.
+            with self._install_locks.setdefault(type(installer), threading.Lock()):
+                if technology in self._installed_technologies or installer.is_installed():
+                    print(f"[OK] {technology.value} is already installed")
+                else:
+                    print(f"\nInstalling {technology.value}...")
+                    if not installer.install():
+                        error = "Installation failed"
+                        print(f"[ERROR] {error}")
+                        return {'url': repo_url, 'success': False, 'technology': technology, 'error': error}
+                    print(f"[OK] Installation completed")
+                self._installed_technologies.add(technology)
+
+            # Configure runs concurrently across repositories; installers
+            # serialize any shared-tool setup they do here (e.g. Maven bootstrap)
+            print("\nConfiguring project...")
+            if not installer.configure():
+                error = "Configuration failed"
+                print(f"[ERROR] {error}")
+                return {'url': repo_url, 'success': False, 'technology': technology, 'error': error}
+
+            print(f"[OK] Configuration completed\n\n[OK] Project ready at: {repo_path}")
+            return {'url': repo_url, 'success': True, 'technology': technology}
+
+        except Exception as e:
+            error = str(e)
+            print(f"[ERROR] Error processing {repo_url}: {error}")
+            return {'url': repo_url, 'success': False, 'error': error}
 
     def _get_installer(self, technology: Technology, repo_path: Path):
-        """Get appropriate installer for technology."""
-        installers = {
-            Technology.JAVA_SPRINGBOOT: JavaInstaller,
-            Technology.PYTHON: PythonInstaller,
-            Technology.NODEJS: NodeJSInstaller
-        }
-
-        installer_class = installers.get(technology)
-        if installer_class:
-            return installer_class(repo_path, self.proxy_manager)
-        return None
+        """Get appropriate installer for technology.
+
+        Installer modules are imported on first use, not when the window opens.
+        """
+        if technology == Technology.JAVA_SPRINGBOOT:
+            from .installers.java_installer import JavaInstaller as installer_class
+        elif technology == Technology.PYTHON:
+            from .installers.python_installer import PythonInstaller as installer_class
+        elif technology == Technology.NODEJS:
+            from .installers.nodejs_installer import NodeJSInstaller as installer_class
+        else:
+            return None
+        return installer_class(repo_path, self.proxy_manager)
 
 
 def main():
@@ -1,18 +1,35 @@
 """Base installer class."""
 import hashlib
+import mmap
 import os
+import shutil
+import stat
+import struct
 import subprocess
+import sys
+import threading
 import zipfile
+import zlib
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 
 import requests
+import urllib3
 
 from ..constants import (
     DOWNLOAD_TIMEOUT,
     BUILD_TIMEOUT,
+    BUILD_OUTPUT_TAIL_LINES,
+    COMMAND_TIMEOUT,
+    MIRROR_PROBE_TIMEOUT,
     DOWNLOAD_CHUNK_SIZE,
+    EXTRACT_WORKERS,
+    MAX_DOWNLOAD_RETRIES,
+    PARALLEL_DOWNLOAD_MIN_SIZE,
+    PARALLEL_DOWNLOAD_PARTS,
     DOWNLOAD_CHECKSUMS,
 )
 from ..exceptions import (
@@ -26,6 +43,137 @@ from ..env_manager import EnvironmentManager
 
 logger = get_logger(__name__)
 
+# Characters Windows does not allow in file names, replaced as ZipFile.extract does
+_WINDOWS_ILLEGAL_CHARS = str.maketrans(':<>|"?*', '_______')
+
+# Compressed bytes handed to zlib per call; small enough that leftover input
+# is cheap to carry over when an output block fills up
+_INFLATE_INPUT_SIZE = 64 * 1024
+
+
+def _member_path(extract_dir: Path, name: str) -> Optional[Path]:
+    """
+    Map an archive member name to a path inside extract_dir.
+
+    Follows ZipFile.extract: drive letters, absolute roots and '.'/'..'
+    components are dropped so a member can never land outside extract_dir.
+
+    Args:
+        extract_dir: Directory being extracted into
+        name: Member name from the archive
+
+    Returns:
+        Target path, or None if nothing is left of the name
+    """
+    arcname = name.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+
+    parts = [part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
+    if os.name == 'nt':
+        parts = [part.translate(_WINDOWS_ILLEGAL_CHARS).rstrip('.') for part in parts]
+        parts = [part for part in parts if part]
+
+    return extract_dir.joinpath(*parts) if parts else None
+
+
+def _inflate_member(archive_view: memoryview, info: zipfile.ZipInfo, dest) -> bool:
+    """
+    Write a stored or deflated member straight from a mapped archive.
+
+    Uses the offsets zipfile already read from the central directory and
+    feeds zlib slices of the mapping, skipping ZipExtFile's buffering. The
+    CRC-32 and size are checked as ZipFile.open would.
+
+    Args:
+        archive_view: memoryview over the whole mapped archive
+        info: Member to extract
+        dest: Binary file object to write to
+
+    Returns:
+        False, without writing anything, if the member needs ZipFile.open
+        (encrypted or another compression method)
+
+    Raises:
+        zipfile.BadZipFile: If the member data is truncated or corrupt
+    """
+    if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+        return False
+
+    offset = info.header_offset
+    if archive_view[offset:offset + 4] != b'PK\x03\x04':
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename!r}")
+    name_length, extra_length = struct.unpack_from('<HH', archive_view, offset + 26)
+    start = offset + 30 + name_length + extra_length
+    end = start + info.compress_size
+    if end > len(archive_view):
+        raise zipfile.BadZipFile(f"Truncated data for {info.filename!r}")
+
+    crc = 0
+    size = 0
+    try:
+        with archive_view[start:end] as data:
+            if info.compress_type == zipfile.ZIP_STORED:
+                for pos in range(0, len(data), DOWNLOAD_CHUNK_SIZE):
+                    with data[pos:pos + DOWNLOAD_CHUNK_SIZE] as block:
+                        dest.write(block)
+                        crc = zlib.crc32(block, crc)
+                        size += len(block)
+            else:
+                inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+                for pos in range(0, len(data), _INFLATE_INPUT_SIZE):
+                    with data[pos:pos + _INFLATE_INPUT_SIZE] as chunk:
+                        block = inflater.decompress(chunk, DOWNLOAD_CHUNK_SIZE)
+                    while True:
+                        dest.write(block)
+                        crc = zlib.crc32(block, crc)
+                        size += len(block)
+                        if not inflater.unconsumed_tail:
+                            break
+                        block = inflater.decompress(inflater.unconsumed_tail, DOWNLOAD_CHUNK_SIZE)
+                    if inflater.eof:
+                        break
+                block = inflater.flush()
+                dest.write(block)
+                crc = zlib.crc32(block, crc)
+                size += len(block)
+    except zlib.error as e:
+        raise zipfile.BadZipFile(f"Corrupt data for {info.filename!r}: {e}") from e
+
+    if crc != info.CRC or size != info.file_size:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+    return True
+
+
+class HashingWriter:
+    """File wrapper that hashes and counts bytes as they are written.
+
+    With hash_content=False only the byte count is kept and sha256 is None.
+    """
+
+    def __init__(self, file, total_size: int = 0, hash_content: bool = True):
+        self.file = file
+        self.total_size = total_size
+        self.written = 0
+        self.sha256 = hashlib.sha256() if hash_content else None
+        self._next_progress = 10
+
+    def write(self, data: bytes) -> int:
+        """Write data to the file, updating the hash and progress."""
+        if self.sha256 is not None:
+            self.sha256.update(data)
+        self.written += len(data)
+
+        # Progress reporting for large files (every 10%)
+        if self.total_size > 0:
+            percent = (self.written / self.total_size) * 100
+            if percent >= self._next_progress:
+                logger.debug(f"Download progress: {percent:.1f}%")
+                self._next_progress = (int(percent) // 10 + 1) * 10
+
+        return self.file.write(data)
+
 
 class BaseInstaller(ABC):
     """Abstract base class for technology installers."""
@@ -72,38 +220,45 @@ class BaseInstaller(ABC):
             proxies = self.proxy_manager.get_proxy_dict()
 
             logger.progress(f"Downloading from {url}...")
-            response = requests.get(
-                url,
-                proxies=proxies,
-                stream=True,
-                timeout=DOWNLOAD_TIMEOUT
-            )
-            response.raise_for_status()
-
             destination.parent.mkdir(parents=True, exist_ok=True)
-
-            # Calculate file size for progress reporting
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-
-            # Hash for checksum verification
-            sha256_hash = hashlib.sha256()
-
-            with open(destination, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
-                    f.write(chunk)
-                    sha256_hash.update(chunk)
-                    downloaded += len(chunk)
-
-                    # Progress reporting for large files
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        if downloaded % (DOWNLOAD_CHUNK_SIZE * 100) == 0:  # Every 800KB
-                            logger.debug(f"Download progress: {percent:.1f}%")
+            part_path = self._part_path(destination)
+
+            # A partial file from an earlier attempt is resumed as a single stream
+            response = None
+            in_parts = False
+            if not part_path.is_file():
+                response = self._open_download(url, proxies)
+                total_size = int(response.headers.get('content-length', 0))
+                in_parts = self._can_download_in_parts(response, total_size)
+
+            try:
+                if in_parts:
+                    try:
+                        self._download_in_parts(response, destination, total_size, proxies)
+                    except (DownloadError, requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+                        logger.warning("Parallel download failed, retrying as a single stream", details=str(e))
+                        in_parts = False
+                        response.close()
+                        response = None
+
+                if not in_parts:
+                    # The stream helper owns (and closes) the response from here on
+                    streamed, response = response, None
+                    streamed_checksum = self._stream_download(
+                        url, destination, proxies, streamed, hash_content=bool(expected_checksum)
+                    )
+            finally:
+                # Hand the connection back to the session's pool, even on errors
+                if response is not None:
+                    response.close()
 
             # Verify checksum if provided
             if expected_checksum:
-                actual_checksum = sha256_hash.hexdigest()
+                # Parts arrive out of order and resumed files only hash the tail,
+                # so those files are hashed once complete
+                actual_checksum = None if in_parts else streamed_checksum
+                if actual_checksum is None:
+                    actual_checksum = self._file_sha256(destination)
                 if actual_checksum.lower() != expected_checksum.lower():
                     destination.unlink(missing_ok=True)
                     logger.error(
@@ -128,10 +283,276 @@ class BaseInstaller(ABC):
         except requests.exceptions.RequestException as e:
             logger.error(f"Error downloading file", details=str(e))
             return False
+        except urllib3.exceptions.HTTPError as e:
+            logger.error(f"Connection error during download", details=str(e))
+            return False
         except IOError as e:
             logger.error(f"Error saving file to {destination}", details=str(e))
             return False
 
+    def _open_download(self, url: str, proxies: Dict[str, str], offset: int = 0) -> requests.Response:
+        """Start a streamed GET on the shared session, raising for HTTP errors.
+
+        A non-zero offset requests the rest of the file from that byte on.
+        """
+        kwargs = {'headers': {'Range': f'bytes={offset}-'}} if offset else {}
+        response = self.proxy_manager.session.get(
+            url,
+            proxies=proxies,
+            stream=True,
+            timeout=DOWNLOAD_TIMEOUT,
+            **kwargs
+        )
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        return response
+
+    @staticmethod
+    def _part_path(destination: Path) -> Path:
+        """Path a single-stream download is written to until it completes."""
+        return destination.with_name(destination.name + '.part')
+
+    def _stream_download(self, url: str, destination: Path, proxies: Dict[str, str],
+                         response: Optional[requests.Response], hash_content: bool) -> Optional[str]:
+        """
+        Stream a download into a .part file, resuming with HTTP Range requests.
+
+        A .part file left by an earlier run is continued instead of restarted,
+        and a body that breaks off mid-stream is resumed up to
+        MAX_DOWNLOAD_RETRIES times. The finished file is renamed to destination.
+        Bodies sent with a Content-Encoding are decoded on the way to disk, so
+        their offsets cannot be resumed and they always restart.
+
+        Args:
+            url: URL to download from
+            destination: Path to save the file
+            proxies: Proxy configuration
+            response: Response already open for the whole file, or None
+            hash_content: Whether to compute the SHA256 while streaming
+
+        Returns:
+            SHA256 hex digest of the whole file if it was computed on the way,
+            otherwise None (the file was resumed or hashing was off)
+        """
+        part_path = self._part_path(destination)
+        interruptions = 0
+
+        while True:
+            offset = part_path.stat().st_size if part_path.is_file() else 0
+            if response is None:
+                try:
+                    response = self._open_download(url, proxies, offset)
+                except requests.exceptions.HTTPError as e:
+                    # 416: the partial file does not fit the remote one; start over
+                    if offset and e.response is not None and e.response.status_code == 416:
+                        part_path.unlink()
+                        continue
+                    raise
+
+            try:
+                encoded = response.headers.get('content-encoding', 'identity').lower() != 'identity'
+                resumed = (
+                    offset > 0
+                    and response.status_code == 206
+                    and response.headers.get('content-range', '').startswith(f'bytes {offset}-')
+                )
+                if resumed and encoded:
+                    part_path.unlink()
+                    continue
+
+                total_size = int(response.headers.get('content-length', 0))
+                response.raw.decode_content = True
+                with open(part_path, 'ab' if resumed else 'wb') as f:
+                    writer = HashingWriter(f, total_size, hash_content=hash_content and not resumed)
+                    self._copy_stream(response.raw, writer)
+                break
+            except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+                interruptions += 1
+                if encoded or interruptions > MAX_DOWNLOAD_RETRIES:
+                    if encoded:
+                        part_path.unlink(missing_ok=True)
+                    raise
+                logger.warning("Download interrupted, resuming", details=str(e))
+            finally:
+                response.close()
+                response = None
+
+        os.replace(part_path, destination)
+        return writer.sha256.hexdigest() if writer.sha256 is not None else None
+
+    @staticmethod
+    def _can_download_in_parts(response: requests.Response, total_size: int) -> bool:
+        """Check whether a large, unencoded response can be fetched as byte ranges."""
+        return (
+            total_size >= PARALLEL_DOWNLOAD_MIN_SIZE
+            and response.headers.get('accept-ranges', '').lower() == 'bytes'
+            and response.headers.get('content-encoding', 'identity').lower() == 'identity'
+        )
+
+    def _download_in_parts(self, response: requests.Response, destination: Path,
+                           total_size: int, proxies: Dict[str, str]) -> None:
+        """
+        Download a file as parallel HTTP Range requests.
+
+        The response already open supplies the first part while the others are
+        fetched concurrently, each written at its own offset.
+
+        Args:
+            response: Open streamed response for the whole file
+            destination: Path to save the file
+            total_size: File size from Content-Length
+            proxies: Proxy configuration for the range requests
+
+        Raises:
+            DownloadError: If the server ignores a range request or a part ends early
+        """
+        part_size = -(-total_size // PARALLEL_DOWNLOAD_PARTS)
+        with open(destination, 'wb') as f:
+            f.truncate(total_size)
+
+        def copy_part(source, offset: int, length: int) -> None:
+            with open(destination, 'r+b') as f:
+                f.seek(offset)
+                remaining = length
+                while remaining > 0:
+                    chunk = source.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise DownloadError(response.url, f"Part at offset {offset} ended {remaining} bytes early")
+                    f.write(chunk)
+                    remaining -= len(chunk)
+
+        def fetch_part(start: int) -> None:
+            end = min(start + part_size, total_size) - 1
+            # The final URL, so redirects (e.g. GitHub release assets) are not repeated
+            part = self.proxy_manager.session.get(
+                response.url,
+                headers={'Range': f'bytes={start}-{end}'},
+                proxies=proxies,
+                stream=True,
+                timeout=DOWNLOAD_TIMEOUT
+            )
+            try:
+                part.raise_for_status()
+                if part.status_code != 206:
+                    raise DownloadError(response.url, f"Server ignored the range request (HTTP {part.status_code})")
+                copy_part(part.raw, start, end - start + 1)
+            finally:
+                part.close()
+
+        with ThreadPoolExecutor(max_workers=PARALLEL_DOWNLOAD_PARTS - 1) as executor:
+            futures = [executor.submit(fetch_part, start) for start in range(part_size, total_size, part_size)]
+            copy_part(response.raw, 0, part_size)
+            for future in futures:
+                future.result()
+
+    @classmethod
+    def _is_cached_download(cls, path: Path, expected_checksum: Optional[str]) -> bool:
+        """
+        Check whether a file already on disk matches the expected checksum.
+
+        Without a checksum there is no way to tell a complete file from a
+        truncated one, so it is never reused.
+
+        Args:
+            path: Previously downloaded file
+            expected_checksum: Expected SHA256 checksum
+
+        Returns:
+            True if the file exists and its SHA256 matches
+        """
+        if not expected_checksum or not path.is_file():
+            return False
+        try:
+            return cls._file_sha256(path).lower() == expected_checksum.lower()
+        except OSError as e:
+            logger.debug(f"Could not hash {path}: {e}")
+            return False
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        """Compute the SHA-256 hex digest of a file."""
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as f:
+            BaseInstaller._copy_stream(f, sha256)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def _copy_stream(source, sink) -> None:
+        """
+        Copy a binary stream into a sink through a single reusable buffer.
+
+        Each block is handed to ``sink.update`` (hash objects) or ``sink.write``
+        as a memoryview slice, so no new bytes object is created per chunk.
+
+        Args:
+            source: Readable object supporting readinto
+            sink: Hash object or writable file-like object
+        """
+        consume = sink.update if hasattr(sink, 'update') else sink.write
+        buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+        with memoryview(buffer) as view:
+            while True:
+                count = source.readinto(view)
+                if not count:
+                    break
+                consume(view[:count])
+
+    def rank_mirrors(self, urls: List[str]) -> List[str]:
+        """
+        Put the mirror that answers a HEAD request first.
+
+        Mirrors are probed in parallel and the ranking is decided by the first
+        successful answer, without waiting for slower mirrors. The other mirrors
+        keep their original order as fallbacks, with ones already known to be
+        unreachable moved to the end.
+
+        Args:
+            urls: Candidate download URLs for the same file
+
+        Returns:
+            URLs with the fastest responder first
+        """
+        if len(urls) < 2:
+            return list(urls)
+
+        proxies = self.proxy_manager.get_proxy_dict()
+
+        def probe(url: str) -> bool:
+            try:
+                response = requests.head(
+                    url,
+                    proxies=proxies,
+                    timeout=MIRROR_PROBE_TIMEOUT,
+                    allow_redirects=True
+                )
+                return response.ok
+            except requests.exceptions.RequestException:
+                return False
+
+        executor = ThreadPoolExecutor(max_workers=len(urls))
+        futures = {executor.submit(probe, url): index for index, url in enumerate(urls)}
+        fastest = None
+        try:
+            for future in as_completed(futures):
+                if future.result():
+                    fastest = futures[future]
+                    break
+            # Mirrors that have already failed go to the back
+            failed = {index for future, index in futures.items() if future.done() and not future.result()}
+        finally:
+            # Slower probes finish on their own within MIRROR_PROBE_TIMEOUT
+            executor.shutdown(wait=False)
+
+        first = [fastest] if fastest is not None else []
+        pending = [index for index in range(len(urls)) if index != fastest and index not in failed]
+        ordered = [urls[index] for index in first + pending + sorted(failed)]
+
+        logger.debug(f"Mirror order: {ordered}")
+        return ordered
+
     def download_and_extract(self, url: str, extract_dir: Path,
                              expected_checksum: Optional[str] = None,
                              cleanup_zip: bool = True) -> Tuple[bool, Optional[Path]]:
@@ -150,8 +571,10 @@ class BaseInstaller(ABC):
         zip_filename = url.split('/')[-1]
         zip_path = extract_dir / zip_filename
 
-        # Download
-        if not self.download_file(url, zip_path, expected_checksum):
+        # Download, unless a verified copy is left over from an earlier run
+        if self._is_cached_download(zip_path, expected_checksum):
+            logger.info(f"Using previously downloaded {zip_filename}")
+        elif not self.download_file(url, zip_path, expected_checksum):
             return False, None
 
         # Extract
@@ -161,23 +584,29 @@ class BaseInstaller(ABC):
             extract_dir.mkdir(parents=True, exist_ok=True)
 
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Get the root directory in the archive (if any)
-                namelist = zip_ref.namelist()
-                root_dirs = set()
-                for name in namelist:
-                    parts = name.split('/')
-                    if len(parts) > 1:
-                        root_dirs.add(parts[0])
-
-                zip_ref.extractall(extract_dir)
+                # Get the root directory in the archive (if any), stopping at
+                # the second distinct one
+                root_dir = None
+                for name in zip_ref.namelist():
+                    root, sep, _ = name.partition('/')
+                    if not sep:
+                        continue
+                    if root_dir is None:
+                        root_dir = root
+                    elif root != root_dir:
+                        root_dir = None
+                        break
+
+                if not self._extract_with_tar(zip_path, extract_dir):
+                    self._extract_members(zip_path, zip_ref.infolist(), extract_dir)
 
             if cleanup_zip:
                 zip_path.unlink()
 
             # Find the extracted directory
             extracted_path = None
-            if len(root_dirs) == 1:
-                potential_dir = extract_dir / list(root_dirs)[0]
+            if root_dir is not None:
+                potential_dir = extract_dir / root_dir
                 if potential_dir.is_dir():
                     extracted_path = potential_dir
 
@@ -195,6 +624,111 @@ class BaseInstaller(ABC):
             logger.error(f"Error extracting archive", details=str(e))
             return False, None
 
+    @staticmethod
+    def _extract_with_tar(zip_path: Path, extract_dir: Path) -> bool:
+        """
+        Extract an archive with the tar.exe shipped in Windows 10 (1803+).
+
+        Its native inflate is considerably faster than zipfile's, and like
+        zipfile it refuses absolute and ".." member paths.
+
+        Args:
+            zip_path: Path to the archive
+            extract_dir: Directory to extract to
+
+        Returns:
+            True if tar extracted the archive, False to fall back to zipfile
+        """
+        if sys.platform != 'win32':
+            return False
+
+        # Use the system bsdtar explicitly; a GNU tar earlier on PATH cannot read ZIPs
+        tar = Path(os.environ.get('SystemRoot', r'C:\Windows')) / 'System32' / 'tar.exe'
+        if not tar.is_file():
+            return False
+
+        try:
+            result = subprocess.run(
+                [str(tar), '-xf', str(zip_path), '-C', str(extract_dir)],
+                capture_output=True,
+                text=True,
+                timeout=COMMAND_TIMEOUT
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"tar extraction unavailable: {e}")
+            return False
+
+        if result.returncode != 0:
+            logger.debug(f"tar extraction failed, using zipfile: {result.stderr.strip()}")
+            return False
+        return True
+
+    @staticmethod
+    def _extract_members(zip_path: Path, infos: List[zipfile.ZipInfo], extract_dir: Path) -> None:
+        """
+        Extract archive members in parallel, copying file contents in large blocks.
+
+        Directories are created first; files are then written concurrently,
+        inflated straight from a read-only mapping of the archive. Members
+        zlib cannot handle alone fall back to a per-thread ZipFile handle.
+        Unix permission bits stored in the archive are applied to the
+        extracted files.
+
+        Args:
+            zip_path: Path to the archive
+            infos: Members to extract
+            extract_dir: Directory to extract to
+        """
+        # Later members with the same name win, as with ZipFile.extractall
+        files = {}
+        for info in infos:
+            target = _member_path(extract_dir, info.filename)
+            if target is None:
+                continue
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                files[target] = info
+
+        if not files:
+            return
+
+        local = threading.local()
+        archives = []
+
+        def open_member(info: zipfile.ZipInfo):
+            archive = getattr(local, 'archive', None)
+            if archive is None:
+                archive = local.archive = zipfile.ZipFile(zip_path)
+                archives.append(archive)
+            return archive.open(info)
+
+        def extract(item: Tuple[Path, zipfile.ZipInfo]) -> None:
+            target, info = item
+            with open(target, 'wb') as dest:
+                if not _inflate_member(archive_view, info, dest):
+                    with open_member(info) as source:
+                        shutil.copyfileobj(source, dest, DOWNLOAD_CHUNK_SIZE)
+
+            # Keep Unix permissions (e.g. executable launcher scripts), but never
+            # drop owner write so a later run can overwrite or remove the file
+            mode = (info.external_attr >> 16) & 0o777
+            if mode and os.name != 'nt':
+                os.chmod(target, mode | stat.S_IWUSR)
+
+        with open(zip_path, 'rb') as handle, \
+                mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            archive_view = memoryview(mapped)
+            try:
+                with ThreadPoolExecutor(max_workers=min(EXTRACT_WORKERS, len(files))) as executor:
+                    for _ in executor.map(extract, files.items()):
+                        pass
+            finally:
+                archive_view.release()
+                for archive in archives:
+                    archive.close()
+
     def add_to_current_path(self, path: str) -> None:
         """
         Add a path to the current process PATH environment variable.
@@ -202,13 +736,14 @@ class BaseInstaller(ABC):
         Args:
             path: Path to add to PATH
         """
-        if 'PATH' in os.environ:
-            if path not in os.environ['PATH']:
-                os.environ['PATH'] = f"{path}{os.pathsep}{os.environ['PATH']}"
-                logger.debug(f"Added to current PATH: {path}")
-        else:
-            os.environ['PATH'] = path
-            logger.debug(f"Set PATH to: {path}")
+        with EnvironmentManager.path_lock:
+            if 'PATH' in os.environ:
+                if not EnvironmentManager.path_contains(os.environ['PATH'], path):
+                    os.environ['PATH'] = f"{path}{os.pathsep}{os.environ['PATH']}"
+                    logger.debug(f"Added to current PATH: {path}")
+            else:
+                os.environ['PATH'] = path
+                logger.debug(f"Set PATH to: {path}")
 
     def set_current_env(self, name: str, value: str) -> None:
         """
@@ -236,14 +771,37 @@ class BaseInstaller(ABC):
         self.set_current_env(home_var, home_path)
         self.add_to_current_path(bin_path)
 
-        # Set for persistence
-        self.env_manager.append_to_env(home_var, home_path)
-        self.env_manager.set_system_path(bin_path)
+        # Set for persistence: one .env write, registry session and broadcast
+        self.env_manager.persist_tool_environment({home_var: home_path}, [bin_path])
 
         logger.success(f"{tool_name} environment configured")
         logger.info(f"  {home_var}: {home_path}")
         logger.info(f"  PATH: {bin_path} (added)")
 
+    def _command_env(self) -> Optional[Dict[str, str]]:
+        """
+        Build the environment for child processes.
+
+        ProxyManager.set_proxy already exports the proxies to os.environ, so the
+        environment is normally inherited as is and only copied when a proxy
+        setting is missing from it.
+
+        Returns:
+            Environment mapping, or None to inherit os.environ
+        """
+        overrides = {}
+        if self.proxy_manager.http_proxy and os.environ.get('HTTP_PROXY') != self.proxy_manager.http_proxy:
+            overrides['HTTP_PROXY'] = self.proxy_manager.http_proxy
+        if self.proxy_manager.https_proxy and os.environ.get('HTTPS_PROXY') != self.proxy_manager.https_proxy:
+            overrides['HTTPS_PROXY'] = self.proxy_manager.https_proxy
+
+        if not overrides:
+            return None
+
+        env = os.environ.copy()
+        env.update(overrides)
+        return env
+
     def run_command(self, command: List[str], cwd: Optional[Path] = None,
                     timeout: Optional[int] = None) -> Tuple[bool, str]:
         """
@@ -261,11 +819,7 @@ class BaseInstaller(ABC):
             timeout = BUILD_TIMEOUT
 
         try:
-            env = os.environ.copy()
-            if self.proxy_manager.http_proxy:
-                env['HTTP_PROXY'] = self.proxy_manager.http_proxy
-            if self.proxy_manager.https_proxy:
-                env['HTTPS_PROXY'] = self.proxy_manager.https_proxy
+            env = self._command_env()
 
             logger.debug(f"Running command: {' '.join(command)}")
 
@@ -299,6 +853,83 @@ class BaseInstaller(ABC):
             logger.error(f"Error running command")
             return False, str(e)
 
+    def run_streaming_command(self, command: List[str], cwd: Optional[Path] = None,
+                              timeout: Optional[int] = None,
+                              tail_lines: int = BUILD_OUTPUT_TAIL_LINES) -> Tuple[bool, str]:
+        """
+        Run a long, chatty command, showing its output as it arrives.
+
+        stdout and stderr are merged and read line by line. Each line is
+        prefixed with the project name so builds running in parallel stay
+        distinguishable. Only the last tail_lines lines are kept, so a
+        multi-megabyte build log is never held in memory.
+
+        Args:
+            command: Command and arguments as a list
+            cwd: Working directory (defaults to project_path)
+            timeout: Timeout in seconds (defaults to BUILD_TIMEOUT)
+            tail_lines: Number of trailing output lines to return
+
+        Returns:
+            Tuple of (success, last lines of output)
+        """
+        if timeout is None:
+            timeout = BUILD_TIMEOUT
+
+        logger.debug(f"Running command: {' '.join(command)}")
+
+        try:
+            process = subprocess.Popen(
+                command,
+                cwd=cwd or self.project_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors='replace',
+                bufsize=1,
+                env=self._command_env()
+            )
+        except FileNotFoundError as e:
+            logger.error(f"Command not found: {command[0]}")
+            return False, str(e)
+        except PermissionError as e:
+            logger.error(f"Permission denied running command")
+            return False, str(e)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error(f"Error running command")
+            return False, str(e)
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.daemon = True
+        timer.start()
+
+        prefix = f"[{self.project_path.name}] "
+        tail = deque(maxlen=tail_lines)
+        try:
+            for line in process.stdout:
+                line = line.rstrip('\r\n')
+                logger.output(prefix + line)
+                tail.append(line)
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+            process.stdout.close()
+
+        if timed_out.is_set():
+            logger.error(f"Command timed out after {timeout}s")
+            return False, f"Command timed out after {timeout} seconds"
+
+        if returncode != 0:
+            logger.debug(f"Command failed with code {returncode}")
+
+        return returncode == 0, '\n'.join(tail)
+
     def find_executable(self, name: str, search_paths: Optional[List[Path]] = None) -> Optional[str]:
         """
         Find an executable in PATH or specified paths.
@@ -310,8 +941,6 @@ class BaseInstaller(ABC):
         Returns:
             Full path to executable, or None if not found
         """
-        import shutil
-
         # Try additional search paths first (for just-installed tools)
         if search_paths:
             for search_path in search_paths:
@@ -12,6 +12,7 @@ from ..constants import (
     get_tools_dir,
 )
 from ..logger import get_logger
+from ..proxy_manager import ProxyManager
 
 logger = get_logger(__name__)
 
@@ -19,29 +20,21 @@ logger = get_logger(__name__)
 class GitInstaller(BaseInstaller):
     """Installer for Git."""
 
-    def detect_version(self) -> Optional[str]:
-        """Get current Git version if installed."""
-        if self.is_installed():
-            try:
-                result = subprocess.run(
-                    ['git', '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=GIT_TIMEOUT
-                )
-                if result.returncode == 0:
-                    # Output format: "git version 2.43.0.windows.1"
-                    return result.stdout.strip().split()[-1]
-            except subprocess.TimeoutExpired:
-                logger.warning("Git version check timed out")
-            except FileNotFoundError:
-                pass
-            except subprocess.SubprocessError as e:
-                logger.debug(f"Error getting git version: {e}")
-        return None
-
-    def is_installed(self) -> bool:
-        """Check if Git is installed and accessible."""
+    def __init__(self, project_path: Path, proxy_manager: ProxyManager):
+        super().__init__(project_path, proxy_manager)
+        # Output of `git --version`, run at most once until invalidate()
+        self._version_output: Optional[str] = None
+        self._version_checked = False
+
+    def _check_version(self) -> Optional[str]:
+        """Run `git --version` once and remember its output (None if Git is unavailable)."""
+        if not self._version_checked:
+            self._version_output = self._run_version_command()
+            self._version_checked = True
+        return self._version_output
+
+    def _run_version_command(self) -> Optional[str]:
+        """Run `git --version`, returning its output or None on failure."""
         try:
             result = subprocess.run(
                 ['git', '--version'],
@@ -49,9 +42,32 @@ class GitInstaller(BaseInstaller):
                 text=True,
                 timeout=GIT_TIMEOUT
             )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+            if result.returncode == 0:
+                return result.stdout.strip()
+        except subprocess.TimeoutExpired:
+            logger.warning("Git version check timed out")
+        except FileNotFoundError:
+            pass
+        except subprocess.SubprocessError as e:
+            logger.debug(f"Error getting git version: {e}")
+        return None
+
+    def invalidate(self) -> None:
+        """Forget the cached Git check, e.g. after Git was installed or PATH changed."""
+        self._version_output = None
+        self._version_checked = False
+
+    def detect_version(self) -> Optional[str]:
+        """Get current Git version if installed."""
+        output = self._check_version()
+        if output:
+            # Output format: "git version 2.43.0.windows.1"
+            return output.split()[-1]
+        return None
+
+    def is_installed(self) -> bool:
+        """Check if Git is installed and accessible."""
+        return self._check_version() is not None
 
     def install(self) -> bool:
         """Install Git for Windows."""
@@ -108,6 +124,8 @@ class GitInstaller(BaseInstaller):
 
         # Use base class method to setup environment
         self.setup_tool_environment('GIT', git_home, git_path)
+        # PATH changed: the next check must look again
+        self.invalidate()
 
     def configure(self, user_name: str = None, user_email: str = None, ssl_verify: bool = True) -> bool:
         """Configure Git (basic setup)."""
@@ -158,19 +176,21 @@ class GitInstaller(BaseInstaller):
     def _is_git_configured(self) -> bool:
         """Check if Git is already configured with user name and email."""
         try:
-            name_result = subprocess.run(
-                ['git', 'config', '--global', 'user.name'],
-                capture_output=True,
-                text=True
-            )
-            email_result = subprocess.run(
-                ['git', 'config', '--global', 'user.email'],
+            # One process reads both keys; each output line is "<key> <value>"
+            result = subprocess.run(
+                ['git', 'config', '--global', '--get-regexp', r'^user\.(name|email)$'],
                 capture_output=True,
                 text=True
             )
-            return (name_result.returncode == 0 and
-                    email_result.returncode == 0 and
-                    name_result.stdout.strip() and
-                    email_result.stdout.strip())
         except (FileNotFoundError, subprocess.SubprocessError):
             return False
+
+        if result.returncode != 0:
+            return False
+
+        configured = set()
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(' ')
+            if value.strip():
+                configured.add(key.lower())
+        return {'user.name', 'user.email'} <= configured
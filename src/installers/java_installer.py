@@ -1,7 +1,13 @@
 """Java/SpringBoot installer."""
+import os
+import re
+import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from urllib.parse import urlsplit
 import xml.etree.ElementTree as ET
 
 from .base import BaseInstaller
@@ -17,10 +23,23 @@ from ..exceptions import ExtractionError
 
 logger = get_logger(__name__)
 
+MAVEN_NS = '{http://maven.apache.org/POM/4.0.0}'
+POM_VERSION_PROPERTIES = (f'{MAVEN_NS}java.version', f'{MAVEN_NS}maven.compiler.source')
+
+# sourceCompatibility = '17' | "1.8" | 11 | JavaVersion.VERSION_1_8
+GRADLE_SOURCE_COMPATIBILITY_RE = re.compile(
+    r"""sourceCompatibility\s*=\s*(?:JavaVersion\.VERSION_)?['"]?(\d[\d._]*)"""
+)
+
 
 class JavaInstaller(BaseInstaller):
     """Installer for Java and Maven/Gradle projects."""
 
+    # Shared by every instance: projects configured concurrently would
+    # otherwise download, extract and rename the same tools/maven and
+    # overwrite the same ~/.m2/settings.xml
+    maven_lock = threading.RLock()
+
     def detect_version(self) -> Optional[str]:
         """Detect Java version from pom.xml or build.gradle."""
         pom_file = self.project_path / 'pom.xml'
@@ -38,19 +57,32 @@ class JavaInstaller(BaseInstaller):
         return DEFAULT_VERSIONS['java']
 
     def _detect_from_pom(self, pom_file: Path) -> str:
-        """Extract Java version from pom.xml."""
-        try:
-            tree = ET.parse(pom_file)
-            root = tree.getroot()
-            ns = {'maven': 'http://maven.apache.org/POM/4.0.0'}
-
-            # Check for java.version property
-            for prop in root.findall('.//maven:properties/maven:java.version', ns):
-                return prop.text.strip()
+        """Extract Java version from pom.xml.
 
-            # Check for maven.compiler.source
-            for prop in root.findall('.//maven:properties/maven:maven.compiler.source', ns):
-                return prop.text.strip()
+        The file is parsed as a stream and parsing stops at the first
+        <properties> block that sets java.version or maven.compiler.source,
+        so the <dependencies> section usually never needs to be read. Other
+        top-level sections are cleared once parsed to keep memory flat.
+        """
+        try:
+            with open(pom_file, 'rb') as f:
+                depth = 0
+                for event, elem in ET.iterparse(f, events=('start', 'end')):
+                    if event == 'start':
+                        depth += 1
+                        continue
+                    depth -= 1
+
+                    if elem.tag == f'{MAVEN_NS}properties':
+                        # java.version wins over maven.compiler.source
+                        for name in POM_VERSION_PROPERTIES:
+                            prop = elem.find(name)
+                            if prop is not None and prop.text and prop.text.strip():
+                                return prop.text.strip()
+
+                    if depth == 1:
+                        # A finished child of <project>; nothing left to read in it
+                        elem.clear()
 
         except ET.ParseError as e:
             logger.warning(f"Failed to parse pom.xml", details=str(e))
@@ -62,12 +94,10 @@ class JavaInstaller(BaseInstaller):
     def _detect_from_gradle(self, gradle_file: Path) -> str:
         """Extract Java version from build.gradle."""
         try:
-            content = gradle_file.read_text(encoding='utf-8')
-            if 'sourceCompatibility' in content:
-                for line in content.split('\n'):
-                    if 'sourceCompatibility' in line and '=' in line:
-                        version = line.split('=')[1].strip().strip("'\"")
-                        return version
+            match = GRADLE_SOURCE_COMPATIBILITY_RE.search(gradle_file.read_text(encoding='utf-8'))
+            if match:
+                # JavaVersion constants spell 1.8 as VERSION_1_8
+                return match.group(1).replace('_', '.')
         except IOError as e:
             logger.warning(f"Failed to read gradle file", details=str(e))
 
@@ -75,16 +105,39 @@ class JavaInstaller(BaseInstaller):
 
     def is_installed(self) -> bool:
         """Check if Java is installed."""
-        try:
-            result = subprocess.run(['java', '-version'], capture_output=True, text=True)
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        return self._is_tool_available('java', 'release')
 
     def is_maven_installed(self) -> bool:
         """Check if Maven is installed."""
+        return self._is_tool_available('mvn', os.path.join('conf', 'settings.xml'))
+
+    @staticmethod
+    def _is_tool_available(name: str, home_marker: str) -> bool:
+        """
+        Check a JVM tool without starting a JVM when possible.
+
+        A launcher found on PATH whose home directory (the parent of its real
+        bin directory) contains home_marker belongs to a real installation.
+        Anything else, such as the macOS /usr/bin/java stub, is confirmed by
+        running it with -version.
+
+        Args:
+            name: Executable name
+            home_marker: File relative to the tool's home that proves an installation
+
+        Returns:
+            True if the tool is installed and runnable
+        """
+        executable = shutil.which(name)
+        if not executable:
+            return False
+
+        home = Path(os.path.realpath(executable)).parent.parent
+        if (home / home_marker).is_file():
+            return True
+
         try:
-            result = subprocess.run(['mvn', '-version'], capture_output=True, text=True)
+            result = subprocess.run([name, '-version'], capture_output=True, text=True)
             return result.returncode == 0
         except FileNotFoundError:
             return False
@@ -99,27 +152,19 @@ class JavaInstaller(BaseInstaller):
 
         tools_dir = get_tools_dir()
         java_dir = tools_dir / f'jdk-{download_version}'
+        needs_maven = (self.project_path / 'pom.xml').exists()
 
-        if not java_dir.exists():
-            logger.progress(f"Downloading Java {download_version}...")
-            download_url = DOWNLOAD_URLS['java'].get(download_version)
-
-            if not download_url:
-                logger.error(f"No download URL for Java version {download_version}")
-                return False
-
-            success, extracted_dir = self.download_and_extract(download_url, tools_dir)
+        # On a fresh install, fetch Maven while the much larger JDK downloads
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            maven_download = None
+            if needs_maven and not java_dir.exists():
+                maven_download = executor.submit(self._download_maven, tools_dir)
 
-            if not success:
-                logger.error("Failed to download Java. Please install manually.")
-                return False
+            java_ready = self._download_java(download_version, java_dir, tools_dir)
+            maven_ready = maven_download.result() if maven_download else True
 
-            # Rename extracted directory if needed
-            if extracted_dir and extracted_dir != java_dir and extracted_dir.exists():
-                try:
-                    extracted_dir.rename(java_dir)
-                except OSError as e:
-                    logger.warning(f"Could not rename extracted directory", details=str(e))
+        if not java_ready:
+            return False
 
         # Setup Java environment
         java_home = str(java_dir)
@@ -127,22 +172,86 @@ class JavaInstaller(BaseInstaller):
         self.setup_tool_environment('JAVA', java_home, java_bin)
 
         # Install Maven if pom.xml exists
-        if (self.project_path / 'pom.xml').exists():
-            return self._install_maven(tools_dir)
+        if needs_maven:
+            return maven_ready and self._install_maven(tools_dir)
+
+        return True
+
+    def _download_java(self, download_version: str, java_dir: Path, tools_dir: Path) -> bool:
+        """
+        Download and extract the JDK unless it is already present.
+
+        Args:
+            download_version: Java version to download
+            java_dir: Target JDK directory
+            tools_dir: Tools installation directory
+
+        Returns:
+            True if the JDK is available in java_dir
+        """
+        if java_dir.exists():
+            return True
+
+        logger.progress(f"Downloading Java {download_version}...")
+        download_url = DOWNLOAD_URLS['java'].get(download_version)
+
+        if not download_url:
+            logger.error(f"No download URL for Java version {download_version}")
+            return False
+
+        success, extracted_dir = self.download_and_extract(download_url, tools_dir)
+
+        if not success:
+            logger.error("Failed to download Java. Please install manually.")
+            return False
+
+        # Rename extracted directory if needed
+        if extracted_dir and extracted_dir != java_dir and extracted_dir.exists():
+            try:
+                extracted_dir.rename(java_dir)
+            except OSError as e:
+                logger.warning(f"Could not rename extracted directory", details=str(e))
 
         return True
 
     def _install_maven(self, tools_dir: Path) -> bool:
         """Install Apache Maven with fallback URLs."""
+        if not self._download_maven(tools_dir):
+            return False
+
+        # Setup Maven environment
         maven_dir = tools_dir / 'maven'
+        maven_home = str(maven_dir)
+        maven_bin = str(maven_dir / 'bin')
+        self.setup_tool_environment('MAVEN', maven_home, maven_bin)
+
+        return True
+
+    def _download_maven(self, tools_dir: Path) -> bool:
+        """
+        Download and extract Maven unless it is already present.
+
+        Args:
+            tools_dir: Tools installation directory
+
+        Returns:
+            True if a Maven installation with a bin directory is in place
+        """
+        with self.maven_lock:
+            maven_dir = tools_dir / 'maven'
+
+            if maven_dir.exists():
+                return True
 
-        if not maven_dir.exists():
             logger.progress("Downloading Maven...")
 
             maven_urls = DOWNLOAD_URLS['maven'].get(DEFAULT_VERSIONS['maven'], [])
             if isinstance(maven_urls, str):
                 maven_urls = [maven_urls]
 
+            # Start with the mirror that answers fastest
+            maven_urls = self.rank_mirrors(maven_urls)
+
             # Try each URL until one succeeds
             download_success = False
             for url in maven_urls:
@@ -182,12 +291,7 @@ class JavaInstaller(BaseInstaller):
                     logger.debug(f"Maven directory contents: {contents}")
                 return False
 
-        # Setup Maven environment
-        maven_home = str(maven_dir)
-        maven_bin = str(maven_dir / 'bin')
-        self.setup_tool_environment('MAVEN', maven_home, maven_bin)
-
-        return True
+            return True
 
     def configure(self) -> bool:
         """Configure Java project."""
@@ -197,41 +301,18 @@ class JavaInstaller(BaseInstaller):
         detector = TechnologyDetector()
         build_tool = detector.detect_build_tool(self.project_path)
 
-        maven_available = False
-        gradle_available = False
-
-        # Handle Maven projects
-        if (self.project_path / 'pom.xml').exists():
-            if not self.is_maven_installed():
-                logger.info("Maven not found. Installing Maven...")
-                tools_dir = get_tools_dir()
-                tools_dir.mkdir(parents=True, exist_ok=True)
-                if self._install_maven(tools_dir):
-                    maven_available = True
-                    logger.success("Maven installed successfully")
-                else:
-                    logger.warning("Failed to install Maven")
-                    logger.warning("Skipping dependency installation - please install Maven manually")
-            else:
-                logger.success("Maven is already installed")
-                maven_available = True
-
-            if maven_available:
-                self._ensure_maven_directories()
+        has_pom = (self.project_path / 'pom.xml').exists()
+        maven_available = has_pom and self._bootstrap_maven()
 
         # Create application.properties if needed (for Spring Boot)
         app_props = self.project_path / 'src' / 'main' / 'resources' / 'application.properties'
-        if not app_props.exists() and (self.project_path / 'pom.xml').exists():
+        if not app_props.exists() and has_pom:
             self.env_manager.write_config_file(
                 'application.properties',
                 '# Application configuration\nserver.port=8080\n',
                 'src/main/resources'
             )
 
-        # Set proxy for Maven if needed
-        if self.proxy_manager.http_proxy and maven_available:
-            self._configure_maven_proxy()
-
         # Run build based on detected build tool
         build_success = False
 
@@ -241,12 +322,16 @@ class JavaInstaller(BaseInstaller):
                 build_success = True
             else:
                 logger.warning("Gradle build failed, but continuing...")
-        elif maven_available and (self.project_path / 'pom.xml').exists():
-            logger.progress("Installing project dependencies with Maven...")
-            if self._run_maven_install():
+        elif maven_available:
+            if not self._needs_rebuild():
+                logger.success("Build artifacts are up to date, skipping Maven build")
                 build_success = True
             else:
-                logger.warning("Maven install failed, but continuing...")
+                logger.progress("Installing project dependencies with Maven...")
+                if self._run_maven_install():
+                    build_success = True
+                else:
+                    logger.warning("Maven install failed, but continuing...")
 
         # Validate build artifacts
         if build_success:
@@ -254,40 +339,138 @@ class JavaInstaller(BaseInstaller):
 
         return True
 
+    def _bootstrap_maven(self) -> bool:
+        """
+        Make Maven and ~/.m2 ready for a build.
+
+        Runs under maven_lock because it changes machine-wide state: the
+        shared tools directory and ~/.m2/settings.xml.
+
+        Returns:
+            True if Maven is available
+        """
+        with self.maven_lock:
+            if self.is_maven_installed():
+                logger.success("Maven is already installed")
+            else:
+                logger.info("Maven not found. Installing Maven...")
+                tools_dir = get_tools_dir()
+                tools_dir.mkdir(parents=True, exist_ok=True)
+                if not self._install_maven(tools_dir):
+                    logger.warning("Failed to install Maven")
+                    logger.warning("Skipping dependency installation - please install Maven manually")
+                    return False
+                logger.success("Maven installed successfully")
+
+            self._ensure_maven_directories()
+
+            # Set proxy for Maven if needed
+            if self.proxy_manager.http_proxy:
+                self._configure_maven_proxy()
+
+        return True
+
     def _validate_build(self) -> None:
         """Validate that build artifacts were created successfully."""
         logger.section("Build Validation")
 
         # Check for Maven build artifacts
-        target_dir = self.project_path / 'target'
-        if target_dir.exists():
-            jar_files = list(target_dir.glob('*.jar'))
-            if jar_files:
-                logger.success("Build artifacts found:")
-                for jar in jar_files:
-                    size_mb = jar.stat().st_size / (1024 * 1024)
-                    logger.info(f"  - {jar.name} ({size_mb:.2f} MB)")
-                logger.success("Application is ready to run!")
-                logger.info(f"  To run: cd {self.project_path} && java -jar target/{jar_files[0].name}")
-            else:
-                logger.warning("No JAR files found in target directory")
+        self._report_jars(self.project_path / 'target', 'target')
 
         # Check for Gradle build artifacts
-        build_dir = self.project_path / 'build'
-        if build_dir.exists():
-            libs_dir = build_dir / 'libs'
-            if libs_dir.exists():
-                jar_files = list(libs_dir.glob('*.jar'))
-                if jar_files:
-                    logger.success("Build artifacts found:")
-                    for jar in jar_files:
-                        size_mb = jar.stat().st_size / (1024 * 1024)
-                        logger.info(f"  - {jar.name} ({size_mb:.2f} MB)")
-                    logger.success("Application is ready to run!")
-                    logger.info(f"  To run: cd {self.project_path} && java -jar build/libs/{jar_files[0].name}")
+        self._report_jars(self.project_path / 'build' / 'libs', 'build/libs', warn_if_empty=False)
+
+    def _report_jars(self, directory: Path, relative_dir: str, warn_if_empty: bool = True) -> None:
+        """
+        Log the JAR files found in a build output directory.
+
+        Entries come from a single os.scandir pass, so names, types and sizes
+        do not need a separate stat per file.
+
+        Args:
+            directory: Build output directory
+            relative_dir: Directory relative to the project, used in the run hint
+            warn_if_empty: Whether to warn when the directory holds no JAR files
+        """
+        try:
+            with os.scandir(directory) as entries:
+                jars = [
+                    (entry.name, entry.stat().st_size)
+                    for entry in entries
+                    if entry.name.endswith('.jar') and entry.is_file()
+                ]
+        except OSError:
+            return
+
+        if not jars:
+            if warn_if_empty:
+                logger.warning(f"No JAR files found in {relative_dir} directory")
+            return
+
+        jars.sort()
+        logger.success("Build artifacts found:")
+        for name, size in jars:
+            logger.info(f"  - {name} ({size / (1024 * 1024):.2f} MB)")
+        logger.success("Application is ready to run!")
+        logger.info(f"  To run: cd {self.project_path} && java -jar {relative_dir}/{jars[0][0]}")
+
+    def _needs_rebuild(self) -> bool:
+        """
+        Check whether the Maven build is out of date.
+
+        The build is current when a JAR in target/ is newer than pom.xml and
+        every file and directory under src/main. The source walk stops at the
+        first newer entry.
+
+        Returns:
+            True if Maven has to run
+        """
+        newest_jar = None
+        try:
+            with os.scandir(self.project_path / 'target') as entries:
+                for entry in entries:
+                    if entry.name.endswith('.jar') and entry.is_file():
+                        mtime = entry.stat().st_mtime_ns
+                        if newest_jar is None or mtime > newest_jar:
+                            newest_jar = mtime
+        except OSError:
+            return True
+
+        if newest_jar is None:
+            return True
+
+        try:
+            if (self.project_path / 'pom.xml').stat().st_mtime_ns > newest_jar:
+                return True
+        except OSError:
+            return True
+
+        # Directory mtimes are compared too: deleting or renaming a source
+        # file only touches the directory that contained it
+        src_main = self.project_path / 'src' / 'main'
+        try:
+            if src_main.stat().st_mtime_ns > newest_jar:
+                return True
+        except OSError:
+            return False
+
+        pending = [str(src_main)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.stat(follow_symlinks=False).st_mtime_ns > newest_jar:
+                            logger.debug(f"Sources changed since last build: {entry.path}")
+                            return True
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+            except OSError:
+                continue
+
+        return False
 
     def _run_maven_install(self) -> bool:
-        """Run Maven clean install to download dependencies."""
+        """Run Maven install to download dependencies and build the project."""
         logger.progress("Searching for Maven executable...")
         maven_cmd = self._find_maven_executable()
 
@@ -298,11 +481,11 @@ class JavaInstaller(BaseInstaller):
             logger.info(f"Checked locations: {maven_dir / 'bin'}, PATH")
             return False
 
-        logger.progress(f"Running: mvn clean install -DskipTests")
+        logger.progress(f"Running: mvn install -DskipTests")
         logger.debug(f"Full path: {maven_cmd}")
 
-        success, output = self.run_command(
-            [maven_cmd, 'clean', 'install', '-DskipTests'],
+        success, output = self.run_streaming_command(
+            [maven_cmd, 'install', '-DskipTests'],
             timeout=BUILD_TIMEOUT
         )
 
@@ -310,9 +493,7 @@ class JavaInstaller(BaseInstaller):
             logger.success("Maven dependencies installed successfully")
             logger.success("Project built successfully")
         else:
-            logger.error("Maven install failed")
-            if output:
-                logger.debug(f"Output: {output[:500]}")
+            logger.error("Maven install failed", details=output or None)
 
         return success
 
@@ -342,7 +523,7 @@ class JavaInstaller(BaseInstaller):
 
         logger.progress(f"Running: {Path(gradle_cmd).name} build -x test")
 
-        success, output = self.run_command(
+        success, output = self.run_streaming_command(
             [gradle_cmd, 'build', '-x', 'test'],
             timeout=BUILD_TIMEOUT
         )
@@ -350,9 +531,7 @@ class JavaInstaller(BaseInstaller):
         if success:
             logger.success("Gradle dependencies installed successfully")
         else:
-            logger.error("Gradle build failed")
-            if output:
-                logger.debug(f"Output: {output[:500]}")
+            logger.error("Gradle build failed", details=output or None)
 
         return success
 
@@ -386,8 +565,7 @@ class JavaInstaller(BaseInstaller):
         maven_dir.mkdir(exist_ok=True)
         settings_file = maven_dir / 'settings.xml'
 
-        proxy_host = self._get_proxy_host(self.proxy_manager.http_proxy)
-        proxy_port = self._get_proxy_port(self.proxy_manager.http_proxy)
+        proxy_host, proxy_port = self._split_proxy_url(self.proxy_manager.http_proxy)
 
         proxy_config = f"""<?xml version="1.0" encoding="UTF-8"?>
 <settings xmlns="http://maven.apache.org/SETTINGS/1.0.0"
@@ -411,14 +589,31 @@ class JavaInstaller(BaseInstaller):
 
     def _get_proxy_host(self, proxy_url: str) -> str:
         """Extract host from proxy URL."""
-        if '://' in proxy_url:
-            proxy_url = proxy_url.split('://')[1]
-        return proxy_url.split(':')[0]
+        return self._split_proxy_url(proxy_url)[0]
 
     def _get_proxy_port(self, proxy_url: str) -> str:
         """Extract port from proxy URL."""
-        if '://' in proxy_url:
-            proxy_url = proxy_url.split('://')[1]
-        if ':' in proxy_url:
-            return proxy_url.split(':')[1].rstrip('/')
-        return '80'
+        return self._split_proxy_url(proxy_url)[1]
+
+    @staticmethod
+    def _split_proxy_url(proxy_url: str) -> Tuple[str, str]:
+        """
+        Split a proxy URL into host and port with a single urlsplit.
+
+        Credentials (user:pass@) and IPv6 brackets are stripped. A missing or
+        invalid port falls back to 80.
+
+        Args:
+            proxy_url: Proxy URL, with or without a scheme
+
+        Returns:
+            Tuple of (host, port)
+        """
+        if '://' not in proxy_url:
+            proxy_url = 'http://' + proxy_url
+        parts = urlsplit(proxy_url)
+        try:
+            port = parts.port
+        except ValueError:
+            port = None
+        return parts.hostname or '', str(port or 80)
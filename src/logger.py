@@ -32,6 +32,10 @@ class ColoredFormatter(logging.Formatter):
     }
 
     def format(self, record: logging.LogRecord) -> str:
+        # Output relayed from an external tool is shown as-is
+        if getattr(record, 'raw', False):
+            return f"  {record.getMessage()}"
+
         color = self.COLORS.get(record.levelno, '')
         symbol = self.SYMBOLS.get(record.levelno, '')
         reset = Style.RESET_ALL
@@ -127,16 +131,13 @@ class DevStartLogger:
     def section(self, title: str, char: str = '=', width: int = 60):
         """Print a section header."""
         line = char * width
-        print(f"\n{Fore.CYAN}{line}")
-        print(f"{title}")
-        print(f"{line}{Style.RESET_ALL}\n")
+        # Single write keeps headers intact when repositories run in parallel
+        print(f"\n{Fore.CYAN}{line}\n{title}\n{line}{Style.RESET_ALL}\n")
 
     def subsection(self, title: str, char: str = '-', width: int = 40):
         """Print a subsection header."""
         line = char * width
-        print(f"\n{Fore.CYAN}{line}")
-        print(f"{title}")
-        print(f"{line}{Style.RESET_ALL}")
+        print(f"\n{Fore.CYAN}{line}\n{title}\n{line}{Style.RESET_ALL}")
 
     def banner(self, title: str, subtitle: str = ''):
         """Print application banner."""
@@ -148,6 +149,10 @@ class DevStartLogger:
         print("╚════════════════════════════════════════════════════════════╝")
         print(Style.RESET_ALL)
 
+    def output(self, message: str):
+        """Log a line of output from an external tool (shown without symbol)."""
+        self.logger.info(message, extra={'raw': True})
+
     def progress(self, message: str):
         """Print a progress message (no symbol)."""
         print(f"{Fore.CYAN}{message}{Style.RESET_ALL}")
@@ -1,21 +1,66 @@
 """Proxy configuration manager for corporate environments."""
 import os
-import re
-from typing import Optional, Dict
-
-from .constants import PROXY_URL_PATTERN
+from typing import TYPE_CHECKING, Optional, Dict
+
+from .constants import (
+    PROXY_URL_RE,
+    HTTP_POOL_SIZE,
+    MAX_DOWNLOAD_RETRIES,
+    RETRY_DELAY_SECONDS,
+    RETRY_STATUS_CODES,
+)
 from .exceptions import InvalidProxyURLError
 from .logger import get_logger
 
+if TYPE_CHECKING:
+    import requests
+
 logger = get_logger(__name__)
 
 
+def create_session() -> 'requests.Session':
+    """
+    Create an HTTP session with pooled keep-alive connections and retries.
+
+    requests is imported here, not at module level, so CLI startup and
+    --help do not pay for it.
+
+    Returns:
+        Configured requests session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(
+            total=MAX_DOWNLOAD_RETRIES,
+            backoff_factor=RETRY_DELAY_SECONDS,
+            status_forcelist=RETRY_STATUS_CODES
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class ProxyManager:
     """Manages HTTP/HTTPS proxy configuration."""
 
-    def __init__(self):
+    def __init__(self, session: Optional['requests.Session'] = None):
         self.http_proxy: Optional[str] = None
         self.https_proxy: Optional[str] = None
+        self._session = session
+
+    @property
+    def session(self) -> 'requests.Session':
+        """Shared HTTP session, created on first use."""
+        if self._session is None:
+            self._session = create_session()
+        return self._session
 
     def validate_proxy_url(self, url: str) -> bool:
         """
@@ -35,7 +80,7 @@ class ProxyManager:
 
         url = url.strip()
 
-        if not re.match(PROXY_URL_PATTERN, url):
+        if not PROXY_URL_RE.match(url):
             raise InvalidProxyURLError(url)
 
         # Basic format check: should have host and optionally port
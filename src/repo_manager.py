@@ -1,24 +1,61 @@
 """Repository management and cloning."""
 import re
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional
 from urllib.parse import urlparse
 
 import git
 
-from .constants import ALLOWED_URL_SCHEMES, ALLOWED_GIT_HOSTS
+from .constants import ALLOWED_URL_SCHEMES, ALLOWED_GIT_HOSTS, MAX_CLONES_PER_HOST
 from .exceptions import InvalidURLError, CloneError
 from .logger import get_logger
 from .proxy_manager import ProxyManager
 
 logger = get_logger(__name__)
 
+# Potential injection attempts in repository URLs
+DANGEROUS_URL_RE = re.compile(
+    r'[;&|`$]'  # Shell metacharacters
+    r'|\.\.'  # Directory traversal
+    r'|%[0-9a-fA-F]{2}'  # URL encoding that might bypass checks
+)
+
+
+class HostRateLimiter:
+    """Limits concurrent git network operations against the same host."""
+
+    def __init__(self, per_host: int = MAX_CLONES_PER_HOST):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """
+        Hold one of the slots available for the host of a URL.
+
+        Args:
+            url: Repository URL
+        """
+        host = urlparse(url).netloc.split('@')[-1].lower()
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host)
+                self._semaphores[host] = semaphore
+
+        with semaphore:
+            yield
+
 
 class RepositoryManager:
     """Manages repository cloning and operations."""
 
-    def __init__(self, proxy_manager: ProxyManager):
+    def __init__(self, proxy_manager: ProxyManager, per_host_limit: int = MAX_CLONES_PER_HOST):
         self.proxy_manager = proxy_manager
+        self.rate_limiter = HostRateLimiter(per_host_limit)
 
     def validate_repo_url(self, url: str) -> bool:
         """
@@ -50,7 +87,7 @@ class RepositoryManager:
             raise InvalidURLError(
                 url,
                 f"URL scheme '{scheme}' not allowed. "
-                f"Allowed schemes: {', '.join(ALLOWED_URL_SCHEMES)}"
+                f"Allowed schemes: {', '.join(sorted(ALLOWED_URL_SCHEMES))}"
             )
 
         # Check for host
@@ -65,15 +102,8 @@ class RepositoryManager:
             raise InvalidURLError(url, "Invalid hostname")
 
         # Check for potential injection attempts
-        dangerous_patterns = [
-            r'[;&|`$]',  # Shell metacharacters
-            r'\.\.',  # Directory traversal
-            r'%[0-9a-fA-F]{2}',  # URL encoding that might bypass checks
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, url):
-                raise InvalidURLError(url, "URL contains potentially dangerous characters")
+        if DANGEROUS_URL_RE.search(url):
+            raise InvalidURLError(url, "URL contains potentially dangerous characters")
 
         # Validate path exists (should end with repo name)
         if not parsed.path or parsed.path == '/':
@@ -82,13 +112,19 @@ class RepositoryManager:
         logger.debug(f"URL validated: {url}")
         return True
 
-    def clone_repository(self, repo_url: str, destination: Path) -> bool:
+    def clone_repository(self, repo_url: str, destination: Path,
+                         depth: Optional[int] = 1, single_branch: bool = True) -> bool:
         """
         Clone a git repository.
 
+        Only the working tree is needed for detection and installation, so
+        the clone is shallow by default.
+
         Args:
             repo_url: URL of the repository
             destination: Local path to clone to
+            depth: History depth to fetch (None for full history)
+            single_branch: Whether to fetch only the default branch
 
         Returns:
             True if successful, False otherwise
@@ -100,21 +136,27 @@ class RepositoryManager:
             logger.progress(f"Cloning repository: {repo_url}")
 
             # Configure git proxy if needed
-            env = {}
-            if self.proxy_manager.http_proxy:
-                env['http_proxy'] = self.proxy_manager.http_proxy
-            if self.proxy_manager.https_proxy:
-                env['https_proxy'] = self.proxy_manager.https_proxy
+            env = self._get_git_env()
 
             # Create parent directory
             destination.parent.mkdir(parents=True, exist_ok=True)
 
-            # Clone repository
-            git.Repo.clone_from(
-                repo_url,
-                destination,
-                env=env if env else None
-            )
+            # Shallow clone options
+            clone_options = {}
+            if depth:
+                clone_options['depth'] = depth
+                clone_options['no_tags'] = True
+            if single_branch:
+                clone_options['single_branch'] = True
+
+            # Clone repository (throttled per host to avoid remote resets)
+            with self.rate_limiter.limit(repo_url):
+                git.Repo.clone_from(
+                    repo_url,
+                    destination,
+                    env=env if env else None,
+                    **clone_options
+                )
 
             logger.success(f"Repository cloned to: {destination}")
             return True
@@ -135,6 +177,148 @@ class RepositoryManager:
             logger.error(f"Error cloning repository", details=str(e))
             return False
 
+    def is_same_remote(self, path: Path, repo_url: str) -> bool:
+        """
+        Check whether a directory is a clone of the given repository.
+
+        Args:
+            path: Local repository path
+            repo_url: Repository URL to compare against
+
+        Returns:
+            True if the 'origin' remote of the clone points to repo_url
+        """
+        try:
+            origin_url = git.Repo(path).remotes.origin.url
+        except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+            return False
+        except (AttributeError, ValueError):
+            # No 'origin' remote configured
+            return False
+
+        return self.canonicalize_url(origin_url) == self.canonicalize_url(repo_url)
+
+    def update_repository(self, path: Path, depth: Optional[int] = 1) -> bool:
+        """
+        Update an existing clone to the latest commit of its current branch.
+
+        Reuses the objects already on disk instead of removing and cloning
+        again. Clones with uncommitted changes, or with commits that are not
+        on origin/<branch>, are left untouched.
+
+        Args:
+            path: Local repository path
+            depth: History depth to fetch (None for full history)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            repo = git.Repo(path)
+
+            if repo.is_dirty():
+                logger.warning("Existing repository has uncommitted changes")
+                return False
+
+            branch = repo.active_branch.name
+            tracking = f'origin/{branch}'
+
+            # Checked before fetching: a shallow fetch can cut HEAD off from the
+            # new remote history. Local-only commits would be lost by the reset.
+            try:
+                if not repo.is_ancestor(repo.head.commit, tracking):
+                    logger.warning(f"Existing repository has commits that are not on {tracking}")
+                    return False
+            except git.GitCommandError:
+                logger.warning(f"Existing repository has no {tracking} to update from")
+                return False
+
+            logger.progress(f"Updating existing repository: {path}")
+
+            # Never make a full clone shallow
+            if depth and repo.git.rev_parse('--is-shallow-repository') != 'true':
+                depth = None
+
+            env = self._get_git_env()
+            origin = repo.remotes.origin
+            with self.rate_limiter.limit(origin.url), repo.git.custom_environment(**env):
+                if depth:
+                    origin.fetch(branch, depth=depth)
+                else:
+                    origin.fetch(branch)
+                repo.git.reset('--hard', tracking)
+
+            logger.success(f"Repository updated: {path}")
+            return True
+
+        except TypeError:
+            # Detached HEAD has no active branch
+            logger.warning("Existing repository is not on a branch")
+            return False
+        except (git.InvalidGitRepositoryError, git.NoSuchPathError) as e:
+            logger.warning(f"Invalid git repository", details=str(e))
+            return False
+        except git.GitCommandError as e:
+            logger.warning(f"Git update failed", details=str(e))
+            return False
+        except (AttributeError, ValueError) as e:
+            logger.warning(f"Repository has no origin remote", details=str(e))
+            return False
+
+    def get_head_sha(self, path: Path) -> Optional[str]:
+        """
+        Get the commit SHA checked out in a local repository.
+
+        Args:
+            path: Local repository path
+
+        Returns:
+            HEAD commit SHA, or None if path is not a repository with commits
+        """
+        try:
+            return git.Repo(path).head.commit.hexsha
+        except (git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError):
+            return None
+
+    def _get_git_env(self) -> Dict[str, str]:
+        """Get environment variables for git network operations."""
+        env = {}
+        if self.proxy_manager.http_proxy:
+            env['http_proxy'] = self.proxy_manager.http_proxy
+        if self.proxy_manager.https_proxy:
+            env['https_proxy'] = self.proxy_manager.https_proxy
+        return env
+
+    def canonicalize_url(self, url: str) -> str:
+        """
+        Get a canonical form of a repository URL for comparison.
+
+        The host is lowercased, credentials, trailing slashes and the .git
+        suffix are dropped, and SCP-style URLs (git@host:owner/name) are
+        converted to https://host/owner/name.
+
+        Args:
+            url: Repository URL
+
+        Returns:
+            Canonical repository URL
+        """
+        url = url.strip().rstrip('/')
+        if url.endswith('.git'):
+            url = url[:-4]
+
+        # SCP-style SSH URL: [user@]host:owner/name
+        if '://' not in url and ':' in url:
+            host, path = url.split(':', 1)
+            url = f"https://{host}/{path.lstrip('/')}"
+
+        parsed = urlparse(url)
+        if not parsed.netloc:
+            return url
+
+        host = parsed.netloc.split('@')[-1].lower()
+        return f"https://{host}{parsed.path.rstrip('/')}"
+
     def get_repo_name(self, repo_url: str) -> str:
         """
         Extract repository name from URL.
@@ -1,12 +1,14 @@
 """Tests for base installer functionality."""
+import io
 import unittest
 import tempfile
 import shutil
 import os
+import sys
 from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock
 
-from src.installers.base import BaseInstaller
+from src.installers.base import BaseInstaller, HashingWriter
 from src.proxy_manager import ProxyManager
 
 
@@ -80,14 +82,14 @@ class TestBaseInstaller(unittest.TestCase):
         # Clean up
         del os.environ[var_name]
 
-    @patch('src.installers.base.requests.get')
+    @patch('src.installers.base.requests.Session.get')
     def test_download_file_success(self, mock_get):
         """Test successful file download."""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {'content-length': '100'}
-        mock_response.iter_content.return_value = [b'test content']
+        mock_response.raw = io.BytesIO(b'test content')
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -96,8 +98,9 @@ class TestBaseInstaller(unittest.TestCase):
 
         self.assertTrue(result)
         self.assertTrue(destination.exists())
+        mock_response.close.assert_called_once()
 
-    @patch('src.installers.base.requests.get')
+    @patch('src.installers.base.requests.Session.get')
     def test_download_file_with_checksum_verification(self, mock_get):
         """Test file download with checksum verification."""
         import hashlib
@@ -109,7 +112,7 @@ class TestBaseInstaller(unittest.TestCase):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {'content-length': str(len(content))}
-        mock_response.iter_content.return_value = [content]
+        mock_response.raw = io.BytesIO(content)
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -122,7 +125,24 @@ class TestBaseInstaller(unittest.TestCase):
 
         self.assertTrue(result)
 
-    @patch('src.installers.base.requests.get')
+    @patch('src.installers.base.requests.Session.get')
+    def test_download_file_body_shorter_than_content_length(self, mock_get):
+        """Test the file holds exactly the decoded body, whatever Content-Length says."""
+        content = b'decoded body'
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'content-length': '4096'}
+        mock_response.raw = io.BytesIO(content)
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        destination = self.temp_dir / 'test_file.txt'
+        self.assertTrue(self.installer.download_file('https://example.com/file.txt', destination))
+
+        self.assertEqual(destination.read_bytes(), content)
+
+    @patch('src.installers.base.requests.Session.get')
     def test_download_file_checksum_mismatch(self, mock_get):
         """Test file download with checksum mismatch."""
         content = b'test content'
@@ -132,7 +152,7 @@ class TestBaseInstaller(unittest.TestCase):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {'content-length': str(len(content))}
-        mock_response.iter_content.return_value = [content]
+        mock_response.raw = io.BytesIO(content)
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -147,7 +167,286 @@ class TestBaseInstaller(unittest.TestCase):
         # File should be deleted after checksum failure
         self.assertFalse(destination.exists())
 
-    @patch('src.installers.base.requests.get')
+    @patch('src.installers.base.requests.Session.get')
+    def test_download_file_multiple_chunks(self, mock_get):
+        """Test a body larger than one chunk is written and hashed completely."""
+        import hashlib
+        from src.constants import DOWNLOAD_CHUNK_SIZE
+
+        content = os.urandom(DOWNLOAD_CHUNK_SIZE * 2 + 123)
+
+        mock_response = Mock()
+        mock_response.headers = {'content-length': str(len(content))}
+        mock_response.raw = io.BytesIO(content)
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        destination = self.temp_dir / 'large.bin'
+        result = self.installer.download_file(
+            'https://example.com/large.bin',
+            destination,
+            expected_checksum=hashlib.sha256(content).hexdigest()
+        )
+
+        self.assertTrue(result)
+        self.assertEqual(destination.read_bytes(), content)
+
+    def test_hashing_writer(self):
+        """Test HashingWriter forwards data and tracks hash and size."""
+        import hashlib
+
+        buffer = io.BytesIO()
+        writer = HashingWriter(buffer, total_size=6)
+        writer.write(b'abc')
+        writer.write(b'def')
+
+        self.assertEqual(buffer.getvalue(), b'abcdef')
+        self.assertEqual(writer.written, 6)
+        self.assertEqual(writer.sha256.hexdigest(), hashlib.sha256(b'abcdef').hexdigest())
+
+    def test_hashing_writer_without_hash(self):
+        """Test HashingWriter only counts bytes when hashing is off."""
+        buffer = io.BytesIO()
+        writer = HashingWriter(buffer, hash_content=False)
+        writer.write(b'abc')
+
+        self.assertEqual(buffer.getvalue(), b'abc')
+        self.assertEqual(writer.written, 3)
+        self.assertIsNone(writer.sha256)
+
+    def test_copy_stream_spans_buffer_boundaries(self):
+        """Test _copy_stream copies and hashes data larger than its buffer."""
+        import hashlib
+        from src.constants import DOWNLOAD_CHUNK_SIZE
+
+        content = os.urandom(DOWNLOAD_CHUNK_SIZE * 2 + 7)
+        buffer = io.BytesIO()
+        writer = HashingWriter(buffer)
+
+        BaseInstaller._copy_stream(io.BytesIO(content), writer)
+
+        self.assertEqual(buffer.getvalue(), content)
+        self.assertEqual(writer.sha256.hexdigest(), hashlib.sha256(content).hexdigest())
+
+        path = self.temp_dir / 'data.bin'
+        path.write_bytes(content)
+        self.assertEqual(BaseInstaller._file_sha256(path), hashlib.sha256(content).hexdigest())
+
+    @patch('src.installers.base.requests.head')
+    def test_rank_mirrors_orders_by_latency(self, mock_head):
+        """Test the fastest mirror comes first with unreachable ones last."""
+        import time
+        import requests.exceptions
+
+        def head(url, **kwargs):
+            if 'down' in url:
+                raise requests.exceptions.ConnectionError()
+            time.sleep(0.5 if 'slow' in url else 0.05)
+            return Mock(ok=True)
+
+        mock_head.side_effect = head
+        urls = ['https://down.example.com/f.zip', 'https://slow.example.com/f.zip',
+                'https://fast.example.com/f.zip']
+
+        result = self.installer.rank_mirrors(urls)
+
+        self.assertEqual(result, [
+            'https://fast.example.com/f.zip',
+            'https://slow.example.com/f.zip',
+            'https://down.example.com/f.zip',
+        ])
+
+    @patch('src.installers.base.requests.head')
+    def test_rank_mirrors_does_not_wait_for_slow_mirrors(self, mock_head):
+        """Test ranking returns once the first mirror answers."""
+        import threading
+
+        release = threading.Event()
+
+        def head(url, **kwargs):
+            if 'stalled' in url:
+                release.wait(5)
+            return Mock(ok=True)
+
+        mock_head.side_effect = head
+        urls = ['https://stalled.example.com/f.zip', 'https://fast.example.com/f.zip']
+
+        try:
+            result = self.installer.rank_mirrors(urls)
+            self.assertFalse(release.is_set())
+        finally:
+            release.set()
+
+        self.assertEqual(result, [
+            'https://fast.example.com/f.zip',
+            'https://stalled.example.com/f.zip',
+        ])
+
+    @patch('src.installers.base.requests.head')
+    def test_rank_mirrors_single_url_not_probed(self, mock_head):
+        """Test a single mirror is returned without probing."""
+        result = self.installer.rank_mirrors(['https://example.com/f.zip'])
+        self.assertEqual(result, ['https://example.com/f.zip'])
+        mock_head.assert_not_called()
+
+    def _range_server(self, content, honor_ranges=True):
+        """Build a Session.get side effect serving content, optionally as byte ranges."""
+        requested_ranges = []
+
+        def get(url, headers=None, **kwargs):
+            response = Mock()
+            response.url = 'https://cdn.example.com/big.zip'
+            byte_range = (headers or {}).get('Range')
+            if byte_range and honor_ranges:
+                requested_ranges.append(byte_range)
+                start, end = map(int, byte_range[len('bytes='):].split('-'))
+                response.status_code = 206
+                response.raw = io.BytesIO(content[start:end + 1])
+            else:
+                response.status_code = 200
+                response.raw = io.BytesIO(content)
+            response.headers = {'content-length': str(len(content)), 'accept-ranges': 'bytes'}
+            return response
+
+        return get, requested_ranges
+
+    def _resuming_server(self, content, fail_after=None):
+        """Build a Session.get side effect honoring open-ended ranges, optionally dropping mid-body."""
+        import urllib3
+
+        requested_ranges = []
+
+        class DroppingBody(io.BytesIO):
+            def readinto(self, buffer):
+                if self.tell() >= fail_after:
+                    raise urllib3.exceptions.ProtocolError('Connection broken')
+                return super().readinto(memoryview(buffer)[:fail_after - self.tell()])
+
+        def get(url, headers=None, **kwargs):
+            response = Mock()
+            response.url = url
+            byte_range = (headers or {}).get('Range')
+            start = int(byte_range[len('bytes='):].rstrip('-')) if byte_range else 0
+            requested_ranges.append(start)
+            body = content[start:]
+            response.status_code = 206 if byte_range else 200
+            response.headers = {'content-length': str(len(body))}
+            if byte_range:
+                response.headers['content-range'] = f'bytes {start}-{len(content) - 1}/{len(content)}'
+            # Only the first response breaks off
+            dropping = fail_after is not None and len(requested_ranges) == 1
+            response.raw = DroppingBody(body) if dropping else io.BytesIO(body)
+            return response
+
+        return get, requested_ranges
+
+    @patch('src.installers.base.requests.Session.get')
+    def test_download_file_resumes_partial_file(self, mock_get):
+        """Test a .part file left by an earlier run is continued with a Range request."""
+        import hashlib
+        content = b'0123456789' * 10
+        mock_get.side_effect, requested_ranges = self._resuming_server(content)
+
+        destination = self.temp_dir / 'tool.zip'
+        (self.temp_dir / 'tool.zip.part').write_bytes(content[:40])
+
+        result = self.installer.download_file(
+            'https://example.com/tool.zip',
+            destination,
+            expected_checksum=hashlib.sha256(content).hexdigest()
+        )
+
+        self.assertTrue(result)
+        self.assertEqual(requested_ranges, [40])
+        self.assertEqual(destination.read_bytes(), content)
+        self.assertFalse((self.temp_dir / 'tool.zip.part').exists())
+
+    @patch('src.installers.base.requests.Session.get')
+    def test_download_file_resumes_after_dropped_connection(self, mock_get):
+        """Test a body that breaks off mid-stream is resumed from the bytes received."""
+        import hashlib
+        content = b'abcdefghij' * 10
+        mock_get.side_effect, requested_ranges = self._resuming_server(content, fail_after=30)
+
+        destination = self.temp_dir / 'tool.zip'
+        result = self.installer.download_file(
+            'https://example.com/tool.zip',
+            destination,
+            expected_checksum=hashlib.sha256(content).hexdigest()
+        )
+
+        self.assertTrue(result)
+        self.assertEqual(requested_ranges, [0, 30])
+        self.assertEqual(destination.read_bytes(), content)
+
+    @patch('src.installers.base.requests.Session.get')
+    def test_download_file_restarts_on_unsatisfiable_range(self, mock_get):
+        """Test a partial file the server rejects with 416 is discarded and downloaded again."""
+        import requests
+
+        content = b'fresh content'
+        rejected = Mock(status_code=416)
+        rejected.raise_for_status.side_effect = requests.exceptions.HTTPError(response=rejected)
+        fresh = Mock(status_code=200, headers={'content-length': str(len(content))})
+        fresh.raw = io.BytesIO(content)
+        mock_get.side_effect = [rejected, fresh]
+
+        destination = self.temp_dir / 'tool.zip'
+        (self.temp_dir / 'tool.zip.part').write_bytes(b'stale partial file that is too long')
+
+        self.assertTrue(self.installer.download_file('https://example.com/tool.zip', destination))
+        self.assertEqual(destination.read_bytes(), content)
+        self.assertNotIn('headers', mock_get.call_args_list[1][1])
+
+    @patch('src.installers.base.PARALLEL_DOWNLOAD_MIN_SIZE', 16)
+    @patch('src.installers.base.requests.Session.get')
+    def test_download_file_in_parallel_parts(self, mock_get):
+        """Test large files are fetched as parallel byte ranges and verified."""
+        import hashlib
+        content = bytes(range(256)) * 4
+        mock_get.side_effect, requested_ranges = self._range_server(content)
+
+        destination = self.temp_dir / 'big.zip'
+        result = self.installer.download_file(
+            'https://example.com/big.zip',
+            destination,
+            expected_checksum=hashlib.sha256(content).hexdigest()
+        )
+
+        self.assertTrue(result)
+        self.assertEqual(destination.read_bytes(), content)
+        self.assertEqual(sorted(requested_ranges), ['bytes=256-511', 'bytes=512-767', 'bytes=768-1023'])
+        for call in mock_get.call_args_list[1:]:
+            self.assertEqual(call[0][0], 'https://cdn.example.com/big.zip')
+
+    @patch('src.installers.base.PARALLEL_DOWNLOAD_MIN_SIZE', 16)
+    @patch('src.installers.base.requests.Session.get')
+    def test_download_file_parts_fall_back_to_single_stream(self, mock_get):
+        """Test a server ignoring Range requests gets a plain download instead."""
+        content = b'0123456789' * 10
+        mock_get.side_effect, _ = self._range_server(content, honor_ranges=False)
+
+        destination = self.temp_dir / 'big.zip'
+        result = self.installer.download_file('https://example.com/big.zip', destination)
+
+        self.assertTrue(result)
+        self.assertEqual(destination.read_bytes(), content)
+
+    @patch('src.installers.base.requests.Session.get')
+    def test_download_file_small_file_single_stream(self, mock_get):
+        """Test files under the parallel threshold use one request."""
+        content = b'small file'
+        mock_get.side_effect, requested_ranges = self._range_server(content)
+
+        destination = self.temp_dir / 'small.zip'
+        result = self.installer.download_file('https://example.com/small.zip', destination)
+
+        self.assertTrue(result)
+        self.assertEqual(destination.read_bytes(), content)
+        self.assertEqual(requested_ranges, [])
+        mock_get.assert_called_once()
+
+    @patch('src.installers.base.requests.Session.get')
     def test_download_file_timeout(self, mock_get):
         """Test file download timeout handling."""
         import requests.exceptions
@@ -158,7 +457,7 @@ class TestBaseInstaller(unittest.TestCase):
 
         self.assertFalse(result)
 
-    @patch('src.installers.base.requests.get')
+    @patch('src.installers.base.requests.Session.get')
     def test_download_file_http_error(self, mock_get):
         """Test file download HTTP error handling."""
         import requests.exceptions
@@ -198,6 +497,17 @@ class TestBaseInstaller(unittest.TestCase):
 
         self.assertFalse(success)
 
+    def test_command_env_inherits_when_proxy_exported(self):
+        """Test the environment is inherited when the proxies are already exported."""
+        self.proxy_manager.http_proxy = 'http://proxy:8080'
+
+        with patch.dict(os.environ, {'HTTP_PROXY': 'http://proxy:8080'}):
+            self.assertIsNone(self.installer._command_env())
+
+        with patch.dict(os.environ, {'HTTP_PROXY': 'http://other:3128'}):
+            env = self.installer._command_env()
+        self.assertEqual(env['HTTP_PROXY'], 'http://proxy:8080')
+
     def test_run_command_not_found(self):
         """Test running command that doesn't exist."""
         cmd = ['nonexistent_command_12345']
@@ -205,6 +515,61 @@ class TestBaseInstaller(unittest.TestCase):
 
         self.assertFalse(success)
 
+    def test_run_streaming_command_keeps_only_tail(self):
+        """Test streamed output is bounded to the last lines, stderr included."""
+        script = (
+            "import sys\n"
+            "for i in range(1000): print(f'line {i}')\n"
+            "print('boom', file=sys.stderr)\n"
+            "sys.exit(3)"
+        )
+
+        success, output = self.installer.run_streaming_command(
+            [sys.executable, '-c', script], cwd=self.temp_dir, tail_lines=5
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(output.splitlines(), ['line 996', 'line 997', 'line 998', 'line 999', 'boom'])
+
+    def test_run_streaming_command_shows_output_live(self):
+        """Test each output line is relayed to the console-visible log, tagged with the project."""
+        with patch('src.installers.base.logger') as mock_logger:
+            self.installer.run_streaming_command(
+                [sys.executable, '-c', "print('Downloading a'); print('Downloading b')"], cwd=self.temp_dir
+            )
+
+        name = self.installer.project_path.name
+        self.assertEqual(
+            [c.args[0] for c in mock_logger.output.call_args_list],
+            [f'[{name}] Downloading a', f'[{name}] Downloading b']
+        )
+
+    def test_run_streaming_command_success(self):
+        """Test a successful streamed command."""
+        success, output = self.installer.run_streaming_command(
+            [sys.executable, '-c', "print('BUILD SUCCESS')"], cwd=self.temp_dir
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(output, 'BUILD SUCCESS')
+
+    def test_run_streaming_command_timeout(self):
+        """Test a silent command is killed when it exceeds the timeout."""
+        success, output = self.installer.run_streaming_command(
+            [sys.executable, '-c', 'import time; time.sleep(30)'], cwd=self.temp_dir, timeout=0.2
+        )
+
+        self.assertFalse(success)
+        self.assertIn('timed out', output)
+
+    def test_run_streaming_command_not_found(self):
+        """Test a missing executable is reported instead of raised."""
+        success, output = self.installer.run_streaming_command(
+            ['nonexistent-command-xyz'], cwd=self.temp_dir
+        )
+
+        self.assertFalse(success)
+
     def test_find_executable_in_path(self):
         """Test finding executable in PATH."""
         # py or cmd should be in PATH on Windows
@@ -265,6 +630,169 @@ class TestBaseInstaller(unittest.TestCase):
 
         self.assertTrue(success)
 
+    @patch('src.installers.base.BaseInstaller.download_file')
+    def test_download_and_extract_multiple_roots(self, mock_download):
+        """Test no extracted directory is reported when the archive has several roots."""
+        import zipfile
+
+        zip_path = self.temp_dir / 'test.zip'
+        extract_dir = self.temp_dir / 'extract'
+        extract_dir.mkdir()
+
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr('README.txt', 'top-level file')
+            zf.writestr('first/file.txt', 'a')
+            zf.writestr('second/file.txt', 'b')
+
+        def download_side_effect(url, dest, expected_checksum=None):
+            shutil.copy(zip_path, dest)
+            return True
+
+        mock_download.side_effect = download_side_effect
+
+        success, extracted = self.installer.download_and_extract(
+            'https://example.com/test.zip',
+            extract_dir
+        )
+
+        self.assertTrue(success)
+        self.assertIsNone(extracted)
+        self.assertTrue((extract_dir / 'second' / 'file.txt').exists())
+
+    @patch('src.installers.base.BaseInstaller.download_file')
+    def test_download_and_extract_keeps_members_inside(self, mock_download):
+        """Test members are extracted with content and cannot escape the target."""
+        import zipfile
+
+        zip_path = self.temp_dir / 'test.zip'
+        extract_dir = self.temp_dir / 'extract'
+        extract_dir.mkdir()
+
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('tool-1.0/', '')
+            zf.writestr('tool-1.0/bin/tool.cmd', 'echo tool\n' * 100)
+            zf.writestr('tool-1.0/../../escape.txt', 'outside')
+
+        def download_side_effect(url, dest, expected_checksum=None):
+            shutil.copy(zip_path, dest)
+            return True
+
+        mock_download.side_effect = download_side_effect
+
+        success, extracted = self.installer.download_and_extract(
+            'https://example.com/test.zip',
+            extract_dir
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(extracted, extract_dir / 'tool-1.0')
+        self.assertEqual((extracted / 'bin' / 'tool.cmd').read_text(), 'echo tool\n' * 100)
+        self.assertTrue((extract_dir / 'tool-1.0' / 'escape.txt').exists())
+        self.assertFalse((self.temp_dir / 'escape.txt').exists())
+
+    def test_extract_with_tar_only_on_windows(self):
+        """Test native tar extraction is skipped off Windows and falls back on failure."""
+        zip_path = self.temp_dir / 'test.zip'
+
+        with patch('src.installers.base.sys.platform', 'linux'), \
+                patch('src.installers.base.subprocess.run') as mock_run:
+            self.assertFalse(BaseInstaller._extract_with_tar(zip_path, self.temp_dir))
+        mock_run.assert_not_called()
+
+        with patch('src.installers.base.sys.platform', 'win32'), \
+                patch.object(Path, 'is_file', return_value=True), \
+                patch('src.installers.base.subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=0, stderr='')
+            self.assertTrue(BaseInstaller._extract_with_tar(zip_path, self.temp_dir))
+
+            mock_run.return_value = Mock(returncode=1, stderr='Unrecognized archive format')
+            self.assertFalse(BaseInstaller._extract_with_tar(zip_path, self.temp_dir))
+
+        args = mock_run.call_args[0][0]
+        self.assertTrue(args[0].endswith('tar.exe'))
+        self.assertEqual(args[1:], ['-xf', str(zip_path), '-C', str(self.temp_dir)])
+
+    @unittest.skipIf(os.name == 'nt', "Unix permissions are not applied on Windows")
+    def test_extract_members_keeps_unix_permissions(self):
+        """Test executable bits stored in the archive survive extraction."""
+        import zipfile
+
+        zip_path = self.temp_dir / 'modes.zip'
+        extract_dir = self.temp_dir / 'extract'
+
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            script = zipfile.ZipInfo('tool/bin/mvn')
+            script.external_attr = 0o555 << 16
+            zf.writestr(script, '#!/bin/sh\n')
+            zf.writestr('tool/README.txt', 'docs')
+
+        with zipfile.ZipFile(zip_path) as zf:
+            BaseInstaller._extract_members(zip_path, zf.infolist(), extract_dir)
+
+        script_mode = (extract_dir / 'tool' / 'bin' / 'mvn').stat().st_mode & 0o777
+        self.assertEqual(script_mode, 0o755)
+        self.assertEqual((extract_dir / 'tool' / 'README.txt').read_text(), 'docs')
+
+    def test_extract_members_in_parallel(self):
+        """Test many members are extracted concurrently with the last duplicate winning."""
+        import zipfile
+
+        zip_path = self.temp_dir / 'many.zip'
+        extract_dir = self.temp_dir / 'extract'
+
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for i in range(50):
+                zf.writestr(f'pkg/dir{i % 5}/file{i}.txt', f'content {i}')
+            zf.writestr('pkg/dir0/file0.txt', 'replaced')
+
+        with zipfile.ZipFile(zip_path) as zf:
+            infos = zf.infolist()
+
+        BaseInstaller._extract_members(zip_path, infos, extract_dir)
+
+        self.assertEqual((extract_dir / 'pkg' / 'dir0' / 'file0.txt').read_text(), 'replaced')
+        for i in range(1, 50):
+            path = extract_dir / 'pkg' / f'dir{i % 5}' / f'file{i}.txt'
+            self.assertEqual(path.read_text(), f'content {i}')
+
+    def test_extract_members_large_and_mixed_compression(self):
+        """Test multi-block deflated and stored members, and a bzip2 member via ZipFile."""
+        import zipfile
+
+        zip_path = self.temp_dir / 'mixed.zip'
+        extract_dir = self.temp_dir / 'extract'
+        large = os.urandom(1024 * 1024) + b'x' * (3 * 1024 * 1024)
+
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr('pkg/lib/modules', large, compress_type=zipfile.ZIP_DEFLATED)
+            zf.writestr('pkg/stored.bin', large[:5000], compress_type=zipfile.ZIP_STORED)
+            zf.writestr('pkg/empty.txt', b'', compress_type=zipfile.ZIP_DEFLATED)
+            zf.writestr('pkg/legacy.txt', b'bzip2 content', compress_type=zipfile.ZIP_BZIP2)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            BaseInstaller._extract_members(zip_path, zf.infolist(), extract_dir)
+
+        self.assertEqual((extract_dir / 'pkg' / 'lib' / 'modules').read_bytes(), large)
+        self.assertEqual((extract_dir / 'pkg' / 'stored.bin').read_bytes(), large[:5000])
+        self.assertEqual((extract_dir / 'pkg' / 'empty.txt').read_bytes(), b'')
+        self.assertEqual((extract_dir / 'pkg' / 'legacy.txt').read_bytes(), b'bzip2 content')
+
+    def test_extract_members_detects_corruption(self):
+        """Test a member whose data does not match its CRC-32 is rejected."""
+        import zipfile
+
+        zip_path = self.temp_dir / 'corrupt.zip'
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr('pkg/data.txt', b'original content', compress_type=zipfile.ZIP_STORED)
+        content = zip_path.read_bytes()
+        zip_path.write_bytes(content.replace(b'original', b'tampered'))
+
+        with zipfile.ZipFile(zip_path) as zf:
+            infos = zf.infolist()
+
+        with self.assertRaises(zipfile.BadZipFile):
+            BaseInstaller._extract_members(zip_path, infos, self.temp_dir / 'extract')
+
     @patch('src.installers.base.BaseInstaller.download_file')
     def test_download_and_extract_download_failure(self, mock_download):
         """Test download and extract with download failure."""
@@ -281,6 +809,47 @@ class TestBaseInstaller(unittest.TestCase):
         self.assertFalse(success)
         self.assertIsNone(extracted)
 
+    @patch('src.installers.base.BaseInstaller.download_file')
+    def test_download_and_extract_reuses_verified_zip(self, mock_download):
+        """Test a leftover ZIP with a matching checksum is extracted without downloading."""
+        import hashlib
+        import zipfile
+
+        extract_dir = self.temp_dir / 'extract'
+        extract_dir.mkdir()
+        zip_path = extract_dir / 'test.zip'
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr('tool/file.txt', 'cached')
+        checksum = hashlib.sha256(zip_path.read_bytes()).hexdigest()
+
+        success, extracted = self.installer.download_and_extract(
+            'https://example.com/test.zip',
+            extract_dir,
+            expected_checksum=checksum
+        )
+
+        self.assertTrue(success)
+        mock_download.assert_not_called()
+        self.assertEqual((extracted / 'file.txt').read_text(), 'cached')
+
+    @patch('src.installers.base.BaseInstaller.download_file')
+    def test_download_and_extract_redownloads_mismatched_zip(self, mock_download):
+        """Test a leftover ZIP that fails the checksum is downloaded again."""
+        mock_download.return_value = False
+
+        extract_dir = self.temp_dir / 'extract'
+        extract_dir.mkdir()
+        (extract_dir / 'test.zip').write_bytes(b'truncated')
+
+        success, _ = self.installer.download_and_extract(
+            'https://example.com/test.zip',
+            extract_dir,
+            expected_checksum='0' * 64
+        )
+
+        self.assertFalse(success)
+        mock_download.assert_called_once()
+
 
 class TestSetupToolEnvironment(unittest.TestCase):
     """Test cases for setup_tool_environment method."""
@@ -301,25 +870,21 @@ class TestSetupToolEnvironment(unittest.TestCase):
 
     def test_setup_tool_environment_sets_home_var(self):
         """Test setup_tool_environment sets HOME variable."""
-        with patch.object(self.installer.env_manager, 'append_to_env') as mock_append, \
-             patch.object(self.installer.env_manager, 'set_system_path') as mock_set_path:
+        with patch.object(self.installer.env_manager, 'persist_tool_environment'):
             self.installer.setup_tool_environment('TEST', '/home/path', '/bin/path')
             self.assertEqual(os.environ.get('TEST_HOME'), '/home/path')
 
     def test_setup_tool_environment_adds_to_path(self):
         """Test setup_tool_environment adds to PATH."""
-        with patch.object(self.installer.env_manager, 'append_to_env') as mock_append, \
-             patch.object(self.installer.env_manager, 'set_system_path') as mock_set_path:
+        with patch.object(self.installer.env_manager, 'persist_tool_environment'):
             self.installer.setup_tool_environment('TEST', '/home/path', '/bin/path')
             self.assertIn('/bin/path', os.environ.get('PATH', ''))
 
     def test_setup_tool_environment_calls_env_manager(self):
         """Test setup_tool_environment calls env_manager methods."""
-        with patch.object(self.installer.env_manager, 'append_to_env') as mock_append, \
-             patch.object(self.installer.env_manager, 'set_system_path') as mock_set_path:
+        with patch.object(self.installer.env_manager, 'persist_tool_environment') as mock_persist:
             self.installer.setup_tool_environment('TEST', '/home/path', '/bin/path')
-            mock_append.assert_called_once_with('TEST_HOME', '/home/path')
-            mock_set_path.assert_called_once_with('/bin/path')
+            mock_persist.assert_called_once_with({'TEST_HOME': '/home/path'}, ['/bin/path'])
 
 
 if __name__ == '__main__':
@@ -5,7 +5,10 @@ from unittest.mock import Mock, patch
 import tempfile
 import shutil
 
-from src.cli import DevStartCLI
+from click.testing import CliRunner
+
+from src.cli import DevStartCLI, main
+from src.git_check_cache import GitCheckCache
 
 
 class TestCLIBasic(unittest.TestCase):
@@ -15,6 +18,7 @@ class TestCLIBasic(unittest.TestCase):
         """Set up test fixtures."""
         self.temp_dir = Path(tempfile.mkdtemp())
         self.cli = DevStartCLI()
+        self.cli.git_check_cache = GitCheckCache(self.temp_dir / 'git-check.json')
 
     def tearDown(self):
         """Clean up test fixtures."""
@@ -63,10 +67,34 @@ class TestCLIBasic(unittest.TestCase):
     @patch('subprocess.run')
     def test_ensure_git_installed_already_installed(self, mock_run):
         """Test Git check when already installed."""
-        mock_run.return_value = Mock(returncode=0, stdout='git version 2.40.0')
+        def run(cmd, *args, **kwargs):
+            if '--get-regexp' in cmd:
+                return Mock(returncode=0, stdout='user.name John Doe\nuser.email john@example.com\n')
+            return Mock(returncode=0, stdout='git version 2.40.0')
+
+        mock_run.side_effect = run
         result = self.cli.ensure_git_installed()
         self.assertTrue(result)
 
+    @patch('subprocess.run')
+    def test_ensure_git_installed_uses_cached_check(self, mock_run):
+        """Test a valid cached Git check skips the subprocess calls."""
+        with patch.object(self.cli.git_check_cache, 'is_valid', return_value=True):
+            self.assertTrue(self.cli.ensure_git_installed())
+        mock_run.assert_not_called()
+
+    def test_ensure_git_installed_force_check(self):
+        """Test force_check ignores the cache and records the fresh result."""
+        from src.installers.git_installer import GitInstaller
+        with patch.object(self.cli.git_check_cache, 'is_valid', return_value=True), \
+                patch.object(self.cli.git_check_cache, 'save') as mock_save, \
+                patch.object(GitInstaller, 'is_installed', return_value=True) as mock_installed, \
+                patch.object(GitInstaller, 'detect_version', return_value='2.43.0'), \
+                patch.object(GitInstaller, '_is_git_configured', return_value=True):
+            self.assertTrue(self.cli.ensure_git_installed(force_check=True))
+        mock_installed.assert_called_once()
+        mock_save.assert_called_once_with('2.43.0')
+
     def test_safe_rmtree_success(self):
         """Test safe directory removal success."""
         test_dir = self.temp_dir / 'test_removal'
@@ -77,6 +105,24 @@ class TestCLIBasic(unittest.TestCase):
         self.assertTrue(result)
         self.assertFalse(test_dir.exists())
 
+    def test_safe_rmtree_nested_tree(self):
+        """Test removal of a tree with many subdirectories and read-only files."""
+        import os
+        import stat as stat_module
+        test_dir = self.temp_dir / 'tree'
+        for i in range(10):
+            sub = test_dir / f'dir{i}' / 'nested'
+            sub.mkdir(parents=True)
+            (sub / 'file.txt').write_text('x', encoding='utf-8')
+        readonly = test_dir / 'dir0' / 'readonly.txt'
+        readonly.write_text('x', encoding='utf-8')
+        os.chmod(readonly, stat_module.S_IREAD)
+        (test_dir / 'top.txt').write_text('x', encoding='utf-8')
+
+        result = self.cli.safe_rmtree(str(test_dir))
+        self.assertTrue(result)
+        self.assertFalse(test_dir.exists())
+
     def test_safe_rmtree_nonexistent(self):
         """Test safe directory removal when directory doesn't exist."""
         non_existent = str(self.temp_dir / 'non_existent')
@@ -84,26 +130,53 @@ class TestCLIBasic(unittest.TestCase):
         # Returns True because nothing to remove is considered success
         self.assertTrue(result)
 
+    @patch('time.sleep')
     @patch('shutil.rmtree')
-    @patch('os.path.exists')
-    def test_safe_rmtree_permission_error(self, mock_exists, mock_rmtree):
+    def test_safe_rmtree_permission_error(self, mock_rmtree, mock_sleep):
         """Test safe directory removal with permission error."""
-        mock_exists.return_value = True
+        (self.temp_dir / 'locked.txt').write_text('test', encoding='utf-8')
         mock_rmtree.side_effect = PermissionError("Access denied")
 
         result = self.cli.safe_rmtree(str(self.temp_dir))
         self.assertFalse(result)
 
+    @patch('random.uniform', return_value=1.0)
+    @patch('time.sleep')
     @patch('shutil.rmtree')
-    @patch('os.path.exists')
-    def test_safe_rmtree_general_exception(self, mock_exists, mock_rmtree):
+    def test_safe_rmtree_exponential_backoff(self, mock_rmtree, mock_sleep, mock_uniform):
+        """Test retry delays double on each locked attempt."""
+        (self.temp_dir / 'locked.txt').write_text('test', encoding='utf-8')
+        mock_rmtree.side_effect = PermissionError("Access denied")
+
+        result = self.cli.safe_rmtree(str(self.temp_dir), max_retries=4)
+
+        self.assertFalse(result)
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 3)
+        for actual, expected in zip(delays, [0.1, 0.2, 0.4]):
+            self.assertAlmostEqual(actual, expected)
+
+    @patch('shutil.rmtree')
+    def test_safe_rmtree_general_exception(self, mock_rmtree):
         """Test safe directory removal with OSError exception."""
-        mock_exists.return_value = True
+        (self.temp_dir / 'file.txt').write_text('test', encoding='utf-8')
         mock_rmtree.side_effect = OSError("Unknown error")
 
         result = self.cli.safe_rmtree(str(self.temp_dir))
         self.assertFalse(result)
 
+    @patch('shutil.rmtree')
+    def test_safe_rmtree_empty_directory(self, mock_rmtree):
+        """Test an empty directory is removed without walking it."""
+        test_dir = self.temp_dir / 'empty'
+        test_dir.mkdir()
+
+        result = self.cli.safe_rmtree(str(test_dir))
+
+        self.assertTrue(result)
+        self.assertFalse(test_dir.exists())
+        mock_rmtree.assert_not_called()
+
     @patch('click.confirm')
     @patch('click.prompt')
     def test_configure_git(self, mock_prompt, mock_confirm):
@@ -195,6 +268,29 @@ class TestCLIBasic(unittest.TestCase):
         installer = self.cli._get_installer(Technology.JAVA_SPRINGBOOT, self.temp_dir)
         self.assertIsNotNone(installer)
 
+    def test_get_installer_java_variants(self):
+        """Test all Java technologies map to the Java installer."""
+        from src.detector import Technology
+        from src.installers.java_installer import JavaInstaller
+        for tech in (Technology.JAVA_SPRINGBOOT, Technology.JAVA_MAVEN, Technology.JAVA_GRADLE):
+            self.assertIsInstance(self.cli._get_installer(tech, self.temp_dir), JavaInstaller)
+
+    def test_installers_not_imported_at_startup(self):
+        """Test importing the CLI does not load installer modules or requests."""
+        import subprocess
+        import sys
+        code = (
+            "import sys, src.cli; "
+            "print(any(m.startswith('src.installers.') for m in sys.modules), "
+            "'requests' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True, text=True,
+            cwd=str(Path(__file__).resolve().parent.parent)
+        )
+        self.assertEqual(result.stdout.strip(), 'False False')
+
     def test_get_installer_nodejs(self):
         """Test getting Node.js installer."""
         from src.detector import Technology
@@ -249,6 +345,127 @@ class TestCLIBasic(unittest.TestCase):
                     result = self.cli.process_repository('https://github.com/user/test_repo')
                     self.assertFalse(result)
 
+    def test_process_repository_reuses_existing_clone(self):
+        """Test an existing clone of the same repository is updated, not re-cloned."""
+        from src.detector import Technology
+
+        mock_installer = Mock()
+        mock_installer.is_installed.return_value = True
+        mock_installer.configure.return_value = True
+
+        with patch('pathlib.Path.exists', return_value=True):
+            with patch.object(self.cli.repo_manager, 'is_same_remote', return_value=True):
+                with patch.object(self.cli.repo_manager, 'update_repository', return_value=True):
+                    with patch.object(self.cli.repo_manager, 'clone_repository') as mock_clone:
+                        with patch.object(self.cli, 'safe_rmtree') as mock_rmtree:
+                            with patch.object(self.cli.detector, 'detect', return_value=Technology.PYTHON):
+                                with patch.object(self.cli, '_get_installer', return_value=mock_installer):
+                                    result = self.cli.process_repository('https://github.com/user/test_repo')
+
+        self.assertTrue(result)
+        mock_clone.assert_not_called()
+        mock_rmtree.assert_not_called()
+
+    def test_process_repository_never_rolls_back_reused_clone(self):
+        """Test a failed configure does not delete a clone that existed before the run."""
+        from src.detector import Technology
+
+        mock_installer = Mock()
+        mock_installer.configure.return_value = False
+
+        with patch('pathlib.Path.exists', return_value=True):
+            with patch.object(self.cli.repo_manager, 'is_same_remote', return_value=True):
+                with patch.object(self.cli.repo_manager, 'update_repository', return_value=True):
+                    with patch.object(self.cli, '_is_installed', return_value=True):
+                        with patch.object(self.cli.detector, 'detect', return_value=Technology.PYTHON):
+                            with patch.object(self.cli, '_get_installer', return_value=mock_installer):
+                                with patch.object(self.cli, '_rollback') as mock_rollback:
+                                    result = self.cli.process_repository('https://github.com/user/test_repo')
+
+        self.assertFalse(result)
+        mock_rollback.assert_not_called()
+
+    def test_process_repository_cancelled_rolls_back_new_clone(self):
+        """Test a cancelled run removes the clone it created and stops before installing."""
+        def clone_then_cancel(*args, **kwargs):
+            self.cli.cancel_event.set()
+            return True
+
+        with patch.object(self.cli.repo_manager, 'clone_repository', side_effect=clone_then_cancel):
+            with patch.object(self.cli, '_detect_technology') as mock_detect:
+                with patch.object(self.cli, '_rollback') as mock_rollback:
+                    result = self.cli.process_repository('https://github.com/user/new_repo')
+
+        self.assertFalse(result)
+        mock_detect.assert_not_called()
+        mock_rollback.assert_called_once_with(self.cli.base_dir / 'new_repo')
+
+    def test_detect_technology_uses_cache(self):
+        """Test detection is skipped when the commit is already cached."""
+        from src.detector import Technology
+
+        with patch.object(self.cli.repo_manager, 'get_head_sha', return_value='abc123'):
+            with patch.object(self.cli.detect_cache, 'get', return_value=Technology.NODEJS):
+                with patch.object(self.cli.detector, 'detect') as mock_detect:
+                    result = self.cli._detect_technology('https://github.com/user/repo', self.temp_dir)
+
+        self.assertEqual(result, Technology.NODEJS)
+        mock_detect.assert_not_called()
+
+    def test_detect_technology_stores_result(self):
+        """Test a fresh detection is stored in the cache."""
+        from src.detector import Technology
+
+        with patch.object(self.cli.repo_manager, 'get_head_sha', return_value='abc123'):
+            with patch.object(self.cli.detect_cache, 'get', return_value=None):
+                with patch.object(self.cli.detect_cache, 'set') as mock_set:
+                    with patch.object(self.cli.detector, 'detect', return_value=Technology.PYTHON):
+                        result = self.cli._detect_technology('https://github.com/user/repo', self.temp_dir)
+
+        self.assertEqual(result, Technology.PYTHON)
+        mock_set.assert_called_once_with('https://github.com/user/repo', 'abc123', Technology.PYTHON)
+
+    def test_is_installed_checked_once_per_installer(self):
+        """Test the first check is shared by technologies using the same installer."""
+        from src.detector import Technology
+
+        installer = Mock()
+        installer.is_installed.return_value = True
+
+        self.assertTrue(self.cli._is_installed(Technology.JAVA_MAVEN, installer))
+        self.assertTrue(self.cli._is_installed(Technology.JAVA_GRADLE, installer))
+
+        installer.is_installed.assert_called_once()
+        self.assertNotIn(Technology.PYTHON, self.cli._installed_cache)
+
+    def test_install_locks_per_installer(self):
+        """Test technologies sharing an installer share a lock and others do not."""
+        from src.detector import Technology
+
+        def lock_for(technology):
+            return self.cli._install_locks[self.cli.INSTALLERS[technology]]
+
+        self.assertIs(lock_for(Technology.JAVA_MAVEN), lock_for(Technology.JAVA_GRADLE))
+        self.assertIsNot(lock_for(Technology.JAVA_MAVEN), lock_for(Technology.NODEJS))
+        self.assertIsNot(lock_for(Technology.PYTHON), lock_for(Technology.NODEJS))
+
+    def test_process_repository_uses_installed_cache(self):
+        """Test a cached installed check skips the installer probe."""
+        from src.detector import Technology
+
+        mock_installer = Mock()
+        mock_installer.configure.return_value = True
+        self.cli._installed_cache[Technology.PYTHON] = True
+
+        with patch.object(self.cli.repo_manager, 'clone_repository', return_value=True):
+            with patch.object(self.cli.detector, 'detect', return_value=Technology.PYTHON):
+                with patch.object(self.cli, '_get_installer', return_value=mock_installer):
+                    result = self.cli.process_repository('https://github.com/user/repo')
+
+        self.assertTrue(result)
+        mock_installer.is_installed.assert_not_called()
+        mock_installer.install.assert_not_called()
+
     def test_process_repository_unknown_technology(self):
         """Test processing repository when technology cannot be detected."""
         from src.detector import Technology
@@ -340,5 +557,126 @@ class TestCLIBasic(unittest.TestCase):
                             mock_installer.configure.assert_called_once()
 
 
+class TestMainCommand(unittest.TestCase):
+    """Test the click entry point."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    def _mock_cli(self, mock_cli_class):
+        """Configure the mocked DevStartCLI with a real URL canonicalizer."""
+        from src.repo_manager import RepositoryManager
+        mock_cli = mock_cli_class.return_value
+        mock_cli.ensure_git_installed.return_value = True
+        repo_manager = RepositoryManager(Mock())
+        mock_cli.repo_manager.canonicalize_url.side_effect = repo_manager.canonicalize_url
+        mock_cli.repo_manager.get_repo_name.side_effect = repo_manager.get_repo_name
+        mock_cli.base_dir = Path(tempfile.gettempdir()) / 'dev-start-test'
+        return mock_cli
+
+    @patch('src.cli.DevStartCLI')
+    def test_main_processes_all_repositories(self, mock_cli_class):
+        """Test every repository is processed and summarized."""
+        mock_cli = self._mock_cli(mock_cli_class)
+        mock_cli.process_repository.return_value = True
+
+        repos = [f'https://github.com/user/repo{i}' for i in range(5)]
+        result = self.runner.invoke(main, ['--max-workers', '3'] + repos)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_cli.process_repository.call_count, 5)
+        processed = {c.args[0] for c in mock_cli.process_repository.call_args_list}
+        self.assertEqual(processed, set(repos))
+
+    @patch('src.cli.DevStartCLI')
+    def test_main_counts_failures_and_exceptions(self, mock_cli_class):
+        """Test failed and raising repositories make the command fail."""
+        mock_cli = self._mock_cli(mock_cli_class)
+        mock_cli.process_repository.side_effect = [True, False, RuntimeError('boom')]
+
+        result = self.runner.invoke(main, [
+            '--max-workers', '1',
+            'https://github.com/user/a',
+            'https://github.com/user/b',
+            'https://github.com/user/c',
+        ])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Failed', result.output)
+
+    @patch('src.cli.DevStartCLI')
+    def test_main_skips_duplicate_repositories(self, mock_cli_class):
+        """Test URLs pointing to the same repository are processed once."""
+        mock_cli = self._mock_cli(mock_cli_class)
+        mock_cli.process_repository.return_value = True
+
+        result = self.runner.invoke(main, [
+            'https://github.com/user/repo',
+            'https://GitHub.com/user/repo.git',
+            'git@github.com:user/repo.git',
+            'https://github.com/user/other',
+        ])
+
+        self.assertEqual(result.exit_code, 0)
+        processed = [c.args[0] for c in mock_cli.process_repository.call_args_list]
+        self.assertEqual(sorted(processed), ['https://github.com/user/other', 'https://github.com/user/repo'])
+
+    @patch('src.cli.DevStartCLI')
+    def test_main_serializes_repositories_with_same_directory(self, mock_cli_class):
+        """Test repositories cloning into the same directory never run at the same time."""
+        import threading
+        import time
+
+        mock_cli = self._mock_cli(mock_cli_class)
+        active = {}
+        overlaps = []
+        lock = threading.Lock()
+
+        def process(repo_url):
+            name = repo_url.rsplit('/', 1)[-1]
+            with lock:
+                if active.get(name):
+                    overlaps.append(repo_url)
+                active[name] = True
+            time.sleep(0.05)
+            with lock:
+                active[name] = False
+            return True
+
+        mock_cli.process_repository.side_effect = process
+
+        result = self.runner.invoke(main, [
+            '--max-workers', '4',
+            'https://github.com/a/api',
+            'https://github.com/b/api',
+            'https://gitlab.com/c/api.git',
+            'https://github.com/a/web',
+        ])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_cli.process_repository.call_count, 4)
+        self.assertEqual(overlaps, [])
+
+    @patch('src.cli.as_completed', side_effect=KeyboardInterrupt)
+    @patch('src.cli.DevStartCLI')
+    def test_main_ctrl_c_cancels_run(self, mock_cli_class, mock_as_completed):
+        """Test Ctrl-C signals workers to stop and exits with the interrupt status."""
+        mock_cli = self._mock_cli(mock_cli_class)
+        mock_cli.process_repository.return_value = True
+
+        result = self.runner.invoke(main, ['https://github.com/user/a', 'https://github.com/user/b'])
+
+        cancel_event = mock_cli_class.call_args.kwargs['cancel_event']
+        self.assertTrue(cancel_event.is_set())
+        self.assertEqual(result.exit_code, 130)
+        mock_cli.detect_cache.save.assert_called_once()
+
+    def test_main_rejects_invalid_max_workers(self):
+        """Test --max-workers must be at least 1."""
+        result = self.runner.invoke(main, ['--max-workers', '0', 'https://github.com/user/a'])
+        self.assertNotEqual(result.exit_code, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
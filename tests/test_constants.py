@@ -1,5 +1,6 @@
 """Tests for constants module."""
 import unittest
+from collections.abc import Mapping
 from pathlib import Path
 
 from src.constants import (
@@ -18,6 +19,7 @@ from src.constants import (
     ALLOWED_URL_SCHEMES,
     ENV_VAR_NAME_PATTERN,
     PROXY_URL_PATTERN,
+    PROXY_URL_RE,
     MAX_DOWNLOAD_RETRIES,
     MAX_RMTREE_RETRIES,
     DOWNLOAD_CHUNK_SIZE,
@@ -66,7 +68,15 @@ class TestConstants(unittest.TestCase):
         required_keys = ['git', 'java', 'maven', 'nodejs', 'python']
         for key in required_keys:
             self.assertIn(key, DOWNLOAD_URLS)
-            self.assertIsInstance(DOWNLOAD_URLS[key], dict)
+            self.assertIsInstance(DOWNLOAD_URLS[key], Mapping)
+
+    def test_version_tables_are_read_only(self):
+        """Test version and download tables cannot be modified at runtime."""
+        with self.assertRaises(TypeError):
+            DEFAULT_VERSIONS['java'] = '8'
+        with self.assertRaises(TypeError):
+            DOWNLOAD_URLS['java']['8'] = 'https://example.com/jdk8.zip'
+        self.assertIsInstance(DOWNLOAD_URLS['maven'][DEFAULT_VERSIONS['maven']], tuple)
 
     def test_download_urls_contain_default_versions(self):
         """Test download URLs contain entries for default versions."""
@@ -81,15 +91,16 @@ class TestConstants(unittest.TestCase):
 
     def test_download_checksums_structure(self):
         """Test download checksums have correct structure."""
-        self.assertIsInstance(DOWNLOAD_CHECKSUMS, dict)
+        self.assertIsInstance(DOWNLOAD_CHECKSUMS, Mapping)
         for key, value in DOWNLOAD_CHECKSUMS.items():
-            self.assertIsInstance(value, dict)
+            self.assertIsInstance(value, Mapping)
 
     def test_allowed_url_schemes(self):
         """Test allowed URL schemes are defined."""
         self.assertIn('http', ALLOWED_URL_SCHEMES)
         self.assertIn('https', ALLOWED_URL_SCHEMES)
         self.assertIn('git', ALLOWED_URL_SCHEMES)
+        self.assertIsInstance(ALLOWED_URL_SCHEMES, frozenset)
 
     def test_env_var_name_pattern_valid(self):
         """Test environment variable name pattern matches valid names."""
@@ -125,6 +136,11 @@ class TestConstants(unittest.TestCase):
                 f"Pattern should match '{url}'"
             )
 
+    def test_compiled_patterns_match_string_patterns(self):
+        """Test precompiled patterns are built from the string constants."""
+        self.assertEqual(PROXY_URL_RE.pattern, PROXY_URL_PATTERN)
+        self.assertIsNone(PROXY_URL_RE.match('ftp://proxy:21'))
+
     def test_retry_values_positive(self):
         """Test retry values are positive."""
         self.assertGreater(MAX_DOWNLOAD_RETRIES, 0)
@@ -165,7 +181,7 @@ class TestDownloadURLsIntegrity(unittest.TestCase):
     def test_maven_urls_are_https(self):
         """Test Maven download URLs use HTTPS."""
         for version, urls in DOWNLOAD_URLS['maven'].items():
-            if isinstance(urls, list):
+            if isinstance(urls, (list, tuple)):
                 for url in urls:
                     self.assertTrue(
                         url.startswith('https://'),
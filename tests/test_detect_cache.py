@@ -0,0 +1,57 @@
+"""Tests for the detection cache."""
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from src.detect_cache import DetectionCache
+from src.detector import Technology
+
+
+class TestDetectionCache(unittest.TestCase):
+    """Test cases for DetectionCache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_file = self.temp_dir / 'detect-cache.json'
+        self.cache = DetectionCache(self.cache_file)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_get_missing_entry(self):
+        """Test lookup of an uncached commit returns None."""
+        self.assertIsNone(self.cache.get('https://github.com/user/repo', 'abc123'))
+
+    def test_set_and_get(self):
+        """Test cached technology is returned for the same URL and commit."""
+        self.cache.set('https://github.com/user/repo', 'abc123', Technology.PYTHON)
+
+        self.assertEqual(self.cache.get('https://github.com/user/repo', 'abc123'), Technology.PYTHON)
+        self.assertIsNone(self.cache.get('https://github.com/user/repo', 'def456'))
+
+    def test_save_and_load_roundtrip(self):
+        """Test entries persist across cache instances."""
+        self.cache.set('https://github.com/user/repo', 'abc123', Technology.NODEJS)
+        self.cache.save()
+
+        reloaded = DetectionCache(self.cache_file)
+        reloaded.load()
+        self.assertEqual(reloaded.get('https://github.com/user/repo', 'abc123'), Technology.NODEJS)
+
+    def test_save_without_changes_does_not_write(self):
+        """Test an unchanged cache is not written to disk."""
+        self.cache.save()
+        self.assertFalse(self.cache_file.exists())
+
+    def test_load_corrupt_file(self):
+        """Test a corrupt cache file is ignored."""
+        self.cache_file.write_text('{not json', encoding='utf-8')
+        self.cache.load()
+        self.assertIsNone(self.cache.get('https://github.com/user/repo', 'abc123'))
+
+
+if __name__ == '__main__':
+    unittest.main()
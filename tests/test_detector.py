@@ -3,7 +3,7 @@ import unittest
 from pathlib import Path
 import tempfile
 import shutil
-from src.detector import TechnologyDetector, Technology
+from src.detector import TechnologyDetector, Technology, BuildTool
 
 
 class TestTechnologyDetector(unittest.TestCase):
@@ -85,6 +85,16 @@ class TestTechnologyDetector(unittest.TestCase):
         result = self.detector.detect(non_existent)
         self.assertEqual(result, Technology.UNKNOWN)
 
+    def test_detect_build_tool(self):
+        """Test build tool detection prefers Gradle over Maven."""
+        self.assertEqual(self.detector.detect_build_tool(self.temp_dir), BuildTool.UNKNOWN)
+
+        (self.temp_dir / 'pom.xml').write_text('<project/>', encoding='utf-8')
+        self.assertEqual(self.detector.detect_build_tool(self.temp_dir), BuildTool.MAVEN)
+
+        (self.temp_dir / 'gradlew').write_text('', encoding='utf-8')
+        self.assertEqual(self.detector.detect_build_tool(self.temp_dir), BuildTool.GRADLE)
+
     def test_get_root_files(self):
         """Test getting root files from repository."""
         # Create some test files
@@ -93,19 +103,67 @@ class TestTechnologyDetector(unittest.TestCase):
         (self.temp_dir / 'subdir').mkdir()
 
         files = self.detector._get_root_files(self.temp_dir)
-        self.assertIn('file1.txt', files)
-        self.assertIn('file2.py', files)
-        self.assertEqual(len([f for f in files if f == 'subdir']), 0)
+        self.assertEqual(files, frozenset({'file1.txt', 'file2.py'}))
+
+    def test_get_root_files_reuses_listing_until_directory_changes(self):
+        """Test the root listing is cached by directory mtime."""
+        import os
+        import time
+        from unittest.mock import patch
+        (self.temp_dir / 'requirements.txt').write_text('flask', encoding='utf-8')
+        old = time.time() - 60
+        os.utime(self.temp_dir, (old, old))
+
+        with patch('src.detector.os.scandir', wraps=os.scandir) as mock_scandir:
+            first = self.detector._get_root_files(self.temp_dir)
+            second = self.detector._get_root_files(self.temp_dir)
+            self.assertEqual(mock_scandir.call_count, 1)
+
+            (self.temp_dir / 'package.json').write_text('{}', encoding='utf-8')
+            os.utime(self.temp_dir, (old + 30, old + 30))
+            third = self.detector._get_root_files(self.temp_dir)
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_scandir.call_count, 2)
+        self.assertEqual(third, frozenset({'requirements.txt', 'package.json'}))
+
+    def test_get_root_files_does_not_cache_recently_modified_directory(self):
+        """Test a directory modified just now is listed again on the next call."""
+        (self.temp_dir / 'requirements.txt').write_text('flask', encoding='utf-8')
+        self.detector._get_root_files(self.temp_dir)
+
+        # Same-tick change: the directory mtime is left unchanged
+        import os
+        mtime = os.stat(self.temp_dir).st_mtime_ns
+        (self.temp_dir / 'package.json').write_text('{}', encoding='utf-8')
+        os.utime(self.temp_dir, ns=(mtime, mtime))
+
+        self.assertIn('package.json', self.detector._get_root_files(self.temp_dir))
+
+    def test_get_root_files_missing_directory(self):
+        """Test a missing directory is reported as None."""
+        self.assertIsNone(self.detector._get_root_files(self.temp_dir / 'missing'))
+
+    def test_get_root_files_follows_symlinks(self):
+        """Test symlinked files in the root are listed as files."""
+        target = self.temp_dir / 'shared-pom.xml'
+        target.write_text('<project/>', encoding='utf-8')
+        try:
+            (self.temp_dir / 'pom.xml').symlink_to(target)
+        except (OSError, NotImplementedError):
+            self.skipTest("Symlinks not supported")
+
+        self.assertIn('pom.xml', self.detector._get_root_files(self.temp_dir))
 
     def test_matches_technology_python(self):
         """Test matching Python technology."""
-        files = ['requirements.txt', 'main.py']
+        files = frozenset({'requirements.txt', 'main.py'})
         result = self.detector._matches_technology(self.temp_dir, files, Technology.PYTHON)
         self.assertTrue(result)
 
     def test_matches_technology_no_match(self):
         """Test not matching any technology."""
-        files = ['random.txt', 'other.md']
+        files = frozenset({'random.txt', 'other.md'})
         result = self.detector._matches_technology(self.temp_dir, files, Technology.PYTHON)
         self.assertFalse(result)
 
@@ -114,21 +172,57 @@ class TestTechnologyDetector(unittest.TestCase):
         pom_file = self.temp_dir / 'pom.xml'
         pom_file.write_text('spring-boot-starter-web', encoding='utf-8')
 
-        result = self.detector._check_indicators(pom_file, ['spring-boot'])
+        result = self.detector._check_indicators(pom_file, Technology.JAVA_SPRINGBOOT)
+        self.assertTrue(result)
+
+    def test_check_indicators_case_insensitive(self):
+        """Test indicators match regardless of case in the file."""
+        gradle_file = self.temp_dir / 'build.gradle'
+        gradle_file.write_text("id 'Org.SpringFramework.Boot'", encoding='utf-8')
+
+        result = self.detector._check_indicators(gradle_file, Technology.JAVA_SPRINGBOOT)
         self.assertTrue(result)
 
+    def test_check_indicators_empty_file(self):
+        """Test an empty build file has no indicators."""
+        pom_file = self.temp_dir / 'pom.xml'
+        pom_file.write_bytes(b'')
+
+        result = self.detector._check_indicators(pom_file, Technology.JAVA_SPRINGBOOT)
+        self.assertFalse(result)
+
+    def test_check_indicators_cached_until_file_changes(self):
+        """Test an unchanged file is not read again, and an edited file is."""
+        import os
+        import time
+        from unittest.mock import patch
+        pom_file = self.temp_dir / 'pom.xml'
+        pom_file.write_text('<project/>', encoding='utf-8')
+        old = time.time() - 60
+        os.utime(pom_file, (old, old))
+
+        with patch('src.detector.open', create=True, side_effect=open) as mock_open:
+            self.assertFalse(self.detector._check_indicators(pom_file, Technology.JAVA_SPRINGBOOT))
+            self.assertFalse(self.detector._check_indicators(pom_file, Technology.JAVA_SPRINGBOOT))
+            self.assertEqual(mock_open.call_count, 1)
+
+            pom_file.write_text('<project>spring-boot</project>', encoding='utf-8')
+            os.utime(pom_file, (old + 30, old + 30))
+            self.assertTrue(self.detector._check_indicators(pom_file, Technology.JAVA_SPRINGBOOT))
+            self.assertEqual(mock_open.call_count, 2)
+
     def test_check_indicators_not_found(self):
         """Test checking indicators when not found."""
         pom_file = self.temp_dir / 'pom.xml'
         pom_file.write_text('<project></project>', encoding='utf-8')
 
-        result = self.detector._check_indicators(pom_file, ['spring-boot'])
+        result = self.detector._check_indicators(pom_file, Technology.JAVA_SPRINGBOOT)
         self.assertFalse(result)
 
     def test_check_indicators_file_not_exists(self):
         """Test checking indicators when file doesn't exist."""
         non_existent = self.temp_dir / 'non_existent.xml'
-        result = self.detector._check_indicators(non_existent, ['spring-boot'])
+        result = self.detector._check_indicators(non_existent, Technology.JAVA_SPRINGBOOT)
         self.assertFalse(result)
 
     def test_priority_java_over_others(self):
@@ -143,6 +237,30 @@ class TestTechnologyDetector(unittest.TestCase):
         result = self.detector.detect(self.temp_dir)
         self.assertEqual(result, Technology.JAVA_SPRINGBOOT)
 
+    def test_non_java_repository_skips_java_checks(self):
+        """Test Java build files are not inspected when none are present."""
+        from unittest.mock import patch
+        (self.temp_dir / 'requirements.txt').write_text('flask', encoding='utf-8')
+
+        with patch.object(self.detector, '_is_spring_boot_project') as mock_spring:
+            result = self.detector.detect(self.temp_dir)
+
+        self.assertEqual(result, Technology.PYTHON)
+        mock_spring.assert_not_called()
+
+    def test_spring_check_skips_wrapper_scripts(self):
+        """Test only build files are scanned for Spring indicators."""
+        from unittest.mock import patch
+        (self.temp_dir / 'gradlew').write_text('#!/bin/sh', encoding='utf-8')
+        (self.temp_dir / 'build.gradle').write_text("apply plugin: 'java'", encoding='utf-8')
+
+        with patch.object(self.detector, '_check_indicators', return_value=False) as mock_check:
+            result = self.detector.detect(self.temp_dir)
+
+        self.assertEqual(result, Technology.JAVA_SPRINGBOOT)
+        scanned = [c.args[0].name for c in mock_check.call_args_list]
+        self.assertEqual(scanned, ['build.gradle'])
+
     def test_priority_python_over_nodejs(self):
         """Test that Python has priority over Node.js when both exist."""
         # Create files for both Python and Node.js
@@ -154,14 +272,12 @@ class TestTechnologyDetector(unittest.TestCase):
 
     def test_get_root_files_with_exception(self):
         """Test getting root files when an exception occurs."""
-        from unittest.mock import MagicMock, patch
-
-        # Mock a path that throws an exception when iterdir() is called
-        mock_path = MagicMock()
-        mock_path.iterdir.side_effect = PermissionError("Access denied")
+        from unittest.mock import patch
 
-        files = self.detector._get_root_files(mock_path)
-        self.assertEqual(files, [])
+        # Mock a directory listing that throws an exception
+        with patch('src.detector.os.scandir', side_effect=PermissionError("Access denied")):
+            files = self.detector._get_root_files(self.temp_dir)
+        self.assertEqual(files, frozenset())
 
     def test_matches_technology_with_invalid_tech(self):
         """Test matching technology with invalid/unknown technology type."""
@@ -170,7 +286,7 @@ class TestTechnologyDetector(unittest.TestCase):
             pass
 
         fake_tech = FakeTechnology()
-        files = ['requirements.txt']
+        files = frozenset({'requirements.txt'})
 
         result = self.detector._matches_technology(self.temp_dir, files, fake_tech)
         self.assertFalse(result)
@@ -1,10 +1,11 @@
 """Tests for environment manager."""
+import os
 import unittest
 import tempfile
 import shutil
 import sys
 from pathlib import Path
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, MagicMock, call
 from src.env_manager import EnvironmentManager
 
 
@@ -38,6 +39,39 @@ class TestEnvironmentManager(unittest.TestCase):
         self.assertIn('API_KEY=test-key-123', content)
         self.assertIn('DEBUG=true', content)
 
+    def test_create_env_file_failed_write_keeps_existing(self):
+        """Test a failed write leaves the previous .env and no temp file."""
+        self.env_manager.create_env_file({'VAR1': 'value1'})
+
+        with patch('src.env_manager._write_all', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.env_manager.create_env_file({'VAR2': 'value2'})
+
+        self.assertEqual((self.temp_dir / '.env').read_text(), 'VAR1=value1\n')
+        self.assertEqual([p.name for p in self.temp_dir.iterdir()], ['.env'])
+
+    def test_create_env_file_many_variables(self):
+        """Test more variables than fit in one gathered write are all written."""
+        variables = {f'VAR_{i}': f'value{i}' for i in range(2000)}
+
+        self.env_manager.create_env_file(variables)
+
+        lines = (self.temp_dir / '.env').read_text().splitlines()
+        self.assertEqual(lines, [f'{k}={v}' for k, v in variables.items()])
+
+    def test_create_env_file_short_gathered_write(self):
+        """Test a partial gathered write is completed with plain writes."""
+        import os
+        if not hasattr(os, 'writev'):
+            self.skipTest("os.writev not available")
+
+        real_writev = os.writev
+        with patch('src.env_manager.os.writev',
+                   side_effect=lambda fd, chunks: real_writev(fd, chunks[:3])):
+            self.env_manager.create_env_file({'VAR1': 'value1', 'VAR2': 'value2'})
+
+        self.assertEqual((self.temp_dir / '.env').read_text(), 'VAR1=value1\nVAR2=value2\n')
+
     def test_append_to_env(self):
         """Test appending to .env file."""
         # Create initial file
@@ -97,71 +131,160 @@ class TestEnvironmentManager(unittest.TestCase):
     @patch('subprocess.run')
     def test_append_to_env_windows_success(self, mock_run):
         """Test appending environment variable on Windows with success."""
-        mock_run.return_value = Mock(returncode=0)
+        winreg, key = self._mock_winreg('')
 
-        self.env_manager.append_to_env('TEST_VAR', 'test_value')
+        with patch.dict('sys.modules', {'winreg': winreg}), \
+                patch.object(self.env_manager, '_broadcast_environment_change'):
+            self.env_manager.append_to_env('TEST_VAR', 'test_value')
 
-        # Verify setx was called
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
-        self.assertEqual(call_args[0], 'setx')
-        self.assertEqual(call_args[1], 'TEST_VAR')
-        self.assertEqual(call_args[2], 'test_value')
+        # Written to the registry directly, without spawning setx
+        winreg.SetValueEx.assert_called_once_with(key, 'TEST_VAR', 0, winreg.REG_SZ, 'test_value')
+        mock_run.assert_not_called()
 
     @patch('sys.platform', 'win32')
-    @patch('subprocess.run')
-    def test_append_to_env_windows_failure(self, mock_run):
+    def test_append_to_env_windows_failure(self):
         """Test appending environment variable on Windows with failure."""
-        import subprocess
-        mock_run.side_effect = subprocess.CalledProcessError(1, 'setx')
+        winreg, _ = self._mock_winreg('')
+        winreg.OpenKey.side_effect = PermissionError("Access denied")
 
         # Should not raise exception, just log warning
-        self.env_manager.append_to_env('TEST_VAR', 'test_value')
+        with patch.dict('sys.modules', {'winreg': winreg}):
+            self.env_manager.append_to_env('TEST_VAR', 'test_value')
 
         # Verify file was still created
         env_file = self.temp_dir / '.env'
         self.assertTrue(env_file.exists())
 
+    def _mock_winreg(self, current_path):
+        """Build a fake winreg module whose user Path is current_path."""
+        winreg = MagicMock()
+        winreg.QueryValueEx.return_value = (current_path, 2)
+        key = winreg.OpenKey.return_value.__enter__.return_value
+        return winreg, key
+
     @patch('sys.platform', 'win32')
     @patch('subprocess.run')
     def test_set_system_path_windows_success(self, mock_run):
         """Test setting system PATH on Windows with success."""
-        # Mock PowerShell responses
-        mock_run.side_effect = [
-            Mock(returncode=0, stdout='C:\\existing\\path', stderr=''),  # Get current PATH
-            Mock(returncode=0, stdout='', stderr=''),  # Set new PATH
-        ]
+        winreg, key = self._mock_winreg('C:\\existing\\path')
 
-        self.env_manager.set_system_path('C:\\new\\path')
+        with patch.dict('sys.modules', {'winreg': winreg}), \
+                patch.object(self.env_manager, '_broadcast_environment_change') as mock_broadcast:
+            self.env_manager.set_system_path('C:\\new\\path')
 
-        # Verify PowerShell was called twice
-        self.assertEqual(mock_run.call_count, 2)
+        winreg.SetValueEx.assert_called_once_with(
+            key, 'Path', 0, winreg.REG_EXPAND_SZ, 'C:\\new\\path;C:\\existing\\path'
+        )
+        mock_broadcast.assert_called_once()
+        # No PowerShell processes are spawned
+        mock_run.assert_not_called()
 
     @patch('sys.platform', 'win32')
-    @patch('subprocess.run')
-    def test_set_system_path_windows_already_exists(self, mock_run):
+    def test_set_system_path_windows_already_exists(self):
         """Test setting system PATH when path already exists."""
-        # Mock PowerShell response with path already in PATH
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout='C:\\existing\\path;C:\\new\\path',
-            stderr=''
-        )
+        winreg, _ = self._mock_winreg('C:\\existing\\path;C:\\new\\path')
 
-        self.env_manager.set_system_path('C:\\new\\path')
+        with patch.dict('sys.modules', {'winreg': winreg}), \
+                patch.object(self.env_manager, '_broadcast_environment_change') as mock_broadcast:
+            self.env_manager.set_system_path('C:\\new\\path')
 
-        # Verify only one call (to get PATH, not to set it)
-        self.assertEqual(mock_run.call_count, 1)
+        # PATH is read but not written
+        winreg.QueryValueEx.assert_called_once()
+        winreg.SetValueEx.assert_not_called()
+        mock_broadcast.assert_not_called()
+
+    def test_path_contains_matches_whole_entries(self):
+        """Test PATH membership compares entries, not substrings."""
+        path_value = os.pathsep.join(['/tools/jdk/bin2', '/usr/bin/'])
+
+        self.assertFalse(EnvironmentManager.path_contains(path_value, '/tools/jdk/bin'))
+        self.assertTrue(EnvironmentManager.path_contains(path_value, '/tools/jdk/bin2'))
+        self.assertTrue(EnvironmentManager.path_contains(path_value, '/usr/bin'))
+        self.assertTrue(EnvironmentManager.path_contains('C:\\Tools\\Bin;C:\\x', 'C:\\Tools\\Bin\\', ';'))
 
     @patch('sys.platform', 'win32')
-    @patch('subprocess.run')
-    def test_set_system_path_windows_failure(self, mock_run):
+    def test_set_system_path_windows_failure(self):
         """Test setting system PATH on Windows with failure."""
-        import subprocess
-        mock_run.side_effect = subprocess.CalledProcessError(1, 'powershell')
+        winreg, _ = self._mock_winreg('')
+        winreg.OpenKey.side_effect = PermissionError("Access denied")
 
         # Should not raise exception, just log warning
-        self.env_manager.set_system_path('C:\\new\\path')
+        with patch.dict('sys.modules', {'winreg': winreg}):
+            self.env_manager.set_system_path('C:\\new\\path')
+
+    @patch('sys.platform', 'win32')
+    def test_set_persistent_env_batch_windows(self):
+        """Test all variables are written with one registry open and one broadcast."""
+        winreg, key = self._mock_winreg('')
+
+        with patch.dict('sys.modules', {'winreg': winreg}), \
+                patch.object(self.env_manager, '_broadcast_environment_change') as mock_broadcast:
+            self.env_manager.set_persistent_env_batch({
+                'JAVA_HOME': 'C:\\tools\\java',
+                'MAVEN_OPTS': '%JAVA_OPTS% -Xmx1g',
+            })
+
+        winreg.OpenKey.assert_called_once()
+        self.assertEqual(winreg.SetValueEx.call_args_list, [
+            call(key, 'JAVA_HOME', 0, winreg.REG_SZ, 'C:\\tools\\java'),
+            call(key, 'MAVEN_OPTS', 0, winreg.REG_EXPAND_SZ, '%JAVA_OPTS% -Xmx1g'),
+        ])
+        mock_broadcast.assert_called_once()
+
+    @patch('sys.platform', 'win32')
+    def test_set_persistent_env_batch_with_path_entries(self):
+        """Test variables and PATH entries share one registry open and one broadcast."""
+        winreg, key = self._mock_winreg('C:\\tools\\git\\cmd')
+
+        with patch.dict('sys.modules', {'winreg': winreg}), \
+                patch.object(self.env_manager, '_broadcast_environment_change') as mock_broadcast:
+            self.env_manager.set_persistent_env_batch(
+                {'JAVA_HOME': 'C:\\tools\\java'},
+                ['C:\\tools\\java\\bin', 'C:\\tools\\git\\cmd']
+            )
+
+        winreg.OpenKey.assert_called_once()
+        self.assertEqual(winreg.SetValueEx.call_args_list, [
+            call(key, 'JAVA_HOME', 0, winreg.REG_SZ, 'C:\\tools\\java'),
+            call(key, 'Path', 0, winreg.REG_EXPAND_SZ, 'C:\\tools\\java\\bin;C:\\tools\\git\\cmd'),
+        ])
+        mock_broadcast.assert_called_once()
+
+    @patch('sys.platform', 'linux')
+    def test_persist_tool_environment_writes_env_file(self):
+        """Test a tool's variables are appended to .env and persisted together."""
+        with patch.object(self.env_manager, 'set_persistent_env_batch') as mock_batch:
+            self.env_manager.persist_tool_environment(
+                {'JAVA_HOME': '/tools/java', 'MAVEN_HOME': '/tools/maven'}, ['/tools/java/bin']
+            )
+
+        content = (self.temp_dir / '.env').read_text(encoding='utf-8')
+        self.assertEqual(content, 'JAVA_HOME=/tools/java\nMAVEN_HOME=/tools/maven\n')
+        mock_batch.assert_called_once_with(
+            {'JAVA_HOME': '/tools/java', 'MAVEN_HOME': '/tools/maven'}, ['/tools/java/bin']
+        )
+
+    @patch('sys.platform', 'linux')
+    def test_set_persistent_env_batch_non_windows(self):
+        """Test the batch is validated but not persisted outside Windows."""
+        from src.exceptions import InvalidEnvironmentVariableError
+        with patch.object(self.env_manager, '_broadcast_environment_change') as mock_broadcast:
+            self.env_manager.set_persistent_env_batch({'TEST_VAR': 'value'})
+            with self.assertRaises(InvalidEnvironmentVariableError):
+                self.env_manager.set_persistent_env_batch({'BAD-NAME': 'value'})
+        mock_broadcast.assert_not_called()
+
+    @patch('sys.platform', 'win32')
+    def test_set_system_path_windows_no_user_path(self):
+        """Test setting system PATH when the user has no Path value yet."""
+        winreg, key = self._mock_winreg('')
+        winreg.QueryValueEx.side_effect = FileNotFoundError()
+
+        with patch.dict('sys.modules', {'winreg': winreg}), \
+                patch.object(self.env_manager, '_broadcast_environment_change'):
+            self.env_manager.set_system_path('C:\\new\\path')
+
+        winreg.SetValueEx.assert_called_once_with(key, 'Path', 0, winreg.REG_EXPAND_SZ, 'C:\\new\\path')
 
     @patch('sys.platform', 'linux')
     def test_append_to_env_non_windows(self):
@@ -188,41 +311,20 @@ class TestEnvironmentManager(unittest.TestCase):
         os.environ['PATH'] = original_path
 
     @patch('sys.platform', 'win32')
-    @patch('subprocess.run')
-    def test_set_system_path_preserves_existing_paths(self, mock_run):
+    def test_set_system_path_preserves_existing_paths(self):
         """Test that set_system_path preserves all existing PATH entries."""
         # Simulate a user PATH with multiple existing entries
         existing_paths = 'C:\\Program Files\\Git\\cmd;C:\\Windows\\System32;C:\\Users\\test\\bin'
-
-        # Mock PowerShell responses
-        mock_run.side_effect = [
-            Mock(returncode=0, stdout=existing_paths, stderr=''),  # Get current PATH
-            Mock(returncode=0, stdout='', stderr=''),  # Set new PATH
-        ]
+        winreg, _ = self._mock_winreg(existing_paths)
 
         new_path = 'C:\\dev-start\\tools\\java\\bin'
-        self.env_manager.set_system_path(new_path)
-
-        # Verify PowerShell was called twice
-        self.assertEqual(mock_run.call_count, 2)
-
-        # Get the second call (SetEnvironmentVariable)
-        second_call = mock_run.call_args_list[1]
-        powershell_command = str(second_call[0][0])
-
-        # Extract the PATH value that was set
-        # The command should contain the new path followed by all existing paths
-        # Note: paths are escaped in the PowerShell command
-        self.assertIn('dev-start', powershell_command)
-        self.assertIn('java', powershell_command)
-        # Verify that all existing paths are preserved
-        self.assertIn('Program Files', powershell_command)
-        self.assertIn('Git', powershell_command)
-        self.assertIn('Windows', powershell_command)
-        self.assertIn('System32', powershell_command)
-        self.assertIn('Users', powershell_command)
-        self.assertIn('test', powershell_command)
+        with patch.dict('sys.modules', {'winreg': winreg}), \
+                patch.object(self.env_manager, '_broadcast_environment_change'):
+            self.env_manager.set_system_path(new_path)
 
+        # The new path is prepended and every existing entry is kept, in order
+        written_path = winreg.SetValueEx.call_args[0][4]
+        self.assertEqual(written_path, f"{new_path};{existing_paths}")
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for the Git check cache."""
+import json
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+from src.git_check_cache import GitCheckCache
+
+
+class TestGitCheckCache(unittest.TestCase):
+    """Test cases for GitCheckCache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_file = self.temp_dir / 'git-check.json'
+        self.cache = GitCheckCache(self.cache_file)
+
+        self.git_path = self.temp_dir / 'git'
+        self.git_path.write_text('', encoding='utf-8')
+        self.gitconfig = self.temp_dir / '.gitconfig'
+        self.gitconfig.write_text('[user]\n', encoding='utf-8')
+
+        self.which_patcher = patch('src.git_check_cache.shutil.which', return_value=str(self.git_path))
+        self.home_patcher = patch('src.git_check_cache.Path.home', return_value=self.temp_dir)
+        self.which_patcher.start()
+        self.home_patcher.start()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.home_patcher.stop()
+        self.which_patcher.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_missing_cache_is_invalid(self):
+        """Test a missing cache file is treated as a miss."""
+        self.assertFalse(self.cache.is_valid())
+
+    def test_save_then_valid(self):
+        """Test a saved check is reused while nothing changes."""
+        self.cache.save('2.43.0')
+
+        self.assertTrue(GitCheckCache(self.cache_file).is_valid())
+
+    def test_gitconfig_change_invalidates(self):
+        """Test editing ~/.gitconfig invalidates the cache."""
+        self.cache.save('2.43.0')
+        mtime = self.gitconfig.stat().st_mtime
+        os.utime(self.gitconfig, (mtime + 10, mtime + 10))
+
+        self.assertFalse(self.cache.is_valid())
+
+    def test_git_binary_change_invalidates(self):
+        """Test a different Git binary invalidates the cache."""
+        self.cache.save('2.43.0')
+
+        with patch('src.git_check_cache.shutil.which', return_value=str(self.gitconfig)):
+            self.assertFalse(self.cache.is_valid())
+
+    def test_expired_cache_is_invalid(self):
+        """Test entries older than the TTL are ignored."""
+        self.cache.save('2.43.0')
+        data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        data['checked_at'] -= 2 * 24 * 60 * 60
+        self.cache_file.write_text(json.dumps(data), encoding='utf-8')
+
+        self.assertFalse(self.cache.is_valid())
+
+    def test_git_not_on_path(self):
+        """Test nothing is cached when Git is not on PATH."""
+        with patch('src.git_check_cache.shutil.which', return_value=None):
+            self.cache.save('2.43.0')
+
+        self.assertFalse(self.cache_file.exists())
+
+    def test_corrupt_cache_is_invalid(self):
+        """Test an unreadable cache file is ignored."""
+        self.cache_file.write_text('{not json', encoding='utf-8')
+
+        self.assertFalse(self.cache.is_valid())
+
+
+if __name__ == '__main__':
+    unittest.main()
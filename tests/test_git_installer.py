@@ -88,7 +88,9 @@ class TestGitInstaller(unittest.TestCase):
     def test_configure_already_configured(self, mock_run):
         """Test configure when Git is already configured."""
         # Mock is_git_configured to return True
-        mock_run.return_value = Mock(returncode=0, stdout='John Doe')
+        mock_run.return_value = Mock(
+            returncode=0, stdout='user.name John Doe\nuser.email john@example.com\n'
+        )
 
         result = self.installer.configure('John Doe', 'john@example.com', True)
         self.assertTrue(result)
@@ -98,8 +100,7 @@ class TestGitInstaller(unittest.TestCase):
         """Test configure when Git is not configured."""
         # First two calls return empty (not configured), then successful
         mock_run.side_effect = [
-            Mock(returncode=1, stdout=''),  # user.name check
-            Mock(returncode=1, stdout=''),  # user.email check
+            Mock(returncode=1, stdout=''),  # user.name/user.email check
             Mock(returncode=0),  # set user.name
             Mock(returncode=0),  # set user.email
             Mock(returncode=0),  # set ssl verify
@@ -108,16 +109,15 @@ class TestGitInstaller(unittest.TestCase):
         result = self.installer.configure('John Doe', 'john@example.com', True)
         self.assertTrue(result)
 
-        # Verify config commands were called
-        self.assertEqual(mock_run.call_count, 5)
+        # Verify one check and three config commands were called
+        self.assertEqual(mock_run.call_count, 4)
 
     @patch('subprocess.run')
     def test_configure_without_ssl_verify(self, mock_run):
         """Test configure with SSL verification disabled."""
         # First two calls return empty (not configured), then successful
         mock_run.side_effect = [
-            Mock(returncode=1, stdout=''),  # user.name check
-            Mock(returncode=1, stdout=''),  # user.email check
+            Mock(returncode=1, stdout=''),  # user.name/user.email check
             Mock(returncode=0),  # set user.name
             Mock(returncode=0),  # set user.email
             Mock(returncode=0),  # set ssl verify to false
@@ -135,8 +135,7 @@ class TestGitInstaller(unittest.TestCase):
         """Test configure when credentials are missing."""
         # Mock that Git is not configured
         mock_run.side_effect = [
-            Mock(returncode=1, stdout=''),  # user.name check fails
-            Mock(returncode=1, stdout=''),  # user.email check fails
+            Mock(returncode=1, stdout=''),  # user.name/user.email check fails
         ]
 
         result = self.installer.configure(None, None, True)
@@ -144,8 +143,7 @@ class TestGitInstaller(unittest.TestCase):
 
         # Reset mock for next test
         mock_run.side_effect = [
-            Mock(returncode=1, stdout=''),  # user.name check fails
-            Mock(returncode=1, stdout=''),  # user.email check fails
+            Mock(returncode=1, stdout=''),  # user.name/user.email check fails
         ]
 
         result = self.installer.configure('John Doe', None, True)
@@ -153,8 +151,7 @@ class TestGitInstaller(unittest.TestCase):
 
         # Reset mock for next test
         mock_run.side_effect = [
-            Mock(returncode=1, stdout=''),  # user.name check fails
-            Mock(returncode=1, stdout=''),  # user.email check fails
+            Mock(returncode=1, stdout=''),  # user.name/user.email check fails
         ]
 
         result = self.installer.configure(None, 'john@example.com', True)
@@ -163,18 +160,19 @@ class TestGitInstaller(unittest.TestCase):
     @patch('subprocess.run')
     def test_is_git_configured_true(self, mock_run):
         """Test checking if Git is configured (true case)."""
-        mock_run.return_value = Mock(returncode=0, stdout='John Doe')
+        mock_run.return_value = Mock(
+            returncode=0, stdout='user.name John Doe\nuser.email john@example.com\n'
+        )
 
         result = self.installer._is_git_configured()
         self.assertTrue(result)
+        mock_run.assert_called_once()
 
     @patch('subprocess.run')
     def test_is_git_configured_false(self, mock_run):
         """Test checking if Git is not configured."""
-        mock_run.side_effect = [
-            Mock(returncode=1, stdout=''),  # user.name check fails
-            Mock(returncode=0, stdout='john@example.com'),  # user.email check succeeds
-        ]
+        # Only user.email is set
+        mock_run.return_value = Mock(returncode=0, stdout='user.email john@example.com\n')
 
         result = self.installer._is_git_configured()
         self.assertFalse(result)
@@ -250,8 +248,7 @@ class TestGitInstaller(unittest.TestCase):
     def test_configure_git_with_ssl_disabled(self, mock_run):
         """Test configuring Git with SSL verification disabled."""
         mock_run.side_effect = [
-            Mock(returncode=1),  # name not configured
-            Mock(returncode=1),  # email not configured
+            Mock(returncode=1, stdout=''),  # name/email not configured
             Mock(returncode=0),  # set name
             Mock(returncode=0),  # set email
             Mock(returncode=0),  # set ssl
@@ -264,8 +261,7 @@ class TestGitInstaller(unittest.TestCase):
     def test_configure_git_command_fails(self, mock_run):
         """Test Git configuration when git command fails."""
         mock_run.side_effect = [
-            Mock(returncode=1),  # name not configured
-            Mock(returncode=1),  # email not configured
+            Mock(returncode=1, stdout=''),  # name/email not configured
             subprocess.CalledProcessError(1, 'git'),  # command fails
         ]
 
@@ -291,21 +287,37 @@ class TestGitInstaller(unittest.TestCase):
     @patch('subprocess.run')
     def test_detect_version_generic_exception(self, mock_run):
         """Test detecting version with SubprocessError exception."""
-        # First call for is_installed returns success, second call raises exception
-        mock_run.side_effect = [
-            Mock(returncode=0),  # is_installed check
-            subprocess.SubprocessError("Unknown error")  # get version fails
-        ]
+        mock_run.side_effect = subprocess.SubprocessError("Unknown error")
 
         version = self.installer.detect_version()
         self.assertIsNone(version)
 
+    @patch('subprocess.run')
+    def test_version_check_runs_git_once(self, mock_run):
+        """Test is_installed and detect_version share one `git --version` call."""
+        mock_run.return_value = Mock(returncode=0, stdout='git version 2.43.0.windows.1')
+
+        self.assertTrue(self.installer.is_installed())
+        self.assertEqual(self.installer.detect_version(), '2.43.0.windows.1')
+        self.assertTrue(self.installer.is_installed())
+
+        mock_run.assert_called_once()
+
+    @patch('subprocess.run')
+    def test_invalidate_rechecks_git(self, mock_run):
+        """Test invalidate() makes the next check run git again."""
+        mock_run.side_effect = [FileNotFoundError(), Mock(returncode=0, stdout='git version 2.43.0')]
+
+        self.assertFalse(self.installer.is_installed())
+        self.installer.invalidate()
+        self.assertTrue(self.installer.is_installed())
+        self.assertEqual(mock_run.call_count, 2)
+
     @patch('subprocess.run')
     def test_configure_user_email_fails(self, mock_run):
         """Test Git configuration when setting user email fails."""
         mock_run.side_effect = [
-            Mock(returncode=1),  # name not configured
-            Mock(returncode=1),  # email not configured
+            Mock(returncode=1, stdout=''),  # name/email not configured
             Mock(returncode=0),  # set name succeeds
             subprocess.CalledProcessError(1, 'git'),  # set email fails
         ]
@@ -317,8 +329,7 @@ class TestGitInstaller(unittest.TestCase):
     def test_configure_ssl_fails(self, mock_run):
         """Test Git configuration when setting SSL fails."""
         mock_run.side_effect = [
-            Mock(returncode=1),  # name not configured
-            Mock(returncode=1),  # email not configured
+            Mock(returncode=1, stdout=''),  # name/email not configured
             Mock(returncode=0),  # set name succeeds
             Mock(returncode=0),  # set email succeeds
             subprocess.CalledProcessError(1, 'git'),  # set SSL fails
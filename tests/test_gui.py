@@ -1,9 +1,14 @@
 """GUI tests for dev-start tkinter interface."""
+import errno
+import os
+import shutil
+import stat
+import tempfile
 import pytest
 import unittest
 import tkinter as tk
 from unittest.mock import Mock, patch, MagicMock
-from src.gui import DevStartGUI, InstallationReport, LogRedirector
+from src.gui import DevStartGUI, InstallationReport, LogRedirector, _GitConfigDialog, _fast_rmtree, _is_junction
 from src.detector import Technology
 
 
@@ -42,6 +47,7 @@ class TestInstallationReport(unittest.TestCase):
         self.assertEqual(len(self.report.successful), 1)
         self.assertEqual(len(self.report.failed), 0)
         self.assertIn(url, self.report.successful)
+        self.assertEqual(self.report.technologies_detected[url], Technology.PYTHON.value)
 
     def test_add_failed_repository(self):
         """Test adding failed repository."""
@@ -102,6 +108,16 @@ class TestInstallationReport(unittest.TestCase):
         self.assertIn('SUCCESSFUL INSTALLATIONS:', report_text)
         self.assertIn('FAILED INSTALLATIONS:', report_text)
 
+    def test_generate_report_reuses_times_formatted_at_end(self):
+        """Test times are formatted once when the run ends."""
+        self.report.start()
+        self.report.end()
+        first = self.report.generate_report()
+
+        with patch.object(self.report, 'get_duration') as mock_duration:
+            self.assertEqual(self.report.generate_report(), first)
+        mock_duration.assert_not_called()
+
 
 @pytest.mark.gui
 class TestLogRedirector(unittest.TestCase):
@@ -121,15 +137,81 @@ class TestLogRedirector(unittest.TestCase):
         """Test writing to text widget."""
         message = "Test message\n"
         self.redirector.write(message)
+        self.redirector.flush()
 
         content = self.text_widget.get(1.0, tk.END)
         self.assertIn("Test message", content)
 
+    def test_writes_are_batched(self):
+        """Test several writes reach the widget in one insert on flush."""
+        with patch.object(self.text_widget, 'insert') as mock_insert:
+            self.redirector.write("first\n")
+            self.redirector.write("second\n")
+
+            mock_insert.assert_not_called()
+
+            self.redirector.flush()
+
+        mock_insert.assert_called_once_with(tk.END, "first\nsecond\n", "test")
+
+    def test_worker_thread_writes_do_not_touch_widget(self):
+        """Test writes and flushes from a worker thread make no Tk calls."""
+        import threading
+        widget = MagicMock()
+        redirector = LogRedirector(widget, "test")
+        widget.reset_mock()
+
+        def worker():
+            redirector.write("from worker\n")
+            redirector.flush()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(widget.method_calls, [])
+
+        redirector.flush()
+        widget.insert.assert_called_once_with(tk.END, "from worker\n", "test")
+
+    def test_print_keeps_line_breaks(self):
+        """Test print's separate newline write reaches the widget."""
+        with patch.object(self.text_widget, 'insert') as mock_insert:
+            print("first", file=self.redirector)
+            print("second", file=self.redirector)
+            self.redirector.flush()
+
+        mock_insert.assert_called_once_with(tk.END, "first\nsecond\n", "test")
+
+    def test_lines_from_threads_do_not_splice(self):
+        """Test a partial line is held until the same thread ends it."""
+        import threading
+        with patch.object(self.text_widget, 'insert') as mock_insert:
+            self.redirector.write("main ")
+            worker = threading.Thread(target=self.redirector.write, args=("worker line\n",))
+            worker.start()
+            worker.join()
+            self.redirector.write("line\n")
+            self.redirector.flush()
+
+        mock_insert.assert_called_once_with(tk.END, "worker line\nmain line\n", "test")
+
+    def test_drain_trims_oldest_lines(self):
+        """Test the widget keeps at most MAX_LINES lines."""
+        widget = MagicMock()
+        widget.index.return_value = f"{LogRedirector.MAX_LINES + 3}.0"
+        redirector = LogRedirector(widget, "test")
+
+        redirector.write("line\n")
+        redirector.flush()
+
+        widget.delete.assert_called_once_with('1.0', '4.0')
+
     def test_write_empty_message(self):
         """Test writing empty message doesn't add content."""
         try:
             self.redirector.write("")
             self.redirector.write("   ")
+            self.redirector.flush()
 
             content = self.text_widget.get(1.0, tk.END).strip()
             self.assertEqual(content, "")
@@ -143,6 +225,89 @@ class TestLogRedirector(unittest.TestCase):
         self.redirector.flush()
 
 
+class TestFastRmtree(unittest.TestCase):
+    """Test cases for _fast_rmtree."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tree = os.path.join(self.temp_dir, 'repo')
+        os.makedirs(os.path.join(self.tree, 'node_modules', 'pkg', 'lib'))
+        os.makedirs(os.path.join(self.tree, '.git', 'objects'))
+        for rel in ('README.md', 'node_modules/pkg/index.js', 'node_modules/pkg/lib/a.js', '.git/HEAD'):
+            with open(os.path.join(self.tree, rel), 'w') as f:
+                f.write('x')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_removes_nested_tree(self):
+        """Test the whole tree is removed."""
+        _fast_rmtree(self.tree)
+        self.assertFalse(os.path.exists(self.tree))
+
+    def test_removes_read_only_files(self):
+        """Test read-only files are removed."""
+        read_only = os.path.join(self.tree, '.git', 'objects', 'pack')
+        with open(read_only, 'w') as f:
+            f.write('x')
+        os.chmod(read_only, stat.S_IREAD)
+
+        _fast_rmtree(self.tree)
+        self.assertFalse(os.path.exists(self.tree))
+
+    @unittest.skipIf(os.name == 'nt', "Creating symlinks may require privileges on Windows")
+    def test_does_not_follow_symlinks(self):
+        """Test a symlinked directory is unlinked, not emptied."""
+        outside = os.path.join(self.temp_dir, 'outside')
+        os.makedirs(outside)
+        keep = os.path.join(outside, 'keep.txt')
+        with open(keep, 'w') as f:
+            f.write('x')
+        os.symlink(outside, os.path.join(self.tree, 'link'))
+
+        _fast_rmtree(self.tree)
+        self.assertFalse(os.path.exists(self.tree))
+        self.assertTrue(os.path.exists(keep))
+
+    @unittest.skipIf(os.name == 'nt', "Creating symlinks may require privileges on Windows")
+    def test_refuses_symlink_root(self):
+        """Test a symlink passed as the root is rejected."""
+        link = os.path.join(self.temp_dir, 'link')
+        os.symlink(self.tree, link)
+
+        with self.assertRaises(OSError):
+            _fast_rmtree(link)
+        self.assertTrue(os.path.exists(os.path.join(self.tree, 'README.md')))
+
+    def test_is_junction_without_dir_entry_support(self):
+        """Test junctions are found from the reparse-point attribute before Python 3.12."""
+        junction = Mock(spec=['stat'])
+        junction.stat.return_value = Mock(st_file_attributes=stat.FILE_ATTRIBUTE_REPARSE_POINT)
+        directory = Mock(spec=['stat'])
+        directory.stat.return_value = Mock(st_file_attributes=stat.FILE_ATTRIBUTE_DIRECTORY)
+        posix = Mock(spec=['stat'])
+        posix.stat.return_value = Mock(spec=[])
+
+        self.assertTrue(_is_junction(junction))
+        self.assertFalse(_is_junction(directory))
+        self.assertFalse(_is_junction(posix))
+        junction.stat.assert_called_once_with(follow_symlinks=False)
+
+    def test_does_not_descend_into_junctions(self):
+        """Test a junction is removed itself, never scanned."""
+        junction = os.path.join(self.tree, 'junction')
+        os.makedirs(junction)
+
+        with patch('src.gui._is_junction', side_effect=lambda entry: entry.name == 'junction'), \
+                patch('src.gui.os.scandir', wraps=os.scandir) as mock_scandir:
+            _fast_rmtree(self.tree)
+
+        self.assertFalse(os.path.exists(self.tree))
+        self.assertNotIn(junction, [call.args[0] for call in mock_scandir.call_args_list])
+
+
 @pytest.mark.gui
 class TestDevStartGUI(unittest.TestCase):
     """Test cases for DevStartGUI."""
@@ -331,30 +496,34 @@ class TestDevStartGUI(unittest.TestCase):
                 os.chmod(test_path, 0o666)
                 os.unlink(test_path)
 
-    @patch('os.path.exists')
-    def test_safe_rmtree_nonexistent(self, mock_exists):
-        """Test safe_rmtree when directory doesn't exist."""
-        mock_exists.return_value = False
+    def test_safe_rmtree_nonexistent(self):
+        """Test safe_rmtree treats a missing directory as removed."""
+        result = self.gui.safe_rmtree(os.path.join(tempfile.gettempdir(), 'dev-start-missing-dir'))
+        self.assertTrue(result)
 
-        result = self.gui.safe_rmtree('/fake/path')
-        self.assertFalse(result)
+    @patch('src.gui._fast_rmtree')
+    def test_safe_rmtree_empty_directory(self, mock_rmtree):
+        """Test an empty directory is removed without walking it."""
+        path = tempfile.mkdtemp()
 
-    @patch('shutil.rmtree')
-    @patch('os.path.exists')
-    def test_safe_rmtree_success(self, mock_exists, mock_rmtree):
-        """Test safe_rmtree successful removal."""
-        mock_exists.return_value = True
+        result = self.gui.safe_rmtree(path)
+        self.assertTrue(result)
+        self.assertFalse(os.path.exists(path))
+        mock_rmtree.assert_not_called()
 
+    @patch('src.gui._fast_rmtree')
+    @patch('os.rmdir', side_effect=OSError(errno.ENOTEMPTY, "Directory not empty"))
+    def test_safe_rmtree_success(self, mock_rmdir, mock_rmtree):
+        """Test safe_rmtree successful removal."""
         result = self.gui.safe_rmtree('/fake/path')
         self.assertTrue(result)
         mock_rmtree.assert_called_once()
 
-    @patch('shutil.rmtree')
-    @patch('os.path.exists')
+    @patch('src.gui._fast_rmtree')
+    @patch('os.rmdir', side_effect=OSError(errno.ENOTEMPTY, "Directory not empty"))
     @patch('time.sleep')
-    def test_safe_rmtree_permission_error_retry(self, mock_sleep, mock_exists, mock_rmtree):
+    def test_safe_rmtree_permission_error_retry(self, mock_sleep, mock_rmdir, mock_rmtree):
         """Test safe_rmtree with permission error and retry."""
-        mock_exists.return_value = True
         mock_rmtree.side_effect = [
             PermissionError("Access denied"),
             PermissionError("Access denied"),
@@ -365,16 +534,32 @@ class TestDevStartGUI(unittest.TestCase):
         self.assertFalse(result)
         self.assertEqual(mock_rmtree.call_count, 3)
 
-    @patch('shutil.rmtree')
-    @patch('os.path.exists')
-    def test_safe_rmtree_generic_exception(self, mock_exists, mock_rmtree):
+    @patch('src.gui._fast_rmtree')
+    @patch('os.rmdir', side_effect=OSError(errno.ENOTEMPTY, "Directory not empty"))
+    def test_safe_rmtree_generic_exception(self, mock_rmdir, mock_rmtree):
         """Test safe_rmtree with generic exception."""
-        mock_exists.return_value = True
         mock_rmtree.side_effect = Exception("Unknown error")
 
         result = self.gui.safe_rmtree('/fake/path')
         self.assertFalse(result)
 
+    def test_remove_async_runs_on_io_pool(self):
+        """Test remove_async runs safe_rmtree off the calling thread."""
+        import threading
+        calling_thread = threading.current_thread()
+        seen = []
+
+        def fake_rmtree(path):
+            seen.append((path, threading.current_thread()))
+            return True
+
+        with patch.object(self.gui, 'safe_rmtree', side_effect=fake_rmtree):
+            future = self.gui.remove_async('/fake/path')
+            self.assertTrue(future.result(timeout=5))
+
+        self.assertEqual(seen[0][0], '/fake/path')
+        self.assertIsNot(seen[0][1], calling_thread)
+
     @patch('tkinter.messagebox.showinfo')
     def test_installation_complete_shows_dialog(self, mock_showinfo):
         """Test installation_complete shows completion dialog."""
@@ -418,11 +603,17 @@ class TestDevStartGUI(unittest.TestCase):
             mock_asksaveasfilename.return_value = temp_path
 
             content = "Test report content"
-            self.gui.save_report(content)
+            with patch.object(self.gui.root, 'after') as mock_after:
+                self.gui.save_report(content)
 
             # Should have called save dialog
             mock_asksaveasfilename.assert_called_once()
 
+            # The write runs on the IO pool; the Tk thread checks on it
+            _, check, future, filename = mock_after.call_args[0]
+            future.result(timeout=5)
+            check(future, filename)
+
             # Should have shown confirmation
             mock_showinfo.assert_called_once()
 
@@ -435,6 +626,22 @@ class TestDevStartGUI(unittest.TestCase):
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
 
+    @patch('tkinter.messagebox.showerror')
+    @patch('tkinter.filedialog.asksaveasfilename')
+    def test_save_report_write_error(self, mock_asksaveasfilename, mock_showerror):
+        """Test a failed save is reported instead of raising."""
+        mock_asksaveasfilename.return_value = os.path.join(tempfile.gettempdir(), 'missing-dir', 'report.txt')
+
+        with patch.object(self.gui.root, 'after') as mock_after:
+            self.gui.save_report("Test report content")
+
+        _, check, future, filename = mock_after.call_args[0]
+        with self.assertRaises(OSError):
+            future.result(timeout=5)
+        check(future, filename)
+
+        mock_showerror.assert_called_once()
+
     @patch('tkinter.filedialog.asksaveasfilename')
     def test_save_report_cancelled(self, mock_asksaveasfilename):
         """Test saving report when user cancels."""
@@ -446,63 +653,61 @@ class TestDevStartGUI(unittest.TestCase):
         # Should have called save dialog
         mock_asksaveasfilename.assert_called_once()
 
-    @patch('tkinter.messagebox.askyesno')
-    def test_prompt_git_config_declined(self, mock_askyesno):
-        """Test prompting for git config when user declines."""
-        mock_askyesno.return_value = False
+    @patch('src.gui._GitConfigDialog')
+    def test_prompt_git_config_cancelled(self, mock_dialog_class):
+        """Test prompting for git config when the form is cancelled."""
+        mock_dialog_class.return_value.show.return_value = None
 
         result = self.gui._prompt_git_config()
 
         self.assertIsNone(result)
-        mock_askyesno.assert_called_once()
+        mock_dialog_class.assert_called_once_with(self.root)
 
-    @patch('tkinter.simpledialog.askstring')
-    @patch('tkinter.messagebox.askyesno')
-    def test_prompt_git_config_name_cancelled(self, mock_askyesno, mock_askstring):
-        """Test prompting for git config when name is cancelled."""
-        mock_askyesno.return_value = True
-        mock_askstring.return_value = None
+    @patch('src.gui._GitConfigDialog')
+    def test_prompt_git_config_complete(self, mock_dialog_class):
+        """Test prompting for git config returns the form's values."""
+        config = {'name': 'John Doe', 'email': 'john@example.com', 'ssl_verify': True}
+        mock_dialog_class.return_value.show.return_value = config
 
         result = self.gui._prompt_git_config()
 
-        self.assertIsNone(result)
+        self.assertEqual(result, config)
 
-    @patch('tkinter.simpledialog.askstring')
-    @patch('tkinter.messagebox.askyesno')
-    def test_prompt_git_config_email_cancelled(self, mock_askyesno, mock_askstring):
-        """Test prompting for git config when email is cancelled."""
-        mock_askyesno.return_value = True
-        mock_askstring.side_effect = ['John Doe', None]
+    def test_git_config_dialog_ok(self):
+        """Test the form returns name, email and SSL choice on OK."""
+        dialog = _GitConfigDialog(self.root)
+        dialog.name_var.set('  John Doe ')
+        dialog.email_var.set('john@example.com')
+        dialog.ssl_verify_var.set(False)
 
-        result = self.gui._prompt_git_config()
+        dialog._on_ok()
 
-        self.assertIsNone(result)
+        self.assertEqual(dialog.result, {
+            'name': 'John Doe',
+            'email': 'john@example.com',
+            'ssl_verify': False
+        })
 
-    @patch('tkinter.simpledialog.askstring')
-    @patch('tkinter.messagebox.askyesno')
-    def test_prompt_git_config_complete(self, mock_askyesno, mock_askstring):
-        """Test prompting for git config with all inputs."""
-        mock_askyesno.side_effect = [True, True]  # Confirm config, SSL yes
-        mock_askstring.side_effect = ['John Doe', 'john@example.com']
+    def test_git_config_dialog_requires_email(self):
+        """Test OK keeps the form open until the email is filled in."""
+        dialog = _GitConfigDialog(self.root)
+        dialog.name_var.set('John Doe')
 
-        result = self.gui._prompt_git_config()
+        dialog._on_ok()
 
-        self.assertIsNotNone(result)
-        self.assertEqual(result['name'], 'John Doe')
-        self.assertEqual(result['email'], 'john@example.com')
-        self.assertTrue(result['ssl_verify'])
+        self.assertIsNone(dialog.result)
+        self.assertTrue(dialog.winfo_exists())
+        dialog._on_cancel()
 
-    @patch('tkinter.simpledialog.askstring')
-    @patch('tkinter.messagebox.askyesno')
-    def test_prompt_git_config_ssl_disabled(self, mock_askyesno, mock_askstring):
-        """Test prompting for git config with SSL disabled."""
-        mock_askyesno.side_effect = [True, False]  # Confirm config, SSL no
-        mock_askstring.side_effect = ['John Doe', 'john@example.com']
+    def test_git_config_dialog_cancel(self):
+        """Test cancelling the form gives no result."""
+        dialog = _GitConfigDialog(self.root)
+        dialog.name_var.set('John Doe')
+        dialog.email_var.set('john@example.com')
 
-        result = self.gui._prompt_git_config()
+        dialog._on_cancel()
 
-        self.assertIsNotNone(result)
-        self.assertFalse(result['ssl_verify'])
+        self.assertIsNone(dialog.result)
 
 
 @pytest.mark.gui
@@ -541,7 +746,7 @@ class TestRunInstallation(unittest.TestCase):
         # Git install should have been attempted
         mock_installer.install.assert_called_once()
 
-    @patch('src.gui.PythonInstaller')
+    @patch('src.installers.python_installer.PythonInstaller')
     @patch('src.gui.GitInstaller')
     def test_run_installation_successful_python_project(self, mock_git_class, mock_python_class):
         """Test run_installation with successful Python project."""
@@ -629,7 +834,7 @@ class TestRunInstallation(unittest.TestCase):
         # Check report shows failure
         self.assertEqual(len(self.gui.report.failed), 1)
 
-    @patch('src.gui.PythonInstaller')
+    @patch('src.installers.python_installer.PythonInstaller')
     @patch('src.gui.GitInstaller')
     def test_run_installation_installer_not_installed_and_install_fails(self, mock_git_class, mock_python_class):
         """Test run_installation when technology installer not installed and install fails."""
@@ -661,7 +866,7 @@ class TestRunInstallation(unittest.TestCase):
         # Check report shows failure
         self.assertEqual(len(self.gui.report.failed), 1)
 
-    @patch('src.gui.PythonInstaller')
+    @patch('src.installers.python_installer.PythonInstaller')
     @patch('src.gui.GitInstaller')
     def test_run_installation_configure_fails(self, mock_git_class, mock_python_class):
         """Test run_installation when configuration fails."""
@@ -718,6 +923,58 @@ class TestRunInstallation(unittest.TestCase):
         # Check proxy was set
         self.assertEqual(self.gui.proxy_manager.http_proxy, "http://myproxy.com:8080")
 
+    @patch('src.installers.python_installer.PythonInstaller')
+    @patch('src.gui.GitInstaller')
+    def test_run_installation_processes_repositories_in_parallel(self, mock_git_class, mock_python_class):
+        """Test every repository is processed and reported when run concurrently."""
+        mock_git = Mock()
+        mock_git.is_installed.return_value = True
+        mock_git.detect_version.return_value = '2.40.0'
+        mock_git._is_git_configured.return_value = True
+        mock_git_class.return_value = mock_git
+
+        mock_python = Mock()
+        mock_python.is_installed.return_value = True
+        mock_python.configure.return_value = True
+        mock_python_class.return_value = mock_python
+
+        repos = [f'https://github.com/user/repo{i}' for i in range(5)]
+        with patch.object(self.gui.repo_manager, 'clone_repository', return_value=True) as mock_clone:
+            with patch.object(self.gui.detector, 'detect', return_value=Technology.PYTHON):
+                with patch('pathlib.Path.exists', return_value=False):
+                    self.gui.http_proxy_entry.delete(0, tk.END)
+                    with patch.object(self.gui.root, 'after'):
+                        self.gui.run_installation(repos)
+
+        self.assertEqual(sorted(self.gui.report.successful), sorted(repos))
+        self.assertEqual(mock_clone.call_count, 5)
+
+    @patch('src.installers.python_installer.PythonInstaller')
+    @patch('src.gui.GitInstaller')
+    def test_run_installation_checks_technology_once(self, mock_git_class, mock_python_class):
+        """Test a technology's installation is checked once per run."""
+        mock_git = Mock()
+        mock_git.is_installed.return_value = True
+        mock_git.detect_version.return_value = '2.40.0'
+        mock_git._is_git_configured.return_value = True
+        mock_git_class.return_value = mock_git
+
+        mock_python = Mock()
+        mock_python.is_installed.return_value = True
+        mock_python.configure.return_value = True
+        mock_python_class.return_value = mock_python
+
+        repos = [f'https://github.com/user/repo{i}' for i in range(3)]
+        with patch.object(self.gui.repo_manager, 'clone_repository', return_value=True):
+            with patch.object(self.gui.detector, 'detect', return_value=Technology.PYTHON):
+                with patch('pathlib.Path.exists', return_value=False):
+                    self.gui.http_proxy_entry.delete(0, tk.END)
+                    with patch.object(self.gui.root, 'after'):
+                        self.gui.run_installation(repos)
+
+        self.assertEqual(len(self.gui.report.successful), 3)
+        mock_python.is_installed.assert_called_once()
+
     @patch('src.gui.GitInstaller')
     def test_run_installation_existing_repo_remove_fails(self, mock_git_class):
         """Test run_installation when existing repository cannot be removed."""
@@ -843,7 +1100,7 @@ class TestRunInstallation(unittest.TestCase):
         # Git configure should NOT have been called
         mock_git.configure.assert_not_called()
 
-    @patch('src.gui.PythonInstaller')
+    @patch('src.installers.python_installer.PythonInstaller')
     @patch('src.gui.GitInstaller')
     def test_run_installation_successful_install_from_scratch(self, mock_git_class, mock_python_class):
         """Test run_installation with successful install from scratch (covers line 594)."""
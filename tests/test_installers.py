@@ -1,4 +1,6 @@
 """Tests for installers."""
+import io
+import os
 import unittest
 import tempfile
 import shutil
@@ -192,12 +194,12 @@ class TestBaseInstaller(unittest.TestCase):
         self.test_installer.install()
         self.test_installer.configure()
 
-    @patch('src.installers.base.requests.get')
+    @patch('src.installers.base.requests.Session.get')
     def test_download_file_success(self, mock_get):
         """Test successful file download."""
         mock_response = Mock()
         mock_response.headers = {'content-length': '100'}
-        mock_response.iter_content.return_value = [b'test data']
+        mock_response.raw = io.BytesIO(b'test data')
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -207,14 +209,14 @@ class TestBaseInstaller(unittest.TestCase):
         self.assertTrue(result)
         self.assertTrue(destination.exists())
 
-    @patch('src.installers.base.requests.get')
+    @patch('src.installers.base.requests.Session.get')
     def test_download_file_with_proxy(self, mock_get):
         """Test file download with proxy."""
         self.proxy_manager.set_proxy(http_proxy='http://proxy:8080')
 
         mock_response = Mock()
         mock_response.headers = {'content-length': '100'}
-        mock_response.iter_content.return_value = [b'data']
+        mock_response.raw = io.BytesIO(b'data')
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -226,7 +228,7 @@ class TestBaseInstaller(unittest.TestCase):
         call_kwargs = mock_get.call_args[1]
         self.assertIn('proxies', call_kwargs)
 
-    @patch('src.installers.base.requests.get')
+    @patch('src.installers.base.requests.Session.get')
     def test_download_file_failure(self, mock_get):
         """Test handling of download failure."""
         import requests.exceptions
@@ -266,10 +268,11 @@ class TestBaseInstaller(unittest.TestCase):
         success, output = self.installer.run_command(['test'])
 
         self.assertTrue(success)
-        # Verify HTTP_PROXY was set in environment
+        # Verify the child sees HTTP_PROXY (env=None inherits os.environ)
         call_kwargs = mock_run.call_args[1]
         self.assertIn('env', call_kwargs)
-        self.assertEqual(call_kwargs['env']['HTTP_PROXY'], 'http://proxy:8080')
+        env = call_kwargs['env'] or os.environ
+        self.assertEqual(env['HTTP_PROXY'], 'http://proxy:8080')
 
     @patch('subprocess.run')
     def test_run_command_with_https_proxy(self, mock_run):
@@ -280,10 +283,11 @@ class TestBaseInstaller(unittest.TestCase):
         success, output = self.installer.run_command(['test'])
 
         self.assertTrue(success)
-        # Verify HTTPS_PROXY was set in environment
+        # Verify the child sees HTTPS_PROXY (env=None inherits os.environ)
         call_kwargs = mock_run.call_args[1]
         self.assertIn('env', call_kwargs)
-        self.assertEqual(call_kwargs['env']['HTTPS_PROXY'], 'https://proxy:8080')
+        env = call_kwargs['env'] or os.environ
+        self.assertEqual(env['HTTPS_PROXY'], 'https://proxy:8080')
 
     @patch('subprocess.run')
     def test_run_command_with_both_proxies(self, mock_run):
@@ -297,10 +301,10 @@ class TestBaseInstaller(unittest.TestCase):
         success, output = self.installer.run_command(['test'])
 
         self.assertTrue(success)
-        # Verify both proxies were set
-        call_kwargs = mock_run.call_args[1]
-        self.assertEqual(call_kwargs['env']['HTTP_PROXY'], 'http://proxy:8080')
-        self.assertEqual(call_kwargs['env']['HTTPS_PROXY'], 'https://proxy:8080')
+        # Verify the child sees both proxies
+        env = mock_run.call_args[1]['env'] or os.environ
+        self.assertEqual(env['HTTP_PROXY'], 'http://proxy:8080')
+        self.assertEqual(env['HTTPS_PROXY'], 'https://proxy:8080')
 
     @patch('subprocess.run')
     def test_run_command_with_custom_cwd(self, mock_run):
@@ -81,6 +81,13 @@ class TestProxyManager(unittest.TestCase):
         self.assertIsNone(os.environ.get('HTTP_PROXY'))
         self.assertIsNone(os.environ.get('http_proxy'))
 
+    def test_session_retries_gateway_errors(self):
+        """Test the shared session retries transient gateway errors."""
+        adapter = self.proxy_manager.session.get_adapter('https://example.com/file.zip')
+
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertEqual(set(adapter.max_retries.status_forcelist), {502, 503, 504})
+
 
 if __name__ == '__main__':
     unittest.main()
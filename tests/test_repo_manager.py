@@ -1,8 +1,15 @@
 """Tests for repository manager."""
 import unittest
+import tempfile
+import shutil
+import threading
+import time
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
-from src.repo_manager import RepositoryManager
+
+import git
+
+from src.repo_manager import RepositoryManager, HostRateLimiter
 from src.proxy_manager import ProxyManager
 
 
@@ -40,6 +47,24 @@ class TestRepositoryManager(unittest.TestCase):
         result = self.repo_manager.get_repo_name(url)
         self.assertEqual(result, 'myrepo')
 
+    def test_canonicalize_url(self):
+        """Test equivalent repository URLs share one canonical form."""
+        expected = 'https://github.com/user/repo'
+        for url in [
+            'https://github.com/user/repo',
+            'https://github.com/user/repo.git',
+            'https://github.com/user/repo/',
+            'https://GITHUB.com/user/repo',
+            'https://token@github.com/user/repo',
+            'git@github.com:user/repo.git',
+        ]:
+            self.assertEqual(self.repo_manager.canonicalize_url(url), expected)
+
+        self.assertNotEqual(
+            self.repo_manager.canonicalize_url('https://github.com/user/Repo'),
+            expected
+        )
+
     @patch('src.repo_manager.git.Repo.clone_from')
     def test_clone_repository_success(self, mock_clone):
         """Test successful repository cloning."""
@@ -75,6 +100,33 @@ class TestRepositoryManager(unittest.TestCase):
         env = call_kwargs['env']
         self.assertEqual(env['http_proxy'], 'http://proxy.example.com:8080')
 
+    @patch('src.repo_manager.git.Repo.clone_from')
+    def test_clone_repository_shallow_by_default(self, mock_clone):
+        """Test that clones are shallow and single-branch by default."""
+        result = self.repo_manager.clone_repository(
+            'https://github.com/user/test-repo.git', Path('/tmp/test-repo')
+        )
+
+        self.assertTrue(result)
+        call_kwargs = mock_clone.call_args[1]
+        self.assertEqual(call_kwargs['depth'], 1)
+        self.assertTrue(call_kwargs['single_branch'])
+        self.assertTrue(call_kwargs['no_tags'])
+
+    @patch('src.repo_manager.git.Repo.clone_from')
+    def test_clone_repository_full_history(self, mock_clone):
+        """Test that a full clone passes no shallow options."""
+        result = self.repo_manager.clone_repository(
+            'https://github.com/user/test-repo.git', Path('/tmp/test-repo'),
+            depth=None, single_branch=False
+        )
+
+        self.assertTrue(result)
+        call_kwargs = mock_clone.call_args[1]
+        self.assertNotIn('depth', call_kwargs)
+        self.assertNotIn('single_branch', call_kwargs)
+        self.assertNotIn('no_tags', call_kwargs)
+
     @patch('src.repo_manager.git.Repo.clone_from')
     def test_clone_repository_failure(self, mock_clone):
         """Test handling of clone failure."""
@@ -88,5 +140,144 @@ class TestRepositoryManager(unittest.TestCase):
         self.assertFalse(result)
 
 
+class TestHostRateLimiter(unittest.TestCase):
+    """Test cases for HostRateLimiter."""
+
+    def _max_concurrency(self, limiter, urls):
+        """Run one short task per URL in parallel and return peak concurrency."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def task(url):
+            nonlocal active, peak
+            with limiter.limit(url):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.05)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=task, args=(url,)) for url in urls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return peak
+
+    def test_limits_same_host(self):
+        """Test concurrent operations on one host never exceed the limit."""
+        limiter = HostRateLimiter(per_host=2)
+        urls = [f'https://github.com/user/repo{i}' for i in range(6)]
+        self.assertLessEqual(self._max_concurrency(limiter, urls), 2)
+
+    def test_hosts_are_independent(self):
+        """Test different hosts do not share slots."""
+        limiter = HostRateLimiter(per_host=1)
+        urls = ['https://github.com/user/a', 'https://gitlab.com/user/b']
+        self.assertEqual(self._max_concurrency(limiter, urls), 2)
+
+
+class TestRepositoryReuse(unittest.TestCase):
+    """Test cases for reusing existing clones."""
+
+    def setUp(self):
+        """Set up a local origin repository and a shallow clone of it."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.origin_path = self.temp_dir / 'origin'
+        self.origin = git.Repo.init(self.origin_path)
+        self._commit('first')
+        self.origin_url = self.origin_path.as_uri()
+
+        self.clone_path = self.temp_dir / 'clone'
+        git.Repo.clone_from(self.origin_url, self.clone_path, depth=1, single_branch=True)
+
+        self.repo_manager = RepositoryManager(ProxyManager())
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _commit(self, content):
+        """Create a commit in the origin repository."""
+        readme = self.origin_path / 'README.md'
+        readme.write_text(content, encoding='utf-8')
+        self.origin.index.add(['README.md'])
+        actor = git.Actor('Test', 'test@example.com')
+        self.origin.index.commit(content, author=actor, committer=actor)
+
+    def test_is_same_remote(self):
+        """Test matching remote URLs, ignoring .git suffix and trailing slash."""
+        self.assertTrue(self.repo_manager.is_same_remote(self.clone_path, self.origin_url))
+        self.assertTrue(self.repo_manager.is_same_remote(self.clone_path, self.origin_url + '/'))
+        self.assertFalse(self.repo_manager.is_same_remote(self.clone_path, 'https://github.com/user/other'))
+
+    def test_is_same_remote_not_a_repository(self):
+        """Test that plain or missing directories are not matched."""
+        plain_dir = self.temp_dir / 'plain'
+        plain_dir.mkdir()
+        self.assertFalse(self.repo_manager.is_same_remote(plain_dir, self.origin_url))
+        self.assertFalse(self.repo_manager.is_same_remote(self.temp_dir / 'missing', self.origin_url))
+
+    def test_update_repository_fetches_latest(self):
+        """Test that updating moves the clone to the latest origin commit."""
+        self._commit('second')
+
+        result = self.repo_manager.update_repository(self.clone_path)
+
+        self.assertTrue(result)
+        self.assertEqual(
+            git.Repo(self.clone_path).head.commit.hexsha,
+            self.origin.head.commit.hexsha
+        )
+
+    def test_get_head_sha(self):
+        """Test reading the checked out commit SHA."""
+        self.assertEqual(
+            self.repo_manager.get_head_sha(self.clone_path),
+            self.origin.head.commit.hexsha
+        )
+        self.assertIsNone(self.repo_manager.get_head_sha(self.temp_dir / 'missing'))
+
+    def test_update_repository_dirty_clone(self):
+        """Test that clones with local changes are not reset."""
+        (self.clone_path / 'README.md').write_text('local change', encoding='utf-8')
+
+        result = self.repo_manager.update_repository(self.clone_path)
+
+        self.assertFalse(result)
+        self.assertEqual((self.clone_path / 'README.md').read_text(encoding='utf-8'), 'local change')
+
+
+    def test_update_repository_keeps_unpushed_commits(self):
+        """Test that a clone with local commits not on origin is not reset."""
+        clone = git.Repo(self.clone_path)
+        (self.clone_path / 'local.txt').write_text('work', encoding='utf-8')
+        clone.index.add(['local.txt'])
+        actor = git.Actor('Test', 'test@example.com')
+        local_commit = clone.index.commit('local work', author=actor, committer=actor)
+        self._commit('second')
+
+        result = self.repo_manager.update_repository(self.clone_path)
+
+        self.assertFalse(result)
+        self.assertEqual(git.Repo(self.clone_path).head.commit, local_commit)
+
+    def test_update_repository_keeps_full_clone_complete(self):
+        """Test that updating a full clone does not make it shallow."""
+        self._commit('second')
+        full_path = self.temp_dir / 'full'
+        git.Repo.clone_from(self.origin_url, full_path)
+        self._commit('third')
+
+        result = self.repo_manager.update_repository(full_path)
+
+        full = git.Repo(full_path)
+        self.assertTrue(result)
+        self.assertEqual(full.git.rev_parse('--is-shallow-repository'), 'false')
+        self.assertEqual(full.git.rev_list('--count', 'HEAD'), '3')
+
+
 if __name__ == '__main__':
     unittest.main()
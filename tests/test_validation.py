@@ -197,6 +197,8 @@ class TestEnvironmentVariableValidation(unittest.TestCase):
             "MY VAR",
             "MY@VAR",
             "MY$VAR",
+            "MY_VAR\n",
+            "VARIAVEL_\u00c9",
         ]
         for name in invalid_names:
             with self.assertRaises(InvalidEnvironmentVariableError):
@@ -245,6 +247,15 @@ class TestExceptionHierarchy(unittest.TestCase):
         self.assertIn("Main message", error_str)
         self.assertIn("Additional details", error_str)
 
+    def test_exception_args_match_message(self):
+        """Test args carry the formatted message so a pickled error prints the same."""
+        import pickle
+        from src.exceptions import DevStartError
+        error = DevStartError("Main message", details="Additional details")
+        self.assertEqual(error.args, (str(error),))
+        self.assertEqual(str(pickle.loads(pickle.dumps(error))), str(error))
+        self.assertEqual(str(DevStartError("Only message")), "Only message")
+
 
 if __name__ == '__main__':
     unittest.main()